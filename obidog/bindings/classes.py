@@ -1,18 +1,26 @@
-import copy
 import os
+from dataclasses import dataclass
 from typing import List, Union, Dict
 
-import obidog.bindings.flavours.sol3 as flavour
+from obidog.bindings.flavours import flavour
 from obidog.bindings.functions import (
     FUNCTION_CAST_TEMPLATE,
-    create_all_default_overloads,
+    generate_default_values_dispatcher,
     get_real_function_name,
+    sort_overloads,
+)
+from obidog.bindings.template import generate_template_specializations
+from obidog.bindings.utils import (
+    BindingsRun,
+    instrument_binding,
+    instrument_constructors,
+    make_register_signature,
+    make_shorthand,
+    strip_include,
 )
-from obidog.bindings.template import generate_template_specialization
-from obidog.bindings.utils import fetch_table, make_shorthand, strip_include
 from obidog.config import SOURCE_DIRECTORIES
 from obidog.logger import log
-from obidog.models.classes import ClassModel
+from obidog.models.classes import AttributeModel, ClassModel
 from obidog.models.functions import (
     FunctionModel,
     FunctionOverloadModel,
@@ -25,10 +33,12 @@ METHOD_CAST_TEMPLATE = (
     "({parameters}) {qualifiers}>({method_address})"
 )
 
-METHOD_WITH_DEFAULT_VALUES_LAMBDA_WRAPPER = "[]({parameters}) -> {return_type} {{ return self->{method_call}({parameters_names}); }}"
-METHOD_WITH_DEFAULT_VALUES_LAMBDA_WRAPPER_AND_PROXY = (
-    "[]({parameters}) -> {return_type} {{ return {method_call}({parameters_names}); }}"
-)
+
+@dataclass
+class InheritedItems:
+    base: str
+    methods: Dict[str, FunctionModel]
+    attributes: Dict[str, AttributeModel]
 
 
 def generate_constructors_definitions(constructors: List[FunctionModel]):
@@ -96,6 +106,10 @@ def generate_method_bindings(
 ):
     if isinstance(method, (FunctionModel, FunctionPatchModel)):
         if force_cast:
+            if method.flags.fast:
+                return flavour.FAST_METHOD.format(
+                    address=cast_method(full_name, method)
+                )
             return cast_method(full_name, method)
         else:
             address = f"&{full_name}::{method_name}"
@@ -105,72 +119,74 @@ def generate_method_bindings(
             if method.flags.as_property:
                 return flavour.PROPERTY.format(address=binding)
             else:
-                definitions = create_all_default_overloads(method)
-                if len(definitions) > 1:
-                    overloads = []
-                    for definition in definitions:
-                        if hasattr(method, "replacement"):
-                            current_overload = METHOD_WITH_DEFAULT_VALUES_LAMBDA_WRAPPER_AND_PROXY.format(
-                                parameters=",".join(
-                                    [parameter.definition for parameter in definition]
-                                ),
-                                return_type=method.return_type,
-                                method_call=method.replacement,
-                                parameters_names=",".join(
-                                    parameter.name for parameter in definition
-                                ),
-                            )
-                        else:
-                            current_overload = (
-                                METHOD_WITH_DEFAULT_VALUES_LAMBDA_WRAPPER.format(
-                                    parameters=",".join(
-                                        [f"{full_name}* self"]
-                                        + [
-                                            parameter.definition
-                                            for parameter in definition
-                                        ]
-                                    ),
-                                    return_type=method.return_type,
-                                    method_call=method_name,
-                                    parameters_names=",".join(
-                                        parameter.name for parameter in definition
-                                    ),
-                                )
-                            )
-                        overloads.append(current_overload)
-                    return flavour.FUNCTION_OVERLOAD.format(
-                        overloads=",".join(overloads)
-                    )
+                if any(parameter.default for parameter in method.parameters):
+                    if method.flags.fast:
+                        log.debug(
+                            f"  Method {full_name}::{method_name} has default parameters, "
+                            "falling back to regular bindings"
+                        )
+                    if hasattr(method, "replacement"):
+                        return generate_default_values_dispatcher(
+                            method.replacement, method
+                        )
+                    else:
+                        return generate_default_values_dispatcher(
+                            f"self->{method_name}", method, [f"{full_name}* self"]
+                        )
+                elif method.flags.fast:
+                    return flavour.FAST_METHOD.format(address=address)
                 else:
                     return binding
     elif isinstance(method, FunctionOverloadModel):
-        casts = [
-            cast_method(full_name, overload)
-            for overload in method.overloads
-            if not overload.template
-        ]
-        if casts:
+        casts = sort_overloads(
+            [
+                (
+                    [parameter.type for parameter in overload.parameters],
+                    cast_method(full_name, overload),
+                )
+                for overload in method.overloads
+                if not overload.template
+            ]
+        )
+        if casts and method.flags.fast:
+            return flavour.FAST_OVERLOAD.format(
+                overloads=", ".join(
+                    flavour.FAST_OVERLOAD_ITEM.format(address=cast) for cast in casts
+                )
+            )
+        elif casts:
             return flavour.FUNCTION_OVERLOAD.format(overloads=", ".join(casts))
 
 
 def generate_templated_method_bindings(
-    body: List[str], full_name: str, lua_name: str, method: FunctionModel
+    bindings_run: BindingsRun,
+    body: List[str],
+    full_name: str,
+    lua_name: str,
+    method: FunctionModel,
 ):
     if method.flags.template_hints:
-        for bind_name, template_hint in method.flags.template_hints.items():
-            if len(template_hint) > 1:
-                raise NotImplementedError()
+        for bind_name, template_hints in method.flags.template_hints.items():
+            specialized_methods = generate_template_specializations(
+                f"{full_name}::{method.name}", method, bind_name, template_hints
+            )
+            if len(specialized_methods) == 1:
+                specialized_method = specialized_methods[0]
             else:
-                specialized_method = generate_template_specialization(
-                    method, bind_name, template_hint[0]
+                specialized_method = FunctionOverloadModel(
+                    bind_name, specialized_methods, flags=specialized_methods[0].flags
                 )
-                body.append(f'bind{lua_name}["{bind_name}"] = ')
-                body.append(
+            body.append(f'bind{lua_name}["{bind_name}"] = ')
+            body.append(
+                instrument_binding(
+                    bindings_run,
+                    f"{full_name}::{bind_name}",
                     generate_method_bindings(
                         full_name, bind_name, specialized_method, True
-                    )
+                    ),
                 )
-                body.append(";")
+            )
+            body.append(";")
 
     else:
         print(
@@ -179,11 +195,17 @@ def generate_templated_method_bindings(
 
 
 def generate_methods_bindings(
-    body: List[str], full_name: str, lua_name: str, methods: Dict[str, FunctionModel]
+    bindings_run: BindingsRun,
+    body: List[str],
+    full_name: str,
+    lua_name: str,
+    methods: Dict[str, FunctionModel],
 ):
     for method in methods.values():
         if isinstance(method, FunctionModel) and method.template:
-            generate_templated_method_bindings(body, full_name, lua_name, method)
+            generate_templated_method_bindings(
+                bindings_run, body, full_name, lua_name, method
+            )
         else:
             bind_name = method.flags.bind_to or method.name
             if bind_name in flavour.TRANSLATION_TABLE:
@@ -196,12 +218,46 @@ def generate_methods_bindings(
                 full_name, method.name, method, method.force_cast
             )
             if method_bindings:
+                if not method.flags.as_property:
+                    method_bindings = instrument_binding(
+                        bindings_run, f"{full_name}::{method.name}", method_bindings
+                    )
                 body.append(f"bind{lua_name}[{bind_name}] = ")
                 body.append(method_bindings)
                 body.append(";")
 
 
-def generate_class_bindings(class_value: ClassModel):
+def generate_attributes_bindings(
+    body: List[str],
+    full_name: str,
+    lua_name: str,
+    attributes: Dict[str, AttributeModel],
+):
+    for attribute in attributes.values():
+        if attribute.flags.nobind:
+            continue
+        attribute_name = attribute.name
+        if attribute.type.endswith("&"):
+            attribute_bind = flavour.PROPERTY_REF.format(
+                class_name=full_name,
+                attribute_name=attribute_name,
+                property_type=attribute.type,
+            )
+        else:
+            if attribute.qualifiers.static:
+                attribute_bind = flavour.STATIC_ATTRIB.format(
+                    name=f"{full_name}::{attribute_name}"
+                )
+            else:
+                attribute_bind = f"&{full_name}::{attribute_name}"
+        body.append(f'bind{lua_name}["{attribute_name}"] = {attribute_bind};')
+
+
+def generate_class_bindings(
+    bindings_run: BindingsRun,
+    class_value: ClassModel,
+    inherited_items: List[InheritedItems] = None,
+):
     full_name = "::".join([class_value.namespace, class_value.name])
     namespace, lua_name = full_name.split("::")[-2::]
     class_value.lua_name = ".".join(full_name.split("::"))
@@ -216,11 +272,13 @@ def generate_class_bindings(class_value: ClassModel):
         )
         if len(constructors_signatures) > 0:
             constructors_signatures_str = ", ".join(
-                [
-                    f"{full_name}({', '.join(ctor)})"
-                    for constructor_signatures in constructors_signatures
-                    for ctor in constructor_signatures
-                ]
+                sort_overloads(
+                    [
+                        (ctor, f"{full_name}({', '.join(ctor)})")
+                        for constructor_signatures in constructors_signatures
+                        for ctor in constructor_signatures
+                    ]
+                )
             )
             constructors_signatures_str = flavour.CONSTRUCTORS.format(
                 constructors=constructors_signatures_str
@@ -228,41 +286,35 @@ def generate_class_bindings(class_value: ClassModel):
         else:
             constructors_signatures_str = flavour.DEFAULT_CONSTRUCTOR
         constructors_signatures_str = (
-            f", {flavour.CALL_CONSTRUCTOR}, " + constructors_signatures_str
+            f", {flavour.CALL_CONSTRUCTOR}, "
+            + instrument_constructors(
+                bindings_run, full_name, constructors_signatures_str
+            )
         )
-    # LATER: Register base class functions for sol3 on derived for optimization
     body = []
     generate_methods_bindings(
+        bindings_run,
         body,
         full_name,
         lua_name,
         class_value.methods,
     )
-    for attribute in class_value.attributes.values():
-        if attribute.flags.nobind:
-            continue
-        attribute_name = attribute.name
-        if attribute.type.endswith("&"):
-            attribute_bind = flavour.PROPERTY_REF.format(
-                class_name=full_name,
-                attribute_name=attribute_name,
-                property_type=attribute.type,
-            )
-        else:
-            if attribute.qualifiers.static:
-                attribute_bind = flavour.STATIC_ATTRIB.format(
-                    name=f"{full_name}::{attribute_name}"
-                )
-            else:
-                attribute_bind = f"&{full_name}::{attribute_name}"
-        body.append(f'bind{lua_name}["{attribute_name}"] = {attribute_bind};')
+    generate_attributes_bindings(body, full_name, lua_name, class_value.attributes)
+    # Inherited items are registered on the derived usertype so sol3 does not
+    # have to walk the base classes on lookup, bases are still needed for casting
+    for inherited in inherited_items or []:
+        generate_methods_bindings(
+            bindings_run, body, inherited.base, lua_name, inherited.methods
+        )
+        generate_attributes_bindings(
+            body, inherited.base, lua_name, inherited.attributes
+        )
 
     class_definition = constructors_signatures_str
     if class_value.bases:
         class_definition += ", " + flavour.BASE_CLASSES.format(
             bases=", ".join(class_value.bases)
         )
-    namespace_access = fetch_table("::".join(full_name.split("::")[:-1])) + "\n"
     class_body = flavour.CLASS_BODY.format(
         cpp_class=f"{class_value.namespace}::{class_value.name}",
         lua_short_name=lua_name,
@@ -280,10 +332,11 @@ def generate_class_bindings(class_value: ClassModel):
     shorthand = ""
     if class_value.flags.bind_to:
         shorthand = make_shorthand(full_name, class_value.flags.bind_to)
-    return namespace_access + class_body
+    return class_body
 
 
-def generate_classes_bindings(classes):
+def generate_classes_bindings(bindings_run: BindingsRun, classes, inherited_items=None):
+    inherited_items = inherited_items or {}
     objects = []
     includes = []
     bindings_functions = []
@@ -304,14 +357,13 @@ def generate_classes_bindings(classes):
         class_path = f"#include <{class_path}>"
         includes.append(class_path)
 
-        state_view = flavour.STATE_VIEW
-        binding_function_signature = (
-            f"void LoadClass{real_class_name}({state_view} state)"
+        binding_function_signature = make_register_signature(
+            f"Class{real_class_name}", class_value.namespace
         )
-        binding_function = (
-            f"{binding_function_signature}\n{{\n"
-            f"{generate_class_bindings(class_value)}\n}}"
+        class_bindings = generate_class_bindings(
+            bindings_run, class_value, inherited_items.get(class_name)
         )
+        binding_function = f"{binding_function_signature}\n{{\n" f"{class_bindings}\n}}"
         if "_fs" in binding_function:
             includes.append("#include <System/Path.hpp>")
         bindings_functions.append(binding_function)
@@ -322,33 +374,117 @@ def generate_classes_bindings(classes):
     }
 
 
-def copy_parent_bases_for_one_class(cpp_db, class_value):
-    inheritance_set = []
-    for base in class_value.bases:
-        if any(base.startswith(f"{src['namespace']}::") for src in SOURCE_DIRECTORIES):
-            inheritance_set.append(base)
-        base_name = base.split("<")[0]
-        if base_name in cpp_db.classes:
-            parent_bases = copy_parent_bases_for_one_class(
-                cpp_db, cpp_db.classes[base_name]
-            )
-            inheritance_set += parent_bases
-    return inheritance_set
+class InheritanceGraph:
+    """Inheritance DAG of all the classes of the database, built once per bindings run
 
+    The linearised ancestors and the merged methods (see `copy_parent_items`)
+    of each class are computed once and reused by all its derived classes
+    """
 
-def copy_parent_bases(cpp_db, classes):
-    for class_value in classes.values():
-        class_value.bases = list(
-            dict.fromkeys(copy_parent_bases_for_one_class(cpp_db, class_value))
-        )
+    def __init__(self, cpp_db):
+        self.classes = cpp_db.classes
+        # Direct bases, copy_parent_bases replaces the bases of the classes with their ancestors
+        self.bases = {
+            class_name: list(class_value.bases)
+            for class_name, class_value in cpp_db.classes.items()
+        }
+        # Own methods, copy_parent_bindings replaces the methods of the classes
+        self.own_methods = {
+            class_name: class_value.methods
+            for class_name, class_value in cpp_db.classes.items()
+        }
+        self.ancestors = {}
+        self.methods = {}
+
+    def get_ancestors(self, class_name: str):
+        """Bases of ÖbEngine classes, depth-first with the closest bases first"""
+        if class_name not in self.ancestors:
+            # Placeholder so an inheritance cycle cannot recurse forever
+            self.ancestors[class_name] = []
+            ancestors = []
+            for base in self.bases[class_name]:
+                if any(
+                    base.startswith(f"{src['namespace']}::")
+                    for src in SOURCE_DIRECTORIES
+                ):
+                    ancestors.append(base)
+                base_name = base.split("<")[0]
+                if base_name in self.bases:
+                    ancestors += self.get_ancestors(base_name)
+            self.ancestors[class_name] = list(dict.fromkeys(ancestors))
+        return self.ancestors[class_name]
+
+    def get_methods(self, class_name: str):
+        """Methods of the class merged with the ones of its direct bases
+        when it has the `copy_parent_items` flag, the first base defining a method wins
+
+        The methods are the FunctionModel of the bases, they are shared and not copied
+        """
+        class_value = self.classes[class_name]
+        if not class_value.flags.copy_parent_items:
+            return class_value.methods
+        if class_name not in self.methods:
+            self.methods[class_name] = class_value.methods
+            methods = class_value.methods
+            for base in self.bases[class_name]:
+                base_name = base.split("<")[0]
+                if base_name in self.classes:
+                    methods = {**self.get_methods(base_name), **methods}
+            self.methods[class_name] = methods
+        return self.methods[class_name]
+
+
+    def is_inherited(self, class_name: str, method_name: str, method):
+        """True if `method` is shared with the base class it comes from"""
+        return self.own_methods[class_name].get(method_name) is not method
+
+    def set_method(self, class_name: str, method_name: str, method):
+        """Replaces a method in the merged methods of a class only"""
+        self.get_methods(class_name)[method_name] = method
+
+
+def copy_parent_bases(inheritance_graph: InheritanceGraph, classes):
+    for class_name, class_value in classes.items():
+        class_value.bases = list(inheritance_graph.get_ancestors(class_name))
 
 
-def copy_parent_bindings(cpp_db, classes):
-    for class_value in classes.values():
+def copy_parent_bindings(inheritance_graph: InheritanceGraph, classes):
+    for class_name, class_value in classes.items():
         if class_value.flags.copy_parent_items:
-            for base in class_value.bases:
-                non_template_name = base.split("<")[0]
-                base_value = cpp_db.classes[non_template_name]
-                base_methods = copy.deepcopy(base_value.methods)
-                base_methods.update(class_value.methods)
-                class_value.methods = base_methods
+            class_value.methods = inheritance_graph.get_methods(class_name)
+
+
+def collect_inherited_items(cpp_db, class_value):
+    """This method collects the methods and attributes a class inherits without overriding them
+    Closest bases come first so an item is taken from the first base that defines it
+    """
+    known_methods = set(class_value.methods)
+    known_attributes = set(class_value.attributes)
+    inherited_items = []
+    for base in class_value.bases:
+        base_value = cpp_db.classes.get(base.split("<")[0])
+        if base_value is None or base_value.flags.nobind:
+            continue
+        methods = {
+            method_name: method
+            for method_name, method in base_value.methods.items()
+            if method_name not in known_methods
+        }
+        attributes = {
+            attribute_name: attribute
+            for attribute_name, attribute in base_value.attributes.items()
+            if attribute_name not in known_attributes
+        }
+        known_methods.update(methods)
+        known_attributes.update(attributes)
+        if methods or attributes:
+            inherited_items.append(InheritedItems(base, methods, attributes))
+    return inherited_items
+
+
+def flatten_parent_bindings(cpp_db, classes):
+    return {
+        class_name: collect_inherited_items(cpp_db, class_value)
+        for class_name, class_value in classes.items()
+        if not class_value.flags.noflatten
+    }
@@ -1,8 +1,8 @@
 import os
 from typing import List
 
-import obidog.bindings.flavours.sol3 as flavour
-from obidog.bindings.utils import fetch_table, strip_include
+from obidog.bindings.flavours import flavour
+from obidog.bindings.utils import make_register_signature, strip_include
 from obidog.logger import log
 from obidog.models.enums import EnumModel
 from obidog.utils.string_utils import format_name
@@ -23,11 +23,11 @@ def generate_enums_bindings(name: str, enums: List[EnumModel]):
         log.info(f"  Generating bindings for enum {enum_name}")
         enum_path = strip_include(enum.location.file).replace(os.path.sep, "/")
         includes.append(f"#include <{enum_path}>")
-        state_view = flavour.STATE_VIEW
         export_name = format_name(enum.name)
-        binding_function_signature = f"void LoadEnum{export_name}({state_view} state)"
-        table_access = fetch_table(name) + "\n"
-        binding_function_body = table_access + flavour.ENUM_BODY.format(
+        binding_function_signature = make_register_signature(
+            f"Enum{export_name}", name
+        )
+        binding_function_body = flavour.ENUM_BODY.format(
             namespace=name.split("::")[-1],
             enum_type=enum_name,
             enum_name=enum.name,
@@ -0,0 +1,5 @@
+import importlib
+
+from obidog.config import BINDINGS_FLAVOUR
+
+flavour = importlib.import_module(f"obidog.bindings.flavours.{BINDINGS_FLAVOUR}")
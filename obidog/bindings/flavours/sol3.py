@@ -1,5 +1,7 @@
 STATE_VIEW = "sol::state_view"
 INCLUDE_FILE = "sol/sol.hpp"
+BINDINGS_INCLUDES = []
+PROFILING = False
 CALL_CONSTRUCTOR = "sol::call_constructor"
 CLASS_BODY = """
 sol::usertype<{cpp_class}> bind{lua_short_name} = {namespace}Namespace.new_usertype<{cpp_class}>(
@@ -19,6 +21,9 @@ CONSTRUCTORS = "sol::constructors<{constructors}>()"
 BASE_CLASSES = "sol::base_classes, sol::bases<{bases}>()"
 SCRIPT_FILE = 'state.script_file("{source}"_fs);'
 METHOD = "{address}"
+FAST_METHOD = "sol::c_call<decltype({address}), {address}>"
+FAST_OVERLOAD = "sol::c_call<{overloads}>"
+FAST_OVERLOAD_ITEM = "sol::wrap<decltype({address}), {address}>"
 # LATER: Add missing elements, even the ones not in sol::meta_function
 TRANSLATION_TABLE = {
     "operator+": "sol::meta_function::addition",
@@ -41,6 +46,10 @@ sol::table {namespace}Namespace = state{namespace_path}.get<sol::table>();
 """.strip(
     "\n"
 )
+REGISTER_FUNCTION_SIGNATURE = (
+    "void Register{bindings}({state_view} state, sol::table& {namespace}Namespace)"
+)
+REGISTER_CALL = "Register{bindings}(state, {namespace}Namespace);"
 ENUM_BODY = """
 {namespace}Namespace.new_enum<{enum_type}>("{enum_name}", {enum_fields});
 """.strip(
@@ -52,6 +61,8 @@ FUNCTION_BODY = """
     "\n"
 )
 FUNCTION_OVERLOAD = "sol::overload({overloads})"
+VARIADIC_ARGS = "sol::variadic_args"
+VARIADIC_ARG = "{args}.get<{type}>({index})"
 GLOBAL_BODY = """
 {namespace}Namespace["{global_name}"] = {global_ptr};
 """.strip(
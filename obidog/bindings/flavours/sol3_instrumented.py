@@ -0,0 +1,196 @@
+from obidog.bindings.flavours.sol3 import *
+
+BINDINGS_INCLUDES = ["#include <Bindings/Profiling.hpp>"]
+PROFILING = True
+PROFILING_HEADER_FILE = "Bindings/Profiling.hpp"
+PROFILING_MACRO = "OBE_BINDINGS_PROFILING"
+INSTRUMENTED_BINDING = "obe::Bindings::Profiling::instrument<{binding_id}>({binding})"
+INSTRUMENTED_CONSTRUCTORS = "obe::Bindings::Profiling::instrumentConstructors<{binding_id}, {class_name}>({constructors})"
+# sol::c_call can't be wrapped, fast methods go through the regular path to be measured
+FAST_METHOD = "{address}"
+FAST_OVERLOAD = "sol::overload({overloads})"
+FAST_OVERLOAD_ITEM = "{address}"
+PROFILING_HEADER = """
+#pragma once
+
+#include <chrono>
+#include <cstddef>
+#include <cstdint>
+#include <new>
+#include <tuple>
+#include <utility>
+
+#include <sol/sol.hpp>
+
+namespace obe::Bindings
+{{
+void DumpBindingsProfile();
+}};
+
+namespace obe::Bindings::Profiling
+{{
+struct BindingProfile
+{{
+    std::uint64_t calls = 0;
+    std::chrono::nanoseconds time {{ 0 }};
+}};
+
+BindingProfile& getBindingProfile(std::size_t id);
+
+#if defined({profiling_macro})
+class ScopedBindingProfile
+{{
+private:
+    BindingProfile& m_profile;
+    std::chrono::steady_clock::time_point m_start;
+
+public:
+    explicit ScopedBindingProfile(std::size_t id)
+        : m_profile(getBindingProfile(id))
+        , m_start(std::chrono::steady_clock::now())
+    {{
+        m_profile.calls++;
+    }}
+    ~ScopedBindingProfile()
+    {{
+        m_profile.time += std::chrono::steady_clock::now() - m_start;
+    }}
+}};
+
+template <std::size_t Id, class R, class... Args>
+auto instrument(R (*function)(Args...))
+{{
+    return [function](Args... args) -> R {{
+        ScopedBindingProfile profile(Id);
+        return function(std::forward<Args>(args)...);
+    }};
+}}
+
+template <std::size_t Id, class R, class C, class... Args>
+auto instrument(R (C::*method)(Args...))
+{{
+    return [method](C& self, Args... args) -> R {{
+        ScopedBindingProfile profile(Id);
+        return (self.*method)(std::forward<Args>(args)...);
+    }};
+}}
+
+template <std::size_t Id, class R, class C, class... Args>
+auto instrument(R (C::*method)(Args...) const)
+{{
+    return [method](const C& self, Args... args) -> R {{
+        ScopedBindingProfile profile(Id);
+        return (self.*method)(std::forward<Args>(args)...);
+    }};
+}}
+
+template <std::size_t Id, class F, class R, class... Args>
+auto instrumentFunctor(F functor, R (F::*)(Args...) const)
+{{
+    return [functor](Args... args) -> R {{
+        ScopedBindingProfile profile(Id);
+        return functor(std::forward<Args>(args)...);
+    }};
+}}
+
+template <std::size_t Id, class F>
+auto instrument(F functor) -> decltype(instrumentFunctor<Id>(functor, &F::operator()))
+{{
+    return instrumentFunctor<Id>(functor, &F::operator());
+}}
+
+template <std::size_t Id, class... Functions>
+auto instrument(sol::overload_set<Functions...> overloads)
+{{
+    return std::apply(
+        [](auto&&... functions) {{ return sol::overload(instrument<Id>(functions)...); }},
+        overloads.functions);
+}}
+
+template <class Signature> struct ConstructorArguments;
+template <class T, class... Args> struct ConstructorArguments<T(Args...)>
+{{
+    using type = sol::types<Args...>;
+}};
+template <class... Args> struct ConstructorArguments<sol::types<Args...>>
+{{
+    using type = sol::types<Args...>;
+}};
+
+template <std::size_t Id, class T, class... Args>
+auto instrumentConstructor(sol::types<Args...>)
+{{
+    return [](T* memory, Args... args) {{
+        ScopedBindingProfile profile(Id);
+        new (memory) T(std::forward<Args>(args)...);
+    }};
+}}
+
+template <std::size_t Id, class T, class... Signatures>
+auto instrumentConstructors(sol::constructor_list<Signatures...>)
+{{
+    return sol::initializers(instrumentConstructor<Id, T>(
+        typename ConstructorArguments<Signatures>::type {{}})...);
+}}
+#else
+template <std::size_t Id, class F> constexpr F instrument(F function)
+{{
+    return function;
+}}
+
+template <std::size_t Id, class T, class Constructors>
+constexpr Constructors instrumentConstructors(Constructors constructors)
+{{
+    return constructors;
+}}
+#endif
+}};
+""".strip(
+    "\n"
+)
+PROFILING_INDEX = """
+#include <algorithm>
+#include <array>
+#include <iostream>
+#include <numeric>
+#include <Bindings/Profiling.hpp>
+namespace obe::Bindings::Profiling
+{{
+static const std::array<const char*, {bindings_count}> BindingsNames = {{
+{bindings_names}
+}};
+static std::array<BindingProfile, {bindings_count}> BindingsProfiles;
+
+BindingProfile& getBindingProfile(std::size_t id)
+{{
+    return BindingsProfiles[id];
+}}
+}};
+namespace obe::Bindings
+{{
+void DumpBindingsProfile()
+{{
+#if !defined({profiling_macro})
+    std::cout << "Bindings profiling is disabled, define {profiling_macro} to enable it" << std::endl;
+#endif
+    std::array<std::size_t, {bindings_count}> order;
+    std::iota(order.begin(), order.end(), 0);
+    std::sort(order.begin(), order.end(), [](std::size_t left, std::size_t right) {{
+        return Profiling::BindingsProfiles[left].time > Profiling::BindingsProfiles[right].time;
+    }});
+    for (const std::size_t id : order)
+    {{
+        const Profiling::BindingProfile& profile = Profiling::BindingsProfiles[id];
+        if (profile.calls == 0)
+        {{
+            continue;
+        }}
+        std::cout << Profiling::BindingsNames[id] << " : " << profile.calls << " calls, "
+                  << std::chrono::duration_cast<std::chrono::microseconds>(profile.time).count()
+                  << "us" << std::endl;
+    }}
+}}
+}};
+""".strip(
+    "\n"
+)
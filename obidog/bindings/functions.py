@@ -2,9 +2,15 @@ import os
 from dataclasses import dataclass
 from typing import List, Union
 
-import obidog.bindings.flavours.sol3 as flavour
-from obidog.bindings.template import generate_template_specialization
-from obidog.bindings.utils import fetch_table, strip_include, get_include_file
+from obidog.bindings.flavours import flavour
+from obidog.bindings.template import generate_template_specializations
+from obidog.bindings.utils import (
+    BindingsRun,
+    get_include_file,
+    instrument_binding,
+    make_register_signature,
+    strip_include,
+)
 from obidog.logger import log
 from obidog.models.functions import FunctionModel, FunctionOverloadModel
 from obidog.utils.string_utils import clean_capitalize, format_name
@@ -14,6 +20,37 @@ FUNCTION_CAST_TEMPLATE = (
 )
 
 FUNCTION_WITH_DEFAULT_VALUES_LAMBDA_WRAPPER = "[]({parameters}) -> {return_type} {{ return {function_call}({parameters_names}); }}"
+DEFAULT_VALUES_DISPATCHER = "[]({parameters}) -> {return_type} {{ switch ({optional_args}.size()) {{ {cases} }} }}"
+DEFAULT_VALUES_DISPATCHER_CASE = "case {index}: return {function_call}({parameters_names});"
+DEFAULT_VALUES_DISPATCHER_DEFAULT = "default: return {function_call}({parameters_names});"
+DEFAULT_VALUES_OPTIONAL_ARGS = "optional_args"
+
+# Lower values are checked first by the overload resolution, a type that accepts
+# many Lua values (sol::object, std::string, ...) should never shadow a stricter one
+TYPE_SPECIFICITY = {
+    "bool": 1,
+    "char": 2,
+    "short": 2,
+    "int": 2,
+    "long": 2,
+    "unsigned": 2,
+    "unsigned int": 2,
+    "float": 2,
+    "double": 2,
+    "std::size_t": 2,
+    "std::string": 3,
+    "std::string_view": 3,
+    "std::vector": 4,
+    "std::map": 4,
+    "std::unordered_map": 4,
+    "std::pair": 4,
+    "std::tuple": 4,
+    "std::optional": 5,
+    "std::variant": 5,
+    "std::any": 5,
+    "std::function": 5,
+}
+GENERIC_TYPE_SPECIFICITY = 5
 
 
 def normalize_cpp_type(cpp_type):
@@ -114,6 +151,39 @@ def get_real_function_name(
 class DefaultOverloadModel:
     definition: str
     name: str
+    type: str
+
+
+def get_type_specificity(cpp_type: str) -> int:
+    base_type = cpp_type.split("<")[0]
+    base_type = " ".join(
+        elem
+        for elem in base_type.replace("&", " ").replace("*", " ").split()
+        if elem not in ["const", "volatile"]
+    )
+    if base_type.startswith("sol::"):
+        return GENERIC_TYPE_SPECIFICITY
+    # User types are checked against their metatable and never match by accident
+    return TYPE_SPECIFICITY.get(base_type, 0)
+
+
+def overload_sort_key(parameters_types: List[str]):
+    return (
+        len(parameters_types),
+        [get_type_specificity(parameter_type) for parameter_type in parameters_types],
+    )
+
+
+def sort_overloads(overloads):
+    """Sorts (parameters types, binding) pairs by arity then by type specificity
+    Sorting is stable so overloads with the same signature shape keep their declaration order
+    """
+    return [
+        binding
+        for _, binding in sorted(
+            overloads, key=lambda overload: overload_sort_key(overload[0])
+        )
+    ]
 
 
 def create_all_default_overloads(function: FunctionModel) -> List[DefaultOverloadModel]:
@@ -124,7 +194,9 @@ def create_all_default_overloads(function: FunctionModel) -> List[DefaultOverloa
             break
         static_part_index += 1
     static_part = [
-        DefaultOverloadModel(f"{parameter.type} {parameter.name}", parameter.name)
+        DefaultOverloadModel(
+            f"{parameter.type} {parameter.name}", parameter.name, parameter.type
+        )
         for parameter in function.parameters[0:static_part_index]
     ]
     function_definitions.append(static_part)
@@ -133,7 +205,9 @@ def create_all_default_overloads(function: FunctionModel) -> List[DefaultOverloa
             static_part
             + [
                 DefaultOverloadModel(
-                    f"{parameter.type} {parameter.name}", parameter.name
+                    f"{parameter.type} {parameter.name}",
+                    parameter.name,
+                    parameter.type,
                 )
                 for parameter in function.parameters[static_part_index : i + 1]
             ]
@@ -151,20 +225,70 @@ def generate_function_definitions(function_name: str, function: FunctionModel):
     overloads = []
     for function_definition in function_definitions:
         overloads.append(
-            FUNCTION_WITH_DEFAULT_VALUES_LAMBDA_WRAPPER.format(
-                parameters=",".join(
-                    parameter.definition for parameter in function_definition
-                ),
-                return_type=function.return_type,
-                function_call=function_name,
-                parameters_names=",".join(
-                    parameter.name for parameter in function_definition
+            (
+                [parameter.type for parameter in function_definition],
+                FUNCTION_WITH_DEFAULT_VALUES_LAMBDA_WRAPPER.format(
+                    parameters=",".join(
+                        parameter.definition for parameter in function_definition
+                    ),
+                    return_type=function.return_type,
+                    function_call=function_name,
+                    parameters_names=",".join(
+                        parameter.name for parameter in function_definition
+                    ),
                 ),
             )
         )
     return overloads
 
 
+def generate_default_values_dispatcher(
+    function_call: str, function: FunctionModel, prefix_parameters: List[str] = None
+):
+    """This function generates a single wrapper for a function with default parameters
+    Instead of one wrapper per amount of parameters, the wrapper takes the optional
+    parameters as variadic arguments and switches on their count
+    """
+    static_part_index = 0
+    for parameter in function.parameters:
+        if parameter.default:
+            break
+        static_part_index += 1
+    mandatory_parameters = function.parameters[0:static_part_index]
+    optional_parameters = function.parameters[static_part_index:]
+    parameters = (
+        (prefix_parameters or [])
+        + [f"{parameter.type} {parameter.name}" for parameter in mandatory_parameters]
+        + [f"{flavour.VARIADIC_ARGS} {DEFAULT_VALUES_OPTIONAL_ARGS}"]
+    )
+    arguments = [parameter.name for parameter in mandatory_parameters]
+    cases = []
+    for index, parameter in enumerate(optional_parameters):
+        cases.append(
+            DEFAULT_VALUES_DISPATCHER_CASE.format(
+                index=index,
+                function_call=function_call,
+                parameters_names=",".join(arguments),
+            )
+        )
+        arguments = arguments + [
+            flavour.VARIADIC_ARG.format(
+                args=DEFAULT_VALUES_OPTIONAL_ARGS, type=parameter.type, index=index
+            )
+        ]
+    cases.append(
+        DEFAULT_VALUES_DISPATCHER_DEFAULT.format(
+            function_call=function_call, parameters_names=",".join(arguments)
+        )
+    )
+    return DEFAULT_VALUES_DISPATCHER.format(
+        parameters=",".join(parameters),
+        return_type=function.return_type,
+        optional_args=DEFAULT_VALUES_OPTIONAL_ARGS,
+        cases=" ".join(cases),
+    )
+
+
 def get_overload_static_cast(function_name: str, function_value: FunctionModel):
     return FUNCTION_CAST_TEMPLATE.format(
         return_type=function_value.return_type,
@@ -180,7 +304,9 @@ def get_overload_static_cast(function_name: str, function_value: FunctionModel):
 
 
 def generate_function_bindings(
-    function_name: str, function_value: Union[FunctionModel, FunctionOverloadModel]
+    bindings_run: BindingsRun,
+    function_name: str,
+    function_value: Union[FunctionModel, FunctionOverloadModel],
 ):
     namespace_splitted = function_name.split("::")[:-1]
     function_ptr = function_name
@@ -197,55 +323,54 @@ def generate_function_bindings(
                     new_name = (
                         "::".join(function_name.split("::")[:-1]) + "::" + bind_name
                     )
-                if len(template_hints) == 1:
-                    new_func = generate_template_specialization(
-                        function_value, bind_name, template_hints[0]
+                overloads = generate_template_specializations(
+                    function_name, function_value, bind_name, template_hints
+                )
+                if len(overloads) == 1:
+                    full_body += generate_function_bindings(
+                        bindings_run, new_name, overloads[0]
                     )
-                    full_body += generate_function_bindings(new_name, new_func)
                 else:
-                    overloads = [
-                        generate_template_specialization(
-                            function_value, bind_name, template_hint
-                        )
-                        for template_hint in template_hints
-                    ]
                     funcs = FunctionOverloadModel(new_name, overloads)
-                    full_body += generate_function_bindings(new_name, funcs)
+                    full_body += generate_function_bindings(
+                        bindings_run, new_name, funcs
+                    )
             return full_body
         else:
             print(f"[WARNING] No template hints found for function {function_name}")
             return ""
     if isinstance(function_value, FunctionOverloadModel):
         function_list = function_value.overloads
+    elif any(parameter.default for parameter in function_value.parameters):
+        function_ptr = generate_default_values_dispatcher(function_name, function_value)
     all_overloads = []
     for function_overload in function_list:
         if any(parameter.default for parameter in function_overload.parameters):
             all_overloads += generate_function_definitions(
-                function_name, function_value
+                function_name, function_overload
             )
         else:
-            all_overloads += [
-                get_overload_static_cast(function_name, function_overload)
-            ]
+            all_overloads.append(
+                (
+                    [parameter.type for parameter in function_overload.parameters],
+                    get_overload_static_cast(function_name, function_overload),
+                )
+            )
     if all_overloads:
         function_ptr = flavour.FUNCTION_OVERLOAD.format(
-            overloads=",".join(all_overloads)
+            overloads=",".join(sort_overloads(all_overloads))
         )
 
-    binding_body = (
-        fetch_table("::".join(namespace_splitted))
-        + "\n"
-        + flavour.FUNCTION_BODY.format(
-            namespace=namespace_splitted[-1],
-            function_name=function_value.name,
-            function_ptr=function_ptr,
-        )
+    binding_body = flavour.FUNCTION_BODY.format(
+        namespace=namespace_splitted[-1],
+        function_name=function_value.name,
+        function_ptr=instrument_binding(bindings_run, function_name, function_ptr),
     )
     return f"{binding_body}"
 
 
 # LATER: Catch operator function and assign them to correct classes metafunctions
-def generate_functions_bindings(functions):
+def generate_functions_bindings(bindings_run: BindingsRun, functions):
     objects = []
     includes = []
     bindings_functions = []
@@ -274,15 +399,15 @@ def generate_functions_bindings(functions):
         else:
             includes.append(get_include_file(function_value))
 
-        state_view = flavour.STATE_VIEW
-        binding_function_signature = (
-            f"void LoadFunction{real_function_name}({state_view} state)"
+        binding_function_signature = make_register_signature(
+            f"{func_type}{real_function_name}",
+            "::".join(function_name.split("::")[:-1]),
         )
 
-        binding_function = (
-            f"{binding_function_signature}\n{{\n"
-            f"{generate_function_bindings(function_name, function_value)}}}"
+        function_bindings = generate_function_bindings(
+            bindings_run, function_name, function_value
         )
+        binding_function = f"{binding_function_signature}\n{{\n{function_bindings}}}"
         bindings_functions.append(binding_function)
     return {
         "includes": includes,
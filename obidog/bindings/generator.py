@@ -1,34 +1,52 @@
+import copy
+import json
 import os
-import re
 from collections import defaultdict
 
 import inflection
 
+from obidog import config
 from obidog.bindings.classes import (
+    InheritanceGraph,
     copy_parent_bases,
     copy_parent_bindings,
+    flatten_parent_bindings,
     generate_classes_bindings,
 )
 from obidog.bindings.enums import generate_enums_bindings
-from obidog.bindings.flavours import sol3 as flavour
+from obidog.bindings.flavours import flavour
 from obidog.bindings.functions import generate_functions_bindings
+from obidog.bindings.includes import (
+    count_included_lines,
+    find_common_includes,
+    get_included_path,
+    make_include_closures,
+    minimize_includes,
+)
 from obidog.bindings.globals import generate_globals_bindings
-from obidog.bindings.utils import strip_include
+from obidog.bindings.locations import (
+    dump_bindings_locations,
+    find_bindings_locations,
+    update_bindings_locations,
+)
+from obidog.bindings.utils import BindingsRun, fetch_table, make_register_call
 from obidog.config import (
     BINDINGS_CONFIG_FILE,
     BINDINGS_HEADERS_LOCATION,
+    BINDINGS_LOCATIONS_MANIFEST,
+    BINDINGS_PCH_FILE,
+    BINDINGS_PCH_MANIFEST,
     BINDINGS_SOURCES_LOCATION,
-    PATH_TO_OBENGINE,
     SOURCE_DIRECTORIES,
 )
 from obidog.databases import CppDatabase
 from obidog.logger import log
 from obidog.models.functions import PlaceholderFunctionModel
 from obidog.parsers.utils.cpp_utils import parse_definition
+from obidog.utils.namespace_utils import group_items_by_namespace
 from obidog.utils.string_utils import clean_capitalize
 from obidog.wrappers.clangformat_wrapper import clang_format_files
 
-GENERATE_BINDINGS = False
 BINDINGS_INCLUDE_TEMPLATE = """
 #pragma once
 
@@ -42,12 +60,11 @@ namespace {namespace}
 )
 
 BINDINGS_SRC_TEMPLATE = """
+#include <{bindings_pch_file}>
 #include <{bindings_header}>
 
 {includes}
 
-#include <{bindings_config_file}>
-
 namespace {namespace}
 {{
 {bindings_functions}
@@ -56,88 +73,207 @@ namespace {namespace}
     "\n"
 )
 
-OUTPUT_DIRECTORY = os.environ.get("OBENGINE_BINDINGS_OUTPUT", PATH_TO_OBENGINE)
+BINDINGS_PCH_TEMPLATE = """
+#pragma once
+
+{includes}
+""".strip(
+    "\n"
+)
+
+BINDINGS_LOADER_TEMPLATE = """
+void Load{bindings}({state_view} state)
+{{
+{namespace_access}
+{register_calls}
+}}
+""".strip(
+    "\n"
+)
+NAMESPACE_LOADER = "Namespace"
+
+
+def get_output_directory():
+    """Bindings are written in the ÖbEngine repository unless OBENGINE_BINDINGS_OUTPUT is set
+    Read when the bindings are generated, the managed checkout is only known at that point
+    """
+    return os.environ.get("OBENGINE_BINDINGS_OUTPUT", config.PATH_TO_OBENGINE)
 
 
 def group_bindings_by_namespace(cpp_db):
     group_by_namespace = defaultdict(CppDatabase)
-    for item_type in [
-        "classes",
-        "enums",
-        "functions",
-        "globals",
-        "typedefs",
-    ]:
-        for item_name, item_value in getattr(cpp_db, item_type).items():
-            strip_template = item_name.split("<")[0]
-            last_namespace = "::".join(strip_template.split("::")[:-1:])
-            if last_namespace in cpp_db.namespaces:
-                getattr(group_by_namespace[last_namespace], item_type)[
-                    item_name
-                ] = item_value
-    for namespace_name, namespace in group_by_namespace.items():
+    for namespace_name, namespace_node in group_items_by_namespace(
+        cpp_db
+    ).nodes.items():
+        namespace = group_by_namespace[namespace_name]
+        for item_type, items in namespace_node.items.items():
+            setattr(namespace, item_type, items)
         namespace.namespaces = cpp_db.namespaces[namespace_name]
     return group_by_namespace
 
 
-def make_bindings_header(path, namespace, objects):
-    inc_out = os.path.join(OUTPUT_DIRECTORY, "include", "Core", path)
+def write_bindings_file(bindings_run: BindingsRun, path, content):
+    """Writes a generated file (path relative to the output directory) and queues it for clang-format
+    Nothing is written if the previous run already generated the same content
+    """
+    bindings_run.files[path] = content
+    if not bindings_run.write_files:
+        return False
+    output_path = os.path.join(get_output_directory(), path)
+    if bindings_run.previous_files.get(path) == content and os.path.isfile(
+        output_path
+    ):
+        return False
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    with open(output_path, "w") as output_file:
+        output_file.write(content)
+    bindings_run.files_to_format.append(path)
+    return True
+
+
+def make_bindings_header(bindings_run: BindingsRun, path, namespace, objects):
     state_view = flavour.STATE_VIEW
     bindings_functions = [
         f"void Load{object_name['bindings']}({state_view} state);"
         for object_name in objects
+    ] + [f"void Load{NAMESPACE_LOADER}({state_view} state);"]
+    write_bindings_file(
+        bindings_run,
+        f"{BINDINGS_HEADERS_LOCATION}/{path}",
+        BINDINGS_INCLUDE_TEMPLATE.format(
+            namespace=f"{namespace}::Bindings",
+            bindings_functions_signatures="\n".join(
+                f"{binding_function}" for binding_function in bindings_functions
+            ),
+            state_view_forward_decl_ns="::".join(state_view.split("::")[:-1:]),
+            state_view_forward_decl_cls=state_view.split("::")[-1],
+        ),
+    )
+
+
+def make_bindings_loaders(namespace, objects):
+    """Generates the functions that fetch the namespace table and register objects in it
+    The namespace loader fetches the table once for all objects, the per-object loaders
+    are only kept as thin wrappers for compatibility
+    """
+    namespace_access = fetch_table(namespace)
+    loaders = [
+        BINDINGS_LOADER_TEMPLATE.format(
+            bindings=generated_object["bindings"],
+            state_view=flavour.STATE_VIEW,
+            namespace_access=namespace_access,
+            register_calls=make_register_call(generated_object["bindings"], namespace),
+        )
+        for generated_object in objects
     ]
-    with open(inc_out, "w") as class_binding:
-        class_binding.write(
-            BINDINGS_INCLUDE_TEMPLATE.format(
-                namespace=f"{namespace}::Bindings",
-                bindings_functions_signatures="\n".join(
-                    f"{binding_function}" for binding_function in bindings_functions
-                ),
-                state_view_forward_decl_ns="::".join(state_view.split("::")[:-1:]),
-                state_view_forward_decl_cls=state_view.split("::")[-1],
-            )
+    loaders.append(
+        BINDINGS_LOADER_TEMPLATE.format(
+            bindings=NAMESPACE_LOADER,
+            state_view=flavour.STATE_VIEW,
+            namespace_access=namespace_access,
+            register_calls="\n".join(
+                make_register_call(generated_object["bindings"], namespace)
+                for generated_object in objects
+            ),
         )
+    )
+    return loaders
 
 
-def make_bindings_sources(namespace, path, bindings_header, *datasets):
-    src_out = os.path.join(OUTPUT_DIRECTORY, "src", "Core", path)
-    with open(src_out, "w") as bindings_source:
-        all_includes = set(
+def collect_bindings_includes(path, datasets, include_closures=None):
+    all_includes = list(
+        set(
             includes
             for data in datasets
             for includes in data["includes"]
             if not includes.endswith(".cpp")
         )
-        all_functions = [
-            functions for data in datasets for functions in data["bindings_functions"]
-        ]
-        bindings_source.write(
-            BINDINGS_SRC_TEMPLATE.format(
-                bindings_header=bindings_header,
-                bindings_config_file=BINDINGS_CONFIG_FILE,
-                namespace=f"{namespace}::Bindings",
-                includes="\n".join(all_includes),
-                bindings_functions="\n".join(all_functions),
+    )
+    if include_closures:
+        all_includes, dropped_includes = minimize_includes(
+            all_includes, include_closures
+        )
+        if dropped_includes:
+            saved_lines = count_included_lines(
+                dropped_includes, include_closures, own_lines_only=True
             )
+            total_lines = count_included_lines(all_includes, include_closures)
+            log.info(
+                f"  Dropped {len(dropped_includes)} redundant includes from {path} "
+                f"(~{saved_lines} preprocessed lines saved, ~{total_lines} left)"
+            )
+    return all_includes
+
+
+def make_bindings_sources(
+    bindings_run: BindingsRun,
+    namespace,
+    path,
+    bindings_header,
+    objects,
+    includes,
+    *datasets,
+):
+    all_functions = [
+        functions for data in datasets for functions in data["bindings_functions"]
+    ] + make_bindings_loaders(namespace, objects)
+    source = BINDINGS_SRC_TEMPLATE.format(
+        bindings_pch_file=BINDINGS_PCH_FILE,
+        bindings_header=bindings_header,
+        namespace=f"{namespace}::Bindings",
+        includes="\n".join(includes),
+        bindings_functions="\n".join(all_functions),
+    )
+    write_bindings_file(bindings_run, f"{BINDINGS_SOURCES_LOCATION}/{path}", source)
+    return source
+
+
+def make_bindings_pch(
+    bindings_run: BindingsRun, precompiled_includes, generated_objects
+):
+    pch_header = f"{BINDINGS_HEADERS_LOCATION}/{BINDINGS_PCH_FILE}"
+    write_bindings_file(
+        bindings_run,
+        pch_header,
+        BINDINGS_PCH_TEMPLATE.format(includes="\n".join(precompiled_includes)),
+    )
+    pch_manifest = os.path.join(
+        get_output_directory(), BINDINGS_HEADERS_LOCATION, BINDINGS_PCH_MANIFEST
+    )
+    with open(pch_manifest, "w") as manifest:
+        json.dump(
+            {
+                "header": pch_header,
+                "includes": [
+                    get_included_path(include) for include in precompiled_includes
+                ],
+                "sources": [
+                    f"{BINDINGS_SOURCES_LOCATION}/{objects['source']}"
+                    for objects in generated_objects.values()
+                ]
+                + [f"{BINDINGS_SOURCES_LOCATION}/Bindings/index.cpp"],
+            },
+            manifest,
+            indent=4,
         )
 
 
-FILES_TO_FORMAT = []
-
-
-def generate_bindings_for_namespace(name, namespace):
+def generate_bindings_for_namespace(
+    bindings_run: BindingsRun,
+    name,
+    namespace,
+    inherited_items=None,
+    include_closures=None,
+):
     log.info(f"Generating bindings for namespace {name}")
     split_name = "/".join(name.split("::"))
     base_path = f"Bindings/{split_name}"
-    os.makedirs(
-        os.path.join(OUTPUT_DIRECTORY, "include", "Core", base_path), exist_ok=True
-    )
-    os.makedirs(os.path.join(OUTPUT_DIRECTORY, "src", "Core", base_path), exist_ok=True)
 
-    class_bindings = generate_classes_bindings(namespace.classes)
+    class_bindings = generate_classes_bindings(
+        bindings_run, namespace.classes, inherited_items
+    )
     enum_bindings = generate_enums_bindings(name, namespace.enums)
-    functions_bindings = generate_functions_bindings(namespace.functions)
+    functions_bindings = generate_functions_bindings(bindings_run, namespace.functions)
     globals_bindings = generate_globals_bindings(name, namespace.globals)
 
     generated_objects = (
@@ -150,123 +286,157 @@ def generate_bindings_for_namespace(name, namespace):
     bindings_header = os.path.join(base_path, f"{name.split('::')[-1]}.hpp").replace(
         os.path.sep, "/"
     )
-    if GENERATE_BINDINGS:
-        make_bindings_header(bindings_header, name, generated_objects)
+    make_bindings_header(bindings_run, bindings_header, name, generated_objects)
     namespace_data = {
-        "includes": namespace.namespaces.flags.additional_includes
-        if namespace.namespaces.flags.additional_includes
-        else [],
+        "includes": (
+            namespace.namespaces.flags.additional_includes
+            if namespace.namespaces.flags.additional_includes
+            else []
+        )
+        + flavour.BINDINGS_INCLUDES,
         "bindings_functions": [],
     }
     bindings_source = os.path.join(base_path, f"{name.split('::')[-1]}.cpp").replace(
         os.path.sep, "/"
     )
-    FILES_TO_FORMAT.append(os.path.join(BINDINGS_HEADERS_LOCATION, bindings_header))
-    FILES_TO_FORMAT.append(os.path.join(BINDINGS_SOURCES_LOCATION, bindings_source))
-    if GENERATE_BINDINGS:
-        make_bindings_sources(
-            name,
-            bindings_source,
-            bindings_header,
-            enum_bindings,
-            class_bindings,
-            functions_bindings,
-            globals_bindings,
-            namespace_data,
-        )
-    return generated_objects, bindings_header, bindings_source
+    datasets = [
+        enum_bindings,
+        class_bindings,
+        functions_bindings,
+        globals_bindings,
+        namespace_data,
+    ]
+    includes = collect_bindings_includes(bindings_source, datasets, include_closures)
+    return generated_objects, bindings_header, bindings_source, includes, datasets
 
 
-def fetch_sub_dict(d, path):
-    if len(path) == 0:
-        return d
-    if len(path) > 1:
-        return fetch_sub_dict(d[path[0]], path[1::])
-    else:
-        return d[path[0]]
+INDEX_TABLE = "state{namespace_path}.get_or_create<sol::table>();"
 
 
-BINDTREE_NEWTABLE = 'BindTree{fetch_table}.add("{last_table}", InitTreeNodeAsTable("{intermediate_table}"));'
+def make_namespace_tree(namespace_names):
+    namespace_tree = {}
+    for namespace_name in namespace_names:
+        node = namespace_tree
+        for namespace_part in namespace_name.split("::"):
+            node = node.setdefault(namespace_part, {})
+    return namespace_tree
 
 
-def fix_index_tables(tables):
-    # Pre-sort the table to fix missing intermediate tables
-    tables.sort(key=lambda x: x.count("["))
-    table_tree = {}
-    for table in tables:
-        table_path = re.findall(r'(?:\[\"([^"]+)\"\])', table)
-        for i, elem in enumerate(table_path):
-            if not elem in fetch_sub_dict(table_tree, table_path[:i]):
-                if i != len(table_path) - 1:
-                    print("Add missing intermediate table", ".".join(table_path))
-                    namespace_full_path = "".join(
-                        [f'["{item}"]' for item in table_path[: i + 1]]
-                    )
-                    tables.append(
-                        f"state{namespace_full_path}.get_or_create<sol::table>();"
+def make_index_tables(namespace_tree):
+    """Creates every namespace table, intermediate ones included
+    Tables are created level by level so a parent table always exists before its children
+    """
+    tables = []
+    level = [((), namespace_tree)]
+    while level:
+        next_level = []
+        for path, node in level:
+            for namespace_part, children in node.items():
+                table_path = path + (namespace_part,)
+                tables.append(
+                    INDEX_TABLE.format(
+                        namespace_path="".join(f'["{part}"]' for part in table_path)
                     )
-                fetch_sub_dict(table_tree, table_path[:i])[table_path[i]] = {}
-    # Don't load a sub-table before the main one
-    tables.sort(key=lambda x: x.count("["))
+                )
+                next_level.append((table_path, children))
+        level = next_level
+    return tables
 
 
 # LATER: Generate bindings shorthands
-def generated_bindings_index(generated_objects):
+def generated_bindings_index(bindings_run: BindingsRun, generated_objects):
     print("Generating Bindings Index...")
-    body = []
-    include_list = []
-    for current_dir, folders, files in os.walk(
-        os.path.join(OUTPUT_DIRECTORY, BINDINGS_HEADERS_LOCATION, "Bindings")
-    ):
-        for f in files:
-            if f.endswith(".hpp"):
-                fp = (
-                    os.path.join(current_dir, f)
-                    .split(OUTPUT_DIRECTORY)[1]
-                    .lstrip("/\\")
-                )
-                include_list.append(strip_include(fp).replace("\\", "/"))
-    body += [f"#include <{path}>" for path in include_list]
+    body = [f"#include <{BINDINGS_PCH_FILE}>"]
+    body += [
+        f"#include <{objects['header']}>" for objects in generated_objects.values()
+    ]
     body += [
-        f"#include <{flavour.INCLUDE_FILE}>",
         "namespace obe::Bindings {",
         f"void IndexAllBindings({flavour.STATE_VIEW} state)\n{{",
     ]
 
-    tables = []
-    bindings = []
-    for namespace_name, objects in generated_objects.items():
-        ns_split = namespace_name.split("::")
-        namespace_full_path = "".join(
-            f'["{namespace_part}"]' for namespace_part in ns_split
-        )
-        tables.append(f"state{namespace_full_path}.get_or_create<sol::table>();")
-
-        print(objects)
-        for generated_object in objects["objects"]:
-            bindings.append(
-                f"{namespace_name}::Bindings::Load{generated_object['bindings']}(state);"
-            )
-        bindings.append("\n")
-    fix_index_tables(tables)
+    tables = make_index_tables(make_namespace_tree(generated_objects.keys()))
+    bindings = [
+        f"{namespace_name}::Bindings::Load{NAMESPACE_LOADER}(state);"
+        for namespace_name in generated_objects
+    ]
     body += tables
     body += bindings
     body.append("}}")
+    if flavour.PROFILING:
+        body.append(generate_bindings_profiling_index(bindings_run))
     return "\n".join(body)
 
 
-def apply_proxies(cpp_db, functions):
-    all_functions = {
-        **cpp_db.functions,
-        **{
-            f"{class_name}::{method_name}": method_value
-            for class_name, class_value in cpp_db.classes.items()
-            for method_name, method_value in class_value.methods.items()
-        },
-    }
-    for function_value in functions.values():
+def generate_bindings_profiling_index(bindings_run: BindingsRun):
+    bindings_ids = bindings_run.bindings_ids
+    return flavour.PROFILING_INDEX.format(
+        bindings_count=len(bindings_ids),
+        bindings_names=",\n".join(
+            f'"{qualified_name}"' for qualified_name in bindings_ids
+        ),
+        profiling_macro=flavour.PROFILING_MACRO,
+    )
+
+
+def make_bindings_profiling_header(bindings_run: BindingsRun):
+    write_bindings_file(
+        bindings_run,
+        f"{BINDINGS_HEADERS_LOCATION}/{flavour.PROFILING_HEADER_FILE}",
+        flavour.PROFILING_HEADER.format(profiling_macro=flavour.PROFILING_MACRO),
+    )
+
+
+def count_namespace_table_lookups(generated_objects):
+    """Counts the Lua table accesses done at startup to fetch namespace tables
+    Returns the count with one fetch per namespace and the count with one fetch per object
+    """
+    per_namespace = 0
+    per_object = 0
+    for namespace_name, objects in generated_objects.items():
+        depth = len(namespace_name.split("::"))
+        per_namespace += depth
+        per_object += depth * len(objects["objects"])
+    return per_namespace, per_object
+
+
+def make_functions_index(cpp_db, inheritance_graph: InheritanceGraph):
+    """Indexes every function and method by its qualified name
+    Methods copied from the bases (see `copy_parent_items`) are indexed on derived classes too
+    """
+    functions_index = dict(cpp_db.functions)
+    for class_name in cpp_db.classes:
+        for method_name, method_value in inheritance_graph.get_methods(
+            class_name
+        ).items():
+            functions_index[f"{class_name}::{method_name}"] = method_value
+    return functions_index
+
+
+def apply_proxies(functions_index, functions, inheritance_graph: InheritanceGraph):
+    """Patches the targets of the functions with the `proxy` flag and updates `functions_index`
+
+    Methods a derived class shares with its base (see InheritanceGraph.get_methods)
+    are copied before being patched so the base and the other derived classes keep theirs
+    """
+    for function_name, function_value in functions.items():
         if function_value.flags.proxy:
-            patch = all_functions[function_value.flags.proxy]
+            patch = functions_index.get(function_value.flags.proxy)
+            if patch is None:
+                raise RuntimeError(
+                    f"Proxy {function_name} ({function_value.location.file}:"
+                    f"{function_value.location.line}) targets "
+                    f"{function_value.flags.proxy}, "
+                    "which is not a known function or method"
+                )
+            class_name, _, method_name = function_value.flags.proxy.rpartition("::")
+            if (
+                class_name in inheritance_graph.classes
+                and inheritance_graph.is_inherited(class_name, method_name, patch)
+            ):
+                patch = copy.copy(patch)
+                inheritance_graph.set_method(class_name, method_name, patch)
+                functions_index[function_value.flags.proxy] = patch
             patch.definition = function_value.definition
             patch.parameters = function_value.parameters
             patch.return_type = function_value.return_type
@@ -300,32 +470,102 @@ def discard_placeholders(cpp_db):
 # TODO: Check behaviour with std::optional, std::variant, std::any (getSegmentContainingPoint for example)
 # TODO: Check behaviour with smart pointers
 # TODO: Allow injection of "commonly used types" in templated functions using a certain flag in doc (pushParameter for example)
-def generate_bindings(cpp_db, write_files: bool = True):
-    global GENERATE_BINDINGS
-    GENERATE_BINDINGS = write_files
+def generate_bindings(
+    cpp_db,
+    write_files: bool = True,
+    flatten_inheritance: bool = False,
+    include_graph=None,
+    previous_run=None,
+):
+    """Generates the bindings of every namespace of the database
+    Only files whose content changed since `previous_run` (a BindingsRun) are written
+    Returns the generated objects and the BindingsRun to give to the next run
+    """
+    bindings_run = BindingsRun(
+        write_files=write_files,
+        previous_files=previous_run.files if previous_run else {},
+    )
     log.info("===== Generating bindings for ÖbEngine ====")
     discard_placeholders(cpp_db)
+    inheritance_graph = InheritanceGraph(cpp_db)
+    functions_index = make_functions_index(cpp_db, inheritance_graph)
     namespaces = group_bindings_by_namespace(cpp_db)
+    include_closures = make_include_closures(include_graph) if include_graph else None
     generated_objects = {}
+    generated_sources = {}
     for namespace_name, namespace in namespaces.items():
-        copy_parent_bindings(cpp_db, namespace.classes)
-        copy_parent_bases(cpp_db, namespace.classes)
-        apply_proxies(cpp_db, namespace.functions)
-        generation_results = generate_bindings_for_namespace(namespace_name, namespace)
+        copy_parent_bindings(inheritance_graph, namespace.classes)
+        copy_parent_bases(inheritance_graph, namespace.classes)
+        apply_proxies(functions_index, namespace.functions, inheritance_graph)
+        inherited_items = None
+        if flatten_inheritance:
+            inherited_items = flatten_parent_bindings(cpp_db, namespace.classes)
+        generation_results = generate_bindings_for_namespace(
+            bindings_run, namespace_name, namespace, inherited_items, include_closures
+        )
         generated_objects[namespace_name] = {
             "objects": generation_results[0],
             "header": generation_results[1],
             "source": generation_results[2],
         }
-    if GENERATE_BINDINGS:
+        generated_sources[namespace_name] = generation_results[3:]
+    common_includes = find_common_includes(
+        [includes for includes, _ in generated_sources.values()]
+    )
+    precompiled_includes = [
+        f"#include <{flavour.INCLUDE_FILE}>",
+        f"#include <{BINDINGS_CONFIG_FILE}>",
+    ] + common_includes
+    log.info(
+        f"{len(common_includes)} includes shared by all bindings sources "
+        f"moved to {BINDINGS_PCH_FILE}"
+    )
+    for namespace_name, (includes, datasets) in generated_sources.items():
+        generated = generated_objects[namespace_name]
+        source = make_bindings_sources(
+            bindings_run,
+            namespace_name,
+            generated["source"],
+            generated["header"],
+            generated["objects"],
+            [include for include in includes if include not in common_includes],
+            *datasets,
+        )
+        generated["locations"] = find_bindings_locations(
+            namespace_name, generated["objects"], source
+        )
+    write_bindings_file(
+        bindings_run,
+        f"{BINDINGS_SOURCES_LOCATION}/Bindings/index.cpp",
+        generated_bindings_index(bindings_run, generated_objects),
+    )
+    if bindings_run.write_files:
+        make_bindings_pch(bindings_run, precompiled_includes, generated_objects)
+        if flavour.PROFILING:
+            make_bindings_profiling_header(bindings_run)
+    per_namespace, per_object = count_namespace_table_lookups(generated_objects)
+    log.info(
+        f"Namespace tables lookups at startup : {per_namespace} "
+        f"(instead of {per_object} with one lookup per object)"
+    )
+    if bindings_run.write_files:
+        output_directory = get_output_directory()
+        log.info(
+            f"{len(bindings_run.files_to_format)} bindings files written "
+            f"out of {len(bindings_run.files)}"
+        )
+        if clang_format_files(bindings_run.files_to_format):
+            update_bindings_locations(
+                generated_objects,
+                os.path.join(output_directory, BINDINGS_SOURCES_LOCATION),
+            )
         with open(
             os.path.join(
-                OUTPUT_DIRECTORY, f"{BINDINGS_SOURCES_LOCATION}/Bindings/index.cpp"
+                output_directory, BINDINGS_HEADERS_LOCATION, BINDINGS_LOCATIONS_MANIFEST
             ),
             "w",
-        ) as bindings_index:
-            bindings_index.write(generated_bindings_index(generated_objects))
-    FILES_TO_FORMAT.append(f"{BINDINGS_SOURCES_LOCATION}/Bindings/index.cpp")
-    if GENERATE_BINDINGS:
-        clang_format_files(FILES_TO_FORMAT)
-    return generated_objects
+        ) as locations_manifest:
+            dump_bindings_locations(
+                generated_objects, BINDINGS_SOURCES_LOCATION, locations_manifest
+            )
+    return generated_objects, bindings_run
@@ -1,9 +1,9 @@
 import os
 
 from obidog.bindings.utils import strip_include
-import obidog.bindings.flavours.sol3 as flavour
+from obidog.bindings.flavours import flavour
 from obidog.utils.string_utils import format_name
-from obidog.bindings.utils import fetch_table, get_include_file
+from obidog.bindings.utils import get_include_file, make_register_signature
 from obidog.logger import log
 import inflection
 
@@ -24,10 +24,10 @@ def generate_globals_bindings(name, cpp_globals):
                 "identifier": f"{cpp_global.namespace}::{cpp_global.name}",
             }
         )
-        state_view = flavour.STATE_VIEW
-        binding_function_signature = f"void LoadGlobal{export_name}({state_view} state)"
-        namespace_access = fetch_table(name) + "\n"
-        binding_function_body = namespace_access + flavour.GLOBAL_BODY.format(
+        binding_function_signature = make_register_signature(
+            f"Global{export_name}", name
+        )
+        binding_function_body = flavour.GLOBAL_BODY.format(
             namespace=name.split("::")[-1],
             global_name=cpp_global.name,
             global_ptr=global_name,
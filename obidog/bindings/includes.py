@@ -0,0 +1,83 @@
+import os
+
+from obidog.bindings.utils import strip_include
+
+
+def make_include_directive(path):
+    include_path = strip_include(path).replace(os.path.sep, "/")
+    return f"#include <{include_path}>"
+
+
+def get_included_path(include):
+    return include.split("<", 1)[1].rsplit(">", 1)[0]
+
+
+def make_include_closures(include_graph):
+    """Computes, for each header of the include graph, every header it pulls transitively
+    Keys and values use the `#include <...>` form used in the generated sources
+    """
+    direct_includes = {
+        make_include_directive(path): [
+            make_include_directive(include) for include in file_value["includes"]
+        ]
+        for path, file_value in include_graph.items()
+    }
+    closures = {}
+    for include in direct_includes:
+        closure = set()
+        stack = list(direct_includes[include])
+        while stack:
+            current = stack.pop()
+            if current in closure:
+                continue
+            closure.add(current)
+            if current in closures:
+                closure |= closures[current]
+            else:
+                stack += direct_includes.get(current, [])
+        closure.discard(include)
+        closures[include] = closure
+    lines = {
+        make_include_directive(path): file_value["lines"]
+        for path, file_value in include_graph.items()
+    }
+    return closures, lines
+
+
+def minimize_includes(includes, include_closures):
+    """Drops includes that are already pulled transitively by another include of the list
+    Returns the kept includes (in their original order) and the dropped ones
+    """
+    closures, _ = include_closures
+    candidates = sorted(
+        includes, key=lambda include: len(closures.get(include, ())), reverse=True
+    )
+    kept = set()
+    covered = set()
+    for include in candidates:
+        if include in covered:
+            continue
+        kept.add(include)
+        covered |= closures.get(include, set())
+    return (
+        [include for include in includes if include in kept],
+        [include for include in includes if include not in kept],
+    )
+
+
+def find_common_includes(sources_includes):
+    """Returns the includes shared by every bindings source
+    Nothing is considered common when there is a single source
+    """
+    if len(sources_includes) < 2:
+        return []
+    return sorted(set.intersection(*(set(includes) for includes in sources_includes)))
+
+
+def count_included_lines(includes, include_closures, own_lines_only=False):
+    closures, lines = include_closures
+    pulled = set(includes)
+    if not own_lines_only:
+        for include in includes:
+            pulled |= closures.get(include, set())
+    return sum(lines.get(include, 0) for include in pulled)
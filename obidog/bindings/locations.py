@@ -0,0 +1,56 @@
+import json
+import os
+import re
+
+BINDING_ANCHOR_REG = re.compile(
+    r'\bRegister(\w+)\s*\(|\bbind(\w+)\s*\[\s*"([^"]+)"\s*\]'
+)
+
+
+def find_bindings_locations(namespace, objects, bindings_source):
+    """Maps the identifier of every element bound in a bindings source to its line
+    The source is scanned once, only the first occurrence of an element is kept
+    """
+    objects_identifiers = {
+        generated_object["bindings"]: generated_object["identifier"]
+        for generated_object in objects
+    }
+    locations = {}
+    line = 1
+    position = 0
+    for match in BINDING_ANCHOR_REG.finditer(bindings_source):
+        line += bindings_source.count("\n", position, match.start())
+        position = match.start()
+        if match.group(1):
+            identifier = objects_identifiers.get(match.group(1))
+        else:
+            identifier = f"{namespace}::{match.group(2)}::{match.group(3)}"
+        if identifier and identifier not in locations:
+            locations[identifier] = line
+    return locations
+
+
+def update_bindings_locations(generated_objects, sources_directory):
+    """Scans the bindings sources again once they have been formatted"""
+    for namespace_name, generated in generated_objects.items():
+        with open(
+            os.path.join(sources_directory, generated["source"]), encoding="utf-8"
+        ) as bindings_source:
+            generated["locations"] = find_bindings_locations(
+                namespace_name, generated["objects"], bindings_source.read()
+            )
+
+
+def dump_bindings_locations(generated_objects, sources_location, output):
+    json.dump(
+        {
+            identifier: {
+                "file": f"{sources_location}/{generated['source']}",
+                "line": line,
+            }
+            for generated in generated_objects.values()
+            for identifier, line in generated["locations"].items()
+        },
+        output,
+        indent=4,
+    )
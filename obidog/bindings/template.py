@@ -1,25 +1,121 @@
-from copy import deepcopy
+import copy
+import re
+from itertools import islice, product
 
+from obidog.config import TEMPLATE_SPECIALIZATIONS_LIMIT
+from obidog.logger import log
 from obidog.models.functions import FunctionModel
+from obidog.parsers.obidog_parser import TEMPLATE_HINTS_VARIABLES
+
+TYPE_SEPARATORS_REG = re.compile(r"\s*([<>,*&:])\s*")
 
 
 def replace_template_type(value, search, replace):
     return " ".join(elem if elem != search else replace for elem in value.split())
 
 
+def normalize_type(value: str):
+    """Spelling-independent form of a type, `std::map<int,int>` and `std::map<int, int>` are equal"""
+    return " ".join(TYPE_SEPARATORS_REG.sub(r"\1", value).split())
+
+
+def specialize_type(value: str, hints):
+    for template_class_name, template_hint in hints.items():
+        if template_class_name in value.split():
+            value = replace_template_type(value, template_class_name, template_hint)
+    return value
+
+
+def count_template_hints(template_hints):
+    """Number of combinations iter_template_hints yields, without generating them"""
+    count = 0
+    for template_hint in template_hints:
+        combinations = 1
+        for associate_type in template_hint.values():
+            if associate_type.startswith("$"):
+                combinations *= len(TEMPLATE_HINTS_VARIABLES[associate_type[1::]])
+        count += combinations
+    return count
+
+
+def iter_template_hints(template_hints):
+    """Lazily expands the `$variables` (see TEMPLATE_HINTS_VARIABLES) of template hints"""
+    for template_hint in template_hints:
+        variables = [
+            template_name
+            for template_name, associate_type in template_hint.items()
+            if associate_type.startswith("$")
+        ]
+        for variable_combination in product(
+            *(TEMPLATE_HINTS_VARIABLES[template_hint[name][1::]] for name in variables)
+        ):
+            yield {**template_hint, **dict(zip(variables, variable_combination))}
+
+
 def generate_template_specialization(function: FunctionModel, bind_name, hints):
-    function = deepcopy(function)
-    function.template = False
+    """Shallow copy of `function` where only the types using the template parameters are replaced"""
+    function_specialization = copy.copy(function)
+    function_specialization.template = False
     if function.flags.template_hints:
-        function.flags.template_hints = []
-    for template_class_name, template_hint in hints.items():
-        if template_class_name in function.return_type.split():
-            function.return_type = replace_template_type(
-                function.return_type, template_class_name, template_hint
-            )
-        for parameter in function.parameters:
-            if template_class_name in parameter.type.split():
-                parameter.type = replace_template_type(
-                    parameter.type, template_class_name, template_hint
-                )
-    return function
+        function_specialization.flags = copy.copy(function.flags)
+        function_specialization.flags.template_hints = []
+    function_specialization.return_type = specialize_type(function.return_type, hints)
+    function_specialization.parameters = []
+    for parameter in function.parameters:
+        parameter_type = specialize_type(parameter.type, hints)
+        if parameter_type != parameter.type:
+            parameter = copy.copy(parameter)
+            parameter.type = parameter_type
+        function_specialization.parameters.append(parameter)
+    return function_specialization
+
+
+def _iter_distinct_specializations(function: FunctionModel, bind_name, template_hints):
+    signatures = set()
+    for hints in iter_template_hints(template_hints):
+        function_specialization = generate_template_specialization(
+            function, bind_name, hints
+        )
+        signature = (
+            normalize_type(function_specialization.return_type),
+            tuple(
+                normalize_type(parameter.type)
+                for parameter in function_specialization.parameters
+            ),
+        )
+        if signature not in signatures:
+            signatures.add(signature)
+            yield function_specialization
+
+
+def generate_template_specializations(
+    function_name: str, function: FunctionModel, bind_name, template_hints
+):
+    """Returns the distinct specializations of a templated function for one of its bind names
+
+    Combinations are generated one at a time and the generation stops
+    once TEMPLATE_SPECIALIZATIONS_LIMIT specializations have been found
+    """
+    combinations = count_template_hints(template_hints)
+    specializations = list(
+        islice(
+            _iter_distinct_specializations(function, bind_name, template_hints),
+            TEMPLATE_SPECIALIZATIONS_LIMIT + 1,
+        )
+    )
+    if len(specializations) > TEMPLATE_SPECIALIZATIONS_LIMIT:
+        specializations = specializations[:TEMPLATE_SPECIALIZATIONS_LIMIT]
+        log.warning(
+            f"Template {function_name} -> {bind_name} has more than "
+            f"{TEMPLATE_SPECIALIZATIONS_LIMIT} specializations "
+            f"({combinations} template hint combinations), only the first "
+            f"{TEMPLATE_SPECIALIZATIONS_LIMIT} are bound "
+            "(see OBIDOG_TEMPLATE_SPECIALIZATIONS_LIMIT)"
+        )
+    else:
+        log.debug(
+            f"  Template {function_name} -> {bind_name} : {combinations} combinations, "
+            f"{combinations - len(specializations)} duplicates, "
+            f"{len(specializations)} specializations"
+        )
+    return specializations
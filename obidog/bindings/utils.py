@@ -1,7 +1,10 @@
+from dataclasses import dataclass, field
+from typing import Dict, List
+
 from obidog.models.base import LocalizableModel
 
 import os
-import obidog.bindings.flavours.sol3 as flavour
+from obidog.bindings.flavours import flavour
 from obidog.config import SOURCE_DIRECTORIES
 
 
@@ -21,6 +24,54 @@ def fetch_table(full_namespace):
     )
 
 
+@dataclass
+class BindingsRun:
+    """State of a single bindings generation, created by `generate_bindings` for each run
+    `files` maps each generated file to its content (before clang-format),
+    files with the same content in `previous_files` are not written again
+    """
+
+    write_files: bool = False
+    bindings_ids: List[str] = field(default_factory=lambda: [])
+    files: Dict[str, str] = field(default_factory=lambda: {})
+    files_to_format: List[str] = field(default_factory=lambda: [])
+    previous_files: Dict[str, str] = field(default_factory=lambda: {})
+
+
+def instrument_binding(bindings_run: BindingsRun, qualified_name, binding):
+    if not flavour.PROFILING:
+        return binding
+    bindings_run.bindings_ids.append(qualified_name)
+    return flavour.INSTRUMENTED_BINDING.format(
+        binding_id=len(bindings_run.bindings_ids) - 1, binding=binding
+    )
+
+
+def instrument_constructors(bindings_run: BindingsRun, class_name, constructors):
+    if not flavour.PROFILING:
+        return constructors
+    bindings_run.bindings_ids.append(f"{class_name}::{class_name.split('::')[-1]}")
+    return flavour.INSTRUMENTED_CONSTRUCTORS.format(
+        binding_id=len(bindings_run.bindings_ids) - 1,
+        class_name=class_name,
+        constructors=constructors,
+    )
+
+
+def make_register_signature(bindings_name, full_namespace):
+    return flavour.REGISTER_FUNCTION_SIGNATURE.format(
+        bindings=bindings_name,
+        state_view=flavour.STATE_VIEW,
+        namespace=full_namespace.split("::")[-1],
+    )
+
+
+def make_register_call(bindings_name, full_namespace):
+    return flavour.REGISTER_CALL.format(
+        bindings=bindings_name, namespace=full_namespace.split("::")[-1]
+    )
+
+
 # TODO: Support for metatable shorthand
 # TODO: Support for table / metatable deps, if a shorthand requires a table, check that it's not created elsewhere
 def make_shorthand(full_name, shorthand):
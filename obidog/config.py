@@ -9,10 +9,25 @@ SOURCE_DIRECTORIES = [
     {"path": "extlibs/vili/include", "namespace": "vili"},
 ]
 BINDINGS_CONFIG_FILE = "Bindings/Config.hpp"
+BINDINGS_PCH_FILE = "Bindings/pch.hpp"
+BINDINGS_PCH_MANIFEST = "Bindings/pch.json"
+BINDINGS_LOCATIONS_MANIFEST = "Bindings/locations.json"
+BINDINGS_FLAVOUR = os.environ.get("OBIDOG_BINDINGS_FLAVOUR", "sol3")
+# Maximum amount of specializations bound for each bind name of a templated function
+TEMPLATE_SPECIALIZATIONS_LIMIT = int(
+    os.environ.get("OBIDOG_TEMPLATE_SPECIALIZATIONS_LIMIT", 64)
+)
 OBENGINE_GIT_URL = os.environ.get(
     "OBENGINE_GIT_URL", "https://github.com/Sygmei/ObEngine"
 )
 OBENGINE_GIT_SSH = os.environ.get("OBENGINE_GIT_SSH", "git@github.com:Sygmei/ObEngine")
+# Branch, tag or commit checked out in the managed ÖbEngine checkout
+OBENGINE_GIT_REF = os.environ.get("OBENGINE_GIT_REF", "master")
+# Local bare mirror of the ÖbEngine repository, fetched instead of OBENGINE_GIT_URL
+OBENGINE_GIT_MIRROR = os.environ.get("OBENGINE_GIT_MIRROR", None)
+OBIDOG_CACHE_DIRECTORY = os.environ.get(
+    "OBIDOG_CACHE_DIRECTORY", os.path.join(os.path.expanduser("~"), ".cache", "obidog")
+)
 
 
 def set_obengine_git_directory(directory):
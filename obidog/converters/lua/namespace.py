@@ -3,36 +3,26 @@ from collections import defaultdict
 from obidog.databases import CppDatabase
 
 from obidog.models.namespace import NamespaceModel
+from obidog.utils.namespace_utils import group_items_by_namespace
 
 
 def group_bindings_by_namespace(cpp_db: CppDatabase):
+    namespace_tree = group_items_by_namespace(cpp_db)
     group_by_namespace = defaultdict(NamespaceModel)
-    for item_type in [
-        "classes",
-        "enums",
-        "functions",
-        "globals",
-        "typedefs",
-    ]:
-        for item_name, item_value in getattr(cpp_db, item_type).items():
-            strip_template = item_name.split("<")[0]
-            last_namespace = "::".join(strip_template.split("::")[:-1:])
-            if last_namespace in cpp_db.namespaces:
-                getattr(group_by_namespace[last_namespace], item_type)[
-                    item_name
-                ] = item_value
-    for namespace_name, namespace in group_by_namespace.items():
-        namespace.name = namespace_name.split("::")[-1]
-        namespace.path = namespace_name
-        namespace.namespaces = {
-            sub_namespace_name: sub_namespace
-            for sub_namespace_name, sub_namespace in group_by_namespace.items()
-            if "::".join(sub_namespace_name.split("::")[:-1:]) == namespace.path
+    for namespace_name, namespace_node in namespace_tree.nodes.items():
+        group_by_namespace[namespace_name] = NamespaceModel(
+            name=namespace_name.split("::")[-1],
+            path=namespace_name,
+            **namespace_node.items,
+        )
+    for namespace_name, namespace_node in namespace_tree.nodes.items():
+        group_by_namespace[namespace_name].namespaces = {
+            sub_namespace_name: group_by_namespace[sub_namespace_name]
+            for sub_namespace_name in namespace_node.children
         }
     root_namespaces = {
-        sub_namespace_name: sub_namespace
-        for sub_namespace_name, sub_namespace in group_by_namespace.items()
-        if not "::" in sub_namespace_name
+        sub_namespace_name: group_by_namespace[sub_namespace_name]
+        for sub_namespace_name in namespace_tree.roots
     }
     group_by_namespace[""] = NamespaceModel(
         name="ÖbEngine",
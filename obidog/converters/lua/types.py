@@ -112,9 +112,13 @@ def convert_function_types(
 
 
 def convert_all_types(cpp_db: CppDatabase):
+    # Classes with the copy_parent_items flag share the methods of their bases
+    converted_methods = set()
     for class_value in cpp_db.classes.values():
         for method in class_value.methods.values():
-            convert_function_types(cpp_db, method)
+            if id(method) not in converted_methods:
+                converted_methods.add(id(method))
+                convert_function_types(cpp_db, method)
     for function in cpp_db.functions.values():
         convert_function_types(cpp_db, function)
     for glob in cpp_db.globals.values():
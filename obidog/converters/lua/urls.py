@@ -34,7 +34,16 @@ def get_bindings_url(bindings_results, element):
         namespace = element.namespace
     if namespace in bindings_results:
         bindings_source = bindings_results[namespace]["source"]
-        bindings_line = find_binding_location(bindings_source, element)
+        if hasattr(element, "from_class"):
+            identifier = f"{namespace}::{element.from_class}::{element.name}"
+        else:
+            identifier = f"{namespace}::{element.name}"
+        bindings_locations = bindings_results[namespace].get("locations", {})
+        if identifier in bindings_locations:
+            bindings_line = bindings_locations[identifier]
+        else:
+            # Bindings sources edited by hand are not covered by the manifest
+            bindings_line = find_binding_location(bindings_source, element)
         return f"{OBENGINE_GIT_URL}/blob/master/{BINDINGS_SOURCES_LOCATION}/{bindings_source}#L{bindings_line}"
     else:
         print(f"Namespace '{namespace}' not found in bindings generation results")
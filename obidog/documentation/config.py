@@ -1,3 +1,10 @@
+import os
+
 WEBSITE_URL = "obengine.io"
 DOC_PATH = "doc/lua"
-DOXYGEN_PATH = "doc/cpp"
\ No newline at end of file
+DOXYGEN_PATH = "doc/cpp"
+TEMPLATES_PATH = os.path.join("templates", "documentation")
+TEMPLATES_CACHE_PATH = os.environ.get(
+    "OBIDOG_TEMPLATES_CACHE", os.path.join(".cache", "templates")
+)
+DOC_OUTPUT_MODE = os.environ.get("OBIDOG_DOC_OUTPUT_MODE", "minified")
\ No newline at end of file
@@ -0,0 +1,73 @@
+from collections import defaultdict
+
+from obidog.databases import CppDatabase
+from obidog.documentation.incremental import IncrementalBuild, brotli
+from obidog.documentation.search import DefaultEncoder
+from obidog.logger import log
+
+DATABASE_FILENAME = "db.json"
+DB_SHARDS_DIRECTORY = "db"
+DB_MANIFEST_FILENAME = "index.json"
+GLOBAL_SHARD = "_global"
+
+
+def get_item_scope(item_name: str):
+    return "::".join(item_name.split("<")[0].split("::")[:-1])
+
+
+def group_database_by_scope(cpp_db: CppDatabase):
+    """Groups all items by the namespace (or class) they are declared in
+    A namespace is stored in the shard of its parent namespace
+    """
+    shards = defaultdict(lambda: defaultdict(dict))
+    for item_type, items in cpp_db.__dict__.items():
+        for item_name, item_value in items.items():
+            shards[get_item_scope(item_name)][item_type][item_name] = item_value
+    return shards
+
+
+def get_shard_filename(scope: str):
+    return f"{'.'.join(scope.split('::')) if scope else GLOBAL_SHARD}.json"
+
+
+def iter_compact_json(value):
+    return DefaultEncoder(separators=(",", ":"), ensure_ascii=False).iterencode(value)
+
+
+def export_database(cpp_db: CppDatabase, build: IncrementalBuild):
+    """Single file export of the whole database, kept for older consumers"""
+    build.write_chunks(
+        DATABASE_FILENAME,
+        DefaultEncoder(indent=4, ensure_ascii=False).iterencode(cpp_db.__dict__),
+    )
+
+
+def make_database_shards(cpp_db: CppDatabase, compressions=()):
+    """Returns the shards of the database, keyed by their path, and the manifest listing them"""
+    shards = {}
+    manifest = {}
+    for scope, shard in sorted(group_database_by_scope(cpp_db).items()):
+        shard_path = f"{DB_SHARDS_DIRECTORY}/{get_shard_filename(scope)}"
+        shards[shard_path] = shard
+        manifest[scope] = {
+            "file": shard_path,
+            "items": {item_type: len(items) for item_type, items in shard.items()},
+        }
+    return shards, {"compressions": list(compressions), "shards": manifest}
+
+
+def export_database_shards(
+    cpp_db: CppDatabase, build: IncrementalBuild, compressions=()
+):
+    """Exports one compact JSON file per namespace and a manifest listing them"""
+    if "br" in compressions and brotli is None:
+        log.warning("brotli is not installed, .br files will not be generated")
+        compressions = [
+            compression for compression in compressions if compression != "br"
+        ]
+    shards, manifest = make_database_shards(cpp_db, compressions)
+    for shard_path, shard in shards.items():
+        build.write_chunks(shard_path, iter_compact_json(shard), compressions)
+    build.write_chunks(
+        f"{DB_SHARDS_DIRECTORY}/{DB_MANIFEST_FILENAME}", iter_compact_json(manifest)
+    )
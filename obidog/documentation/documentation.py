@@ -1,44 +1,156 @@
+import io
+import multiprocessing
 import os
-from typing import Union
+import time
+from collections import defaultdict
+from typing import List, Union
 
 from bs4 import BeautifulSoup
-from mako.template import Template
 from mako.lookup import TemplateLookup
 from mako import exceptions
 
 from obidog.models.classes import ClassModel
 from obidog.models.namespace import NamespaceModel
-from obidog.documentation.config import WEBSITE_URL, DOC_PATH
+from obidog.utils.html_utils import iter_minified_html
+from obidog.logger import log
+from obidog.documentation.config import (
+    DOC_OUTPUT_MODE,
+    DOC_PATH,
+    TEMPLATES_CACHE_PATH,
+    TEMPLATES_PATH,
+    WEBSITE_URL,
+)
 
 DB_FILENAME = "search.json"
+VERSIONS_FILENAME = "versions.json"
 CURRENT_VERSION = "0.5"  # TODO: Fetch version from ObEngine repo
 
+TEMPLATE_LOOKUP = None
+OUTPUT_MODES = ["raw", "minified", "pretty"]
+# Set before forking the rendering workers so they inherit the converted
+# database instead of receiving pickled models
+ITEMS_TO_DOCUMENT = []
+BATCHES_PER_WORKER = 4
 
-def document_item(item: Union[ClassModel, NamespaceModel]):
+
+def get_template_lookup():
+    """Compiled templates are kept in memory for the whole run and written to
+    TEMPLATES_CACHE_PATH so unchanged templates are not recompiled on the next run
+    """
+    global TEMPLATE_LOOKUP
+    if TEMPLATE_LOOKUP is None:
+        TEMPLATE_LOOKUP = TemplateLookup(
+            [TEMPLATES_PATH],
+            module_directory=TEMPLATES_CACHE_PATH,
+            input_encoding="utf-8",
+        )
+    return TEMPLATE_LOOKUP
+
+
+def write_html(export, html_string: str, output_mode: str):
+    if output_mode == "minified":
+        export.writelines(iter_minified_html(html_string))
+    elif output_mode == "pretty":
+        export.write(BeautifulSoup(html_string, "html.parser").prettify())
+    else:
+        export.write(html_string)
+
+
+def get_page_path(item: Union[ClassModel, NamespaceModel]):
     if isinstance(item, ClassModel):
         directory = os.path.join("export", *item.namespace.split("::"))
     elif isinstance(item, NamespaceModel):
         directory = os.path.join("export", *item.path.split("::"))
-    os.makedirs(directory, exist_ok=True)
     name = f"{item.name}.html" if isinstance(item, ClassModel) else "index.html"
+    return os.path.join(directory, name)
+
+
+def render_item(
+    item: Union[ClassModel, NamespaceModel], current_version: str = CURRENT_VERSION
+):
+    return (
+        get_template_lookup()
+        .get_template("lua_body.mako")
+        .render(
+            target=item,
+            WEBSITE_LOCATION=WEBSITE_URL,
+            DOCUMENTATION_PATH=DOC_PATH,
+            DB_LOCATION=f"{WEBSITE_URL}/{DOC_PATH}/{DB_FILENAME}",
+            VERSIONS_LOCATION=f"{WEBSITE_URL}/{DOC_PATH}/{VERSIONS_FILENAME}",
+            CURRENT_VERSION=current_version,
+        )
+    )
+
+
+def render_page(
+    item: Union[ClassModel, NamespaceModel],
+    output_mode: str = DOC_OUTPUT_MODE,
+    current_version: str = CURRENT_VERSION,
+):
+    """Renders the page of an item in memory, errors are rendered as the page"""
+    page = io.StringIO()
+    try:
+        write_html(page, render_item(item, current_version), output_mode)
+    except Exception:
+        log.exception(f"Could not render the page of {item.name}")
+        return exceptions.html_error_template().render().decode("utf-8")
+    return page.getvalue()
+
+
+def document_item(
+    item: Union[ClassModel, NamespaceModel], output_mode: str = DOC_OUTPUT_MODE
+):
+    page_path = get_page_path(item)
+    os.makedirs(os.path.dirname(page_path), exist_ok=True)
     with open(
-        os.path.join(directory, name),
+        page_path,
         "w",
         encoding="utf-8",
     ) as export:
-        with open(
-            "templates/documentation/lua_body.mako", "r", encoding="utf-8"
-        ) as tpl:
-            try:
-                lookup = TemplateLookup(["templates/documentation"])
-                html_string = Template(tpl.read(), lookup=lookup).render(
-                    target=item,
-                    WEBSITE_LOCATION=WEBSITE_URL,
-                    DOCUMENTATION_PATH=DOC_PATH,
-                    DB_LOCATION=f"{WEBSITE_URL}/{DOC_PATH}/{DB_FILENAME}",
-                    CURRENT_VERSION=CURRENT_VERSION,
-                )
-                pretty_html = BeautifulSoup(html_string, "html.parser").prettify()
-                export.write(pretty_html)
-            except Exception as e:
-                export.write(exceptions.html_error_template().render().decode("utf-8"))
+        try:
+            write_html(export, render_item(item), output_mode)
+        except Exception as e:
+            export.write(exceptions.html_error_template().render().decode("utf-8"))
+
+
+def _document_batch(batch):
+    start = time.perf_counter()
+    indexes, output_mode = batch
+    for index in indexes:
+        document_item(ITEMS_TO_DOCUMENT[index], output_mode)
+    return os.getpid(), len(indexes), time.perf_counter() - start
+
+
+def document_items(
+    items: List[Union[ClassModel, NamespaceModel]],
+    output_mode: str = DOC_OUTPUT_MODE,
+    jobs: int = 1,
+):
+    """Renders the pages of all items, in parallel when jobs > 1
+    Workers are forked so they share the database of the parent process,
+    only the indexes of the items to render are sent to them
+    """
+    global ITEMS_TO_DOCUMENT
+    if jobs > 1 and "fork" not in multiprocessing.get_all_start_methods():
+        log.warning("Parallel rendering requires fork, rendering pages serially")
+        jobs = 1
+    if jobs <= 1:
+        for item in items:
+            document_item(item, output_mode)
+        return
+    # Templates are compiled once before forking instead of once per worker
+    get_template_lookup().get_template("lua_body.mako")
+    ITEMS_TO_DOCUMENT = items
+    batches_count = jobs * BATCHES_PER_WORKER
+    batches = [
+        (range(offset, len(items), batches_count), output_mode)
+        for offset in range(min(batches_count, len(items)))
+    ]
+    timings = defaultdict(lambda: [0, 0.0])
+    with multiprocessing.get_context("fork").Pool(jobs) as pool:
+        for pid, pages, elapsed in pool.imap_unordered(_document_batch, batches):
+            timings[pid][0] += pages
+            timings[pid][1] += elapsed
+    ITEMS_TO_DOCUMENT = []
+    for pid, (pages, elapsed) in timings.items():
+        log.info(f"  Worker {pid} rendered {pages} pages in {elapsed:.2f}s")
@@ -0,0 +1,164 @@
+import gzip
+import hashlib
+import json
+import os
+import shutil
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+from obidog.documentation.config import DOC_PATH, TEMPLATES_PATH, WEBSITE_URL
+from obidog.documentation.search import DefaultEncoder
+
+BUILD_MANIFEST_FILENAME = ".build_manifest.json"
+CHANGED_FILES_FILENAME = ".changed_files.json"
+COMPRESSIONS = ["gz", "br"]
+COMPRESSION_BLOCK_SIZE = 1 << 20
+
+
+def compress_file(path: str, compression: str):
+    with open(path, "rb") as source:
+        if compression == "gz":
+            with gzip.open(f"{path}.gz", "wb") as compressed:
+                shutil.copyfileobj(source, compressed, COMPRESSION_BLOCK_SIZE)
+        elif compression == "br":
+            compressor = brotli.Compressor()
+            with open(f"{path}.br", "wb") as compressed:
+                for block in iter(lambda: source.read(COMPRESSION_BLOCK_SIZE), b""):
+                    compressed.write(compressor.process(block))
+                compressed.write(compressor.finish())
+
+
+def fingerprint_templates():
+    """Hashes every documentation template, any template change invalidates all pages"""
+    templates_hash = hashlib.sha256()
+    for template_name in sorted(os.listdir(TEMPLATES_PATH)):
+        templates_hash.update(template_name.encode("utf-8"))
+        with open(os.path.join(TEMPLATES_PATH, template_name), "rb") as template:
+            templates_hash.update(template.read())
+    return templates_hash.hexdigest()
+
+
+def fingerprint_content(content: str, salt: str = ""):
+    return hashlib.sha256(f"{salt}{content}".encode("utf-8")).hexdigest()
+
+
+def fingerprint_item(item, salt: str):
+    return fingerprint_content(
+        json.dumps(item, cls=DefaultEncoder, sort_keys=True, ensure_ascii=False), salt
+    )
+
+
+def make_build_salt(output_mode: str, current_version: str):
+    return "|".join(
+        [fingerprint_templates(), output_mode, current_version, WEBSITE_URL, DOC_PATH]
+    )
+
+
+def load_build_manifest(export_path: str):
+    manifest_path = os.path.join(export_path, BUILD_MANIFEST_FILENAME)
+    if not os.path.isfile(manifest_path):
+        return {"pages": {}, "files": {}}
+    with open(manifest_path, encoding="utf-8") as manifest:
+        return json.load(manifest)
+
+
+class IncrementalBuild:
+    """Keeps track of the pages and files of a documentation build
+
+    Pages are only rendered again when the fingerprint of their model changed
+    since the previous build, pages that are not produced anymore are deleted.
+    All updated and deleted files are listed in CHANGED_FILES_FILENAME
+    """
+
+    def __init__(self, export_path: str, salt: str, full_rebuild: bool = False):
+        self.export_path = export_path
+        self.salt = salt
+        self.previous = (
+            {"pages": {}, "files": {}}
+            if full_rebuild
+            else load_build_manifest(export_path)
+        )
+        self.pages = {}
+        self.files = {}
+        self.updated = []
+
+    def _is_up_to_date(self, path: str, fingerprint: str, previous_fingerprints):
+        return previous_fingerprints.get(path) == fingerprint and os.path.isfile(
+            os.path.join(self.export_path, path)
+        )
+
+    def select_pages(self, items, get_page_path):
+        """Returns the items whose page has to be rendered again"""
+        to_render = []
+        for item in items:
+            path = os.path.relpath(get_page_path(item), self.export_path).replace(
+                os.path.sep, "/"
+            )
+            fingerprint = fingerprint_item(item, self.salt)
+            self.pages[path] = fingerprint
+            if not self._is_up_to_date(path, fingerprint, self.previous["pages"]):
+                to_render.append(item)
+                self.updated.append(path)
+        return to_render
+
+    def write_chunks(self, path: str, chunks, compressions=()):
+        """Streams a file of the export directory, it is only kept if its content changed
+        Each compression in `compressions` writes a precompressed sibling of the file
+        """
+        full_path = os.path.join(self.export_path, path)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        content_hash = hashlib.sha256()
+        with open(f"{full_path}.tmp", "w", encoding="utf-8") as export:
+            for chunk in chunks:
+                content_hash.update(chunk.encode("utf-8"))
+                export.write(chunk)
+        fingerprint = content_hash.hexdigest()
+        compressed_paths = [f"{path}.{compression}" for compression in compressions]
+        self.files[path] = fingerprint
+        for compressed_path in compressed_paths:
+            self.files[compressed_path] = fingerprint
+        if all(
+            self._is_up_to_date(file_path, fingerprint, self.previous["files"])
+            for file_path in [path] + compressed_paths
+        ):
+            os.remove(f"{full_path}.tmp")
+            return False
+        os.replace(f"{full_path}.tmp", full_path)
+        self.updated.append(path)
+        for compression, compressed_path in zip(compressions, compressed_paths):
+            compress_file(full_path, compression)
+            self.updated.append(compressed_path)
+        return True
+
+    def write_file(self, path: str, content: str):
+        """Writes a file of the export directory unless its content did not change"""
+        return self.write_chunks(path, [content])
+
+    def finish(self):
+        deleted = [
+            path
+            for path in list(self.previous["pages"]) + list(self.previous["files"])
+            if path not in self.pages and path not in self.files
+        ]
+        for path in deleted:
+            full_path = os.path.join(self.export_path, path)
+            if os.path.isfile(full_path):
+                os.remove(full_path)
+        with open(
+            os.path.join(self.export_path, BUILD_MANIFEST_FILENAME),
+            "w",
+            encoding="utf-8",
+        ) as manifest:
+            json.dump({"pages": self.pages, "files": self.files}, manifest, indent=4)
+        with open(
+            os.path.join(self.export_path, CHANGED_FILES_FILENAME),
+            "w",
+            encoding="utf-8",
+        ) as changed_files:
+            json.dump(
+                {"updated": self.updated, "deleted": deleted}, changed_files, indent=4
+            )
+        return self.updated, deleted
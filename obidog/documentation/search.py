@@ -1,73 +1,127 @@
 import json
-import os
+import re
+from collections import defaultdict
+from dataclasses import dataclass
 
 from obidog.databases import CppDatabase
 
+SEARCH_INDEX_VERSION = 1
+# Prefixes longer than this are matched by the client against the candidates' tokens
+SEARCH_INDEX_PREFIX_LENGTH = 3
+SEARCH_TYPES = [
+    "namespace",
+    "class",
+    "function",
+    "method",
+    "enum",
+    "typedef",
+    "global",
+]
+# Must stay in sync with NAME_TOKEN_REG in static/js/search_index.js
+NAME_TOKEN_REG = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|\d+")
+
 
 class DefaultEncoder(json.JSONEncoder):
     def default(self, o):
         return o.__dict__
 
 
-def _make_search_db(cpp_db: CppDatabase):
-    return [
-        item
-        for item_type in cpp_db.__dict__.keys()
-        for item in getattr(cpp_db, item_type).values()
-    ]
-
-
-def _add_overloads(cpp_db: CppDatabase, search_db):
+@dataclass
+class SearchRecord:
+    name: str
+    _type: str
+    namespace: str
+    url: str
+    from_class: str = None
+
+
+def iter_search_records(cpp_db: CppDatabase):
+    """Projects the elements of the database to search records without modifying them"""
+    for items in cpp_db.__dict__.values():
+        for element in items.values():
+            if element._type == "overload":
+                yield SearchRecord(
+                    name=element.name,
+                    _type="function",
+                    namespace=element.overloads[0].namespace,
+                    url=element.overloads[0].urls.documentation,
+                )
+            else:
+                yield SearchRecord(
+                    name=element.name,
+                    _type=element._type,
+                    namespace=getattr(element, "namespace", ""),
+                    url=element.urls.documentation,
+                )
     for class_value in cpp_db.classes.values():
         for method in class_value.methods.values():
             if method._type == "overload":
                 method = method.overloads[0]
-            method.from_class = f"{class_value.namespace}::{class_value.name}"
-            method._type = "method"
-            search_db.append(method)
-
-
-def _strip_namespace_content(search_db):
-    for item in search_db:
-        if item._type == "namespace":
-            for elem in ["typedefs", "globals", "functions", "enums"]:
-                item.__dict__.pop(elem)
-
-
-def _fix_overloads(search_db: CppDatabase):
-    for element in search_db:
-        if element._type == "overload":
-            element.urls = element.overloads[0].urls
-            element._type = "function"
-            element.namespace = element.overloads[0].namespace
-
-
-def _strip_unnecessary_attributes(search_db: CppDatabase):
-    for element in search_db:
-        to_pop = []
-        element.url = element.urls.documentation
-        for attr in element.__dict__:
-            if attr not in ["_type", "name", "namespace", "from_class", "url"]:
-                to_pop.append(attr)
-        for attr in to_pop:
-            element.__dict__.pop(attr)
+            yield SearchRecord(
+                name=method.name,
+                _type="method",
+                namespace=method.namespace,
+                url=method.urls.documentation,
+                from_class=f"{class_value.namespace}::{class_value.name}",
+            )
+
+
+def tokenize_name(name: str):
+    """Splits a name on case changes, underscores and digits, the whole name is a token too"""
+    return {token.lower() for token in NAME_TOKEN_REG.findall(name)} | {name.lower()}
+
+
+def _delta_encode(ids):
+    previous = 0
+    encoded = []
+    for current in ids:
+        encoded.append(current - previous)
+        previous = current
+    return encoded
+
+
+def make_search_index(search_records):
+    """Builds a compact search index out of the search records
+
+    Records are stored as [name, type, namespace, url directory, url file, class]
+    with the type, namespace and url directory replaced by indexes in lookup tables.
+    Prefixes of every name token map to the sorted, delta-encoded ids of the records.
+    """
+    namespaces = {}
+    url_directories = {}
+    records = []
+    prefixes = defaultdict(set)
+    for record_id, search_record in enumerate(search_records):
+        url_directory, _, url_file = (search_record.url or "").rpartition("/")
+        record = [
+            search_record.name,
+            SEARCH_TYPES.index(search_record._type),
+            namespaces.setdefault(search_record.namespace, len(namespaces)),
+            url_directories.setdefault(url_directory, len(url_directories)),
+            url_file,
+        ]
+        if search_record.from_class:
+            record.append(search_record.from_class.split("::")[-1])
+        records.append(record)
+        for token in tokenize_name(search_record.name):
+            for length in range(1, min(len(token), SEARCH_INDEX_PREFIX_LENGTH) + 1):
+                prefixes[token[:length]].add(record_id)
+    return {
+        "version": SEARCH_INDEX_VERSION,
+        "prefix_length": SEARCH_INDEX_PREFIX_LENGTH,
+        "types": SEARCH_TYPES,
+        "namespaces": list(namespaces),
+        "url_directories": list(url_directories),
+        "records": records,
+        "prefixes": {
+            prefix: _delta_encode(sorted(ids)) for prefix, ids in sorted(prefixes.items())
+        },
+    }
 
 
 def generate_search_db(cpp_db: CppDatabase):
-    search_db = _make_search_db(cpp_db)
-    _add_overloads(cpp_db, search_db)
-    _strip_namespace_content(search_db)
-    _fix_overloads(search_db)
-    _strip_unnecessary_attributes(search_db)
-
-    with open(
-        os.path.join("export", "search.json"), "w", encoding="utf-8"
-    ) as db_export:
-
-        json.dump(
-            search_db,
-            db_export,
-            indent=4,
-            ensure_ascii=False,
-            cls=DefaultEncoder,
-        )
+    return json.dumps(
+        make_search_index(iter_search_records(cpp_db)),
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
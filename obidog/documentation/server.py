@@ -0,0 +1,223 @@
+import hashlib
+import mimetypes
+import os
+import posixpath
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Dict, List, Union
+from urllib.parse import unquote, urlsplit
+
+from obidog.databases import CppDatabase
+from obidog.documentation.config import DOC_PATH, WEBSITE_URL
+from obidog.documentation.database import (
+    DB_MANIFEST_FILENAME,
+    DB_SHARDS_DIRECTORY,
+    iter_compact_json,
+    make_database_shards,
+)
+from obidog.config import OBENGINE_GIT_REF
+from obidog.documentation.documentation import (
+    CURRENT_VERSION,
+    DB_FILENAME,
+    VERSIONS_FILENAME,
+    get_page_path,
+    render_page,
+)
+from obidog.documentation.search import generate_search_db
+from obidog.documentation.versions import make_versions_file
+from obidog.logger import log
+from obidog.models.classes import ClassModel
+from obidog.models.namespace import NamespaceModel
+
+STATIC_PATH = "static"
+PRODUCTION_URL = f"https://{WEBSITE_URL}/{DOC_PATH}"
+
+
+def make_etag(content: bytes):
+    return f'"{hashlib.sha1(content).hexdigest()}"'
+
+
+class PageCache:
+    """Thread-safe LRU cache of rendered pages, each page is stored with its ETag"""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.pages = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, path: str, render):
+        with self.lock:
+            if path in self.pages:
+                self.hits += 1
+                self.pages.move_to_end(path)
+                return self.pages[path]
+            self.misses += 1
+        # Rendering happens outside of the lock so other pages can be served meanwhile
+        content = render()
+        page = (content, make_etag(content))
+        with self.lock:
+            self.pages[path] = page
+            self.pages.move_to_end(path)
+            while len(self.pages) > self.max_size:
+                self.pages.popitem(last=False)
+        return page
+
+
+class DocumentationSite:
+    """Serves the documentation of a converted database with the layout of the export directory
+
+    Pages are rendered on demand, the search index and database shards are built once.
+    Links to the production website are rewritten to `base_url`
+    """
+
+    def __init__(
+        self,
+        cpp_db: CppDatabase,
+        pages: List[Union[ClassModel, NamespaceModel]],
+        base_url: str,
+        output_mode: str,
+        cache_size: int,
+    ):
+        self.base_url = base_url
+        self.output_mode = output_mode
+        self.pages = {
+            os.path.relpath(get_page_path(item), "export").replace(
+                os.path.sep, "/"
+            ): item
+            for item in pages
+        }
+        self.page_cache = PageCache(cache_size)
+        self.files = {
+            DB_FILENAME: self._make_file(generate_search_db(cpp_db)),
+            VERSIONS_FILENAME: self._make_file(
+                make_versions_file([(OBENGINE_GIT_REF, CURRENT_VERSION, "./")])
+            ),
+        }
+        shards, manifest = make_database_shards(cpp_db)
+        for shard_path, shard in shards.items():
+            self.files[shard_path] = self._make_file("".join(iter_compact_json(shard)))
+        self.files[f"{DB_SHARDS_DIRECTORY}/{DB_MANIFEST_FILENAME}"] = self._make_file(
+            "".join(iter_compact_json(manifest))
+        )
+
+    def _localize(self, content: str):
+        return content.replace(PRODUCTION_URL, f"{self.base_url}/{DOC_PATH}")
+
+    def _make_file(self, content: str):
+        content = self._localize(content).encode("utf-8")
+        return content, make_etag(content)
+
+    def _render_page(self, item: Union[ClassModel, NamespaceModel]):
+        return self._localize(render_page(item, self.output_mode)).encode("utf-8")
+
+    def resolve(self, path: str):
+        """Returns the content, ETag and content type of a path relative to DOC_PATH
+        or None if nothing is served at this path
+        """
+        if path == "" or path.endswith("/"):
+            path = f"{path}index.html"
+        elif path not in self.pages and f"{path}/index.html" in self.pages:
+            # Links to namespaces (see get_documentation_url) have no trailing slash
+            path = f"{path}/index.html"
+        if path in self.pages:
+            content, etag = self.page_cache.get(
+                path, lambda: self._render_page(self.pages[path])
+            )
+            return content, etag, "text/html; charset=utf-8"
+        if path in self.files:
+            content, etag = self.files[path]
+            return content, etag, "application/json"
+        if path.startswith(f"{STATIC_PATH}/"):
+            static_path = os.path.join(STATIC_PATH, *path.split("/")[1:])
+            if os.path.isfile(static_path):
+                with open(static_path, "rb") as static_file:
+                    content = static_file.read()
+                content_type = mimetypes.guess_type(static_path)[0]
+                return (
+                    content,
+                    make_etag(content),
+                    content_type or "application/octet-stream",
+                )
+        return None
+
+
+class DocumentationRequestHandler(BaseHTTPRequestHandler):
+    # Set on the handler class created by serve_documentation
+    site: DocumentationSite = None
+
+    def _send(self, status, headers: Dict[str, str], content: bytes = b""):
+        self.send_response(status)
+        for header, value in headers.items():
+            self.send_header(header, value)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(content)
+
+    def do_GET(self):
+        path = posixpath.normpath(unquote(urlsplit(self.path).path))
+        prefix = f"/{DOC_PATH}"
+        if path in ("/", prefix):
+            self._send(
+                HTTPStatus.MOVED_PERMANENTLY, {"Location": f"{prefix}/index.html"}
+            )
+            return
+        resolved = (
+            self.site.resolve(path[len(prefix) + 1 :])
+            if path.startswith(f"{prefix}/")
+            else None
+        )
+        if resolved is None:
+            self._send(
+                HTTPStatus.NOT_FOUND, {"Content-Type": "text/plain"}, b"Not found"
+            )
+            return
+        content, etag, content_type = resolved
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if etag in self.headers.get("If-None-Match", ""):
+            self._send(HTTPStatus.NOT_MODIFIED, headers)
+            return
+        headers["Content-Type"] = content_type
+        self._send(HTTPStatus.OK, headers, content)
+
+    do_HEAD = do_GET
+
+    def log_message(self, format, *args):
+        log.debug(f"{self.address_string()} {format % args}")
+
+
+class ThreadPoolHTTPServer(HTTPServer):
+    """Handles requests with a fixed pool of threads instead of one thread per request"""
+
+    def __init__(self, server_address, handler_class, threads: int):
+        super().__init__(server_address, handler_class)
+        self.executor = ThreadPoolExecutor(max_workers=threads)
+
+    def process_request(self, request, client_address):
+        self.executor.submit(self._process_request_thread, request, client_address)
+
+    def _process_request_thread(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self):
+        super().server_close()
+        self.executor.shutdown(wait=True)
+
+
+def make_documentation_server(
+    site: DocumentationSite, host: str, port: int, threads: int
+):
+    handler_class = type(
+        "DocumentationRequestHandler", (DocumentationRequestHandler,), {"site": site}
+    )
+    return ThreadPoolHTTPServer((host, port), handler_class, threads)
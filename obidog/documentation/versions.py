@@ -0,0 +1,160 @@
+import hashlib
+import json
+import os
+import re
+import shutil
+
+from obidog.documentation.config import DOC_PATH, WEBSITE_URL
+
+STORE_DIRECTORY = ".store"
+STORE_OBJECTS_DIRECTORY = "objects"
+STORE_MANIFESTS_DIRECTORY = "manifests"
+STORE_RENDERED_FILENAME = "rendered.json"
+DOCUMENTATION_ROOT = f"https://{WEBSITE_URL}/{DOC_PATH}"
+# The documentation root followed by a path or by anything that can't continue a URL
+DOCUMENTATION_URL_REG = re.compile(re.escape(DOCUMENTATION_ROOT) + r"(/|(?![\w.~%/-]))")
+
+
+def parse_version_spec(version_spec: str):
+    """`ref` or `ref:name`, the name of a version defaults to its ref"""
+    ref, _, name = version_spec.partition(":")
+    return ref, name or ref
+
+
+def make_links_relative(html_string: str, page_path: str):
+    """Rewrites the links to the documentation relatively to the page
+    so identical pages of different versions are identical files
+    """
+    root = "../" * page_path.count("/")
+    return DOCUMENTATION_URL_REG.sub(
+        lambda match: root if match.group(1) else root or "./", html_string
+    )
+
+
+def make_links_versioned(content: str, version: str):
+    return DOCUMENTATION_URL_REG.sub(
+        lambda match: f"{DOCUMENTATION_ROOT}/{version}{match.group(1)}", content
+    )
+
+
+def make_versions_file(versions):
+    """Content of the versions.json read by the version selector (static/js/version_selector.js)
+
+    `versions` are (ref, name, path) with `path` the directory of the version
+    relative to the directory of the versions.json
+    """
+    return json.dumps(
+        {
+            "versions": [
+                {"name": name, "ref": ref, "path": path} for ref, name, path in versions
+            ]
+        },
+        indent=4,
+    )
+
+
+class ContentStore:
+    """Stores each distinct file of all versions once, named after the hash of its content
+
+    Each version has a manifest (path => object) from which its directory is linked.
+    The object of each rendered page is remembered by the fingerprint of its model
+    so the pages that did not change are not rendered again for the next versions
+    """
+
+    def __init__(self, export_path: str):
+        self.export_path = export_path
+        self.path = os.path.join(export_path, STORE_DIRECTORY)
+        os.makedirs(os.path.join(self.path, STORE_OBJECTS_DIRECTORY), exist_ok=True)
+        os.makedirs(os.path.join(self.path, STORE_MANIFESTS_DIRECTORY), exist_ok=True)
+        rendered_path = os.path.join(self.path, STORE_RENDERED_FILENAME)
+        self.rendered = {}
+        if os.path.isfile(rendered_path):
+            with open(rendered_path, encoding="utf-8") as rendered:
+                self.rendered = json.load(rendered)
+
+    def get_object_path(self, object_id: str):
+        return os.path.join(
+            self.path, STORE_OBJECTS_DIRECTORY, object_id[:2], object_id[2:]
+        )
+
+    def put(self, content: bytes):
+        object_id = hashlib.sha256(content).hexdigest()
+        object_path = self.get_object_path(object_id)
+        if not os.path.isfile(object_path):
+            os.makedirs(os.path.dirname(object_path), exist_ok=True)
+            with open(f"{object_path}.tmp", "wb") as store_object:
+                store_object.write(content)
+            os.replace(f"{object_path}.tmp", object_path)
+        return object_id
+
+    def find_rendered(self, fingerprint: str):
+        object_id = self.rendered.get(fingerprint)
+        if object_id and os.path.isfile(self.get_object_path(object_id)):
+            return object_id
+        return None
+
+    def put_rendered(self, fingerprint: str, content: bytes):
+        object_id = self.put(content)
+        self.rendered[fingerprint] = object_id
+        return object_id
+
+    def load_manifests(self):
+        manifests_path = os.path.join(self.path, STORE_MANIFESTS_DIRECTORY)
+        manifests = {}
+        for manifest_name in sorted(os.listdir(manifests_path)):
+            with open(
+                os.path.join(manifests_path, manifest_name), encoding="utf-8"
+            ) as manifest:
+                manifests[os.path.splitext(manifest_name)[0]] = json.load(manifest)
+        return manifests
+
+    def write_manifest(self, version: str, manifest):
+        with open(
+            os.path.join(self.path, STORE_MANIFESTS_DIRECTORY, f"{version}.json"),
+            "w",
+            encoding="utf-8",
+        ) as manifest_file:
+            json.dump(manifest, manifest_file, indent=4, sort_keys=True)
+
+    def link_version(self, version: str, manifest):
+        """(Re)creates the directory of a version with hard links to the store objects"""
+        version_path = os.path.join(self.export_path, version)
+        shutil.rmtree(version_path, ignore_errors=True)
+        for path, object_id in manifest["files"].items():
+            file_path = os.path.join(version_path, *path.split("/"))
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            try:
+                os.link(self.get_object_path(object_id), file_path)
+            except OSError:
+                shutil.copyfile(self.get_object_path(object_id), file_path)
+
+    def remove_version(self, version: str):
+        shutil.rmtree(os.path.join(self.export_path, version), ignore_errors=True)
+        os.remove(os.path.join(self.path, STORE_MANIFESTS_DIRECTORY, f"{version}.json"))
+
+    def collect_garbage(self):
+        """Deletes the objects that are not used by any manifest, returns their count"""
+        used_objects = {
+            object_id
+            for manifest in self.load_manifests().values()
+            for object_id in manifest["files"].values()
+        }
+        self.rendered = {
+            fingerprint: object_id
+            for fingerprint, object_id in self.rendered.items()
+            if object_id in used_objects
+        }
+        deleted = 0
+        objects_path = os.path.join(self.path, STORE_OBJECTS_DIRECTORY)
+        for prefix in os.listdir(objects_path):
+            for suffix in os.listdir(os.path.join(objects_path, prefix)):
+                if f"{prefix}{suffix}" not in used_objects:
+                    os.remove(os.path.join(objects_path, prefix, suffix))
+                    deleted += 1
+        return deleted
+
+    def save(self):
+        with open(
+            os.path.join(self.path, STORE_RENDERED_FILENAME), "w", encoding="utf-8"
+        ) as rendered:
+            json.dump(self.rendered, rendered, indent=4, sort_keys=True)
@@ -1,17 +1,53 @@
 import argparse
-import json
+import copy
 import os
 import tempfile
 
 import requests
 
 from obidog.bindings.generator import generate_bindings
+from obidog.config import OBENGINE_GIT_REF, set_obengine_git_directory
 from obidog.converters.lua.namespace import group_bindings_by_namespace
 from obidog.converters.lua.types import convert_all_types
 from obidog.converters.lua.urls import fill_element_urls
-from obidog.databases import CppDatabase, LuaDatabase
-from obidog.documentation.documentation import document_item
-from obidog.documentation.search import DefaultEncoder, generate_search_db
+from obidog.databases import CppDatabase
+from obidog.documentation.config import DOC_OUTPUT_MODE, DOC_PATH
+from obidog.documentation.documentation import (
+    CURRENT_VERSION,
+    DB_FILENAME,
+    OUTPUT_MODES,
+    VERSIONS_FILENAME,
+    document_items,
+    get_page_path,
+    render_page,
+)
+from obidog.documentation.database import (
+    DB_MANIFEST_FILENAME,
+    DB_SHARDS_DIRECTORY,
+    export_database,
+    export_database_shards,
+    iter_compact_json,
+    make_database_shards,
+)
+from obidog.documentation.incremental import (
+    COMPRESSIONS,
+    IncrementalBuild,
+    fingerprint_item,
+    make_build_salt,
+)
+from obidog.documentation.search import generate_search_db
+from obidog.documentation.server import (
+    STATIC_PATH,
+    DocumentationSite,
+    make_documentation_server,
+)
+from obidog.documentation.versions import (
+    ContentStore,
+    make_links_relative,
+    make_links_versioned,
+    make_versions_file,
+    parse_version_spec,
+)
 from obidog.generators.cpp_lua_merge import (
     mix_cpp_lua_doc,
     transform_all_cpp_types_to_lua_types,
@@ -20,29 +56,236 @@ from obidog.generators.doc_class_generator import generate
 from obidog.logger import log
 from obidog.parsers.cpp_parser import parse_doxygen_files
 from obidog.parsers.doxygen_index_parser import parse_doxygen_index
+from obidog.parsers.includes_parser import parse_doxygen_includes
+from obidog.watch import WarmDatabase, watch_obengine
 from obidog.wrappers.doxygen_wrapper import build_doxygen_documentation
-from obidog.wrappers.git_wrapper import check_git_directory
+from obidog.wrappers.git_wrapper import (
+    check_git_directory,
+    checkout_obengine_repo,
+    get_sources_revision,
+)
 from obidog.models.functions import FunctionModel, FunctionOverloadModel
 
 
-def main():
-    parser = argparse.ArgumentParser()
-    # Starting Obidog
-    log.info("Obidog starting...")
+def prepare_documentation(
+    cpp_db,
+    doxygen_index,
+    include_graph,
+    args,
+    write_bindings,
+    previous_bindings_run=None,
+):
+    """Converts the database for the documentation
+    Returns the items that get a page and the BindingsRun of the bindings generation
+    """
+    log.info("Preparing database")
+    bindings_results, bindings_run = generate_bindings(
+        cpp_db,
+        write_bindings,
+        flatten_inheritance=args.flatten_inheritance,
+        include_graph=include_graph,
+        previous_run=previous_bindings_run,
+    )
 
+    log.info("Converting all types")
+    convert_all_types(cpp_db)
+
+    all_elements = [
+        item
+        for item_type in cpp_db.__dict__.keys()
+        for item in getattr(cpp_db, item_type).values()
+        if not item.flags.nobind
+    ] + [
+        method
+        for class_value in cpp_db.classes.values()
+        for method in class_value.methods.values()
+        if not method.flags.nobind
+    ]
+    log.info("Retrieving urls for all elements")
+    for element in all_elements:
+        fill_element_urls(
+            element, doxygen_index=doxygen_index, bindings_results=bindings_results
+        )
+
+    log.info("Grouping namespace")
+    namespaces = group_bindings_by_namespace(cpp_db)
+    pages = [
+        namespace_value
+        for namespace_value in namespaces.values()
+        if not namespace_value.flags.nobind
+    ] + [
+        class_value
+        for class_value in cpp_db.classes.values()
+        if not class_value.flags.nobind
+    ]
+    return pages, bindings_run
+
+
+def build_documentation(
+    cpp_db, doxygen_index, include_graph, args, previous_bindings_run=None
+):
+    pages, bindings_run = prepare_documentation(
+        cpp_db,
+        doxygen_index,
+        include_graph,
+        args,
+        True,  # TODO: Don't forget to put this to false !
+        previous_bindings_run,
+    )
+    os.makedirs("export", exist_ok=True)
+    build = IncrementalBuild(
+        "export",
+        make_build_salt(args.html_output, CURRENT_VERSION),
+        full_rebuild=args.full_rebuild,
+    )
+    log.info("Generate namespaces and classes documentation")
+    pages_to_render = build.select_pages(pages, get_page_path)
+    log.info(f"{len(pages_to_render)} pages changed out of {len(pages)}")
+    document_items(pages_to_render, output_mode=args.html_output, jobs=args.jobs)
+
+    log.info("Generate full database")
+    if args.single_db:
+        export_database(cpp_db, build)
+    else:
+        export_database_shards(cpp_db, build, args.db_compression)
+
+    log.info("Generate search database")
+    build.write_file("search.json", generate_search_db(cpp_db))
+    build.write_file(
+        VERSIONS_FILENAME,
+        make_versions_file([(OBENGINE_GIT_REF, CURRENT_VERSION, "./")]),
+    )
+
+    updated, deleted = build.finish()
+    log.info(f"{len(updated)} files updated and {len(deleted)} deleted")
+    return bindings_run
+
+
+def build_bindings(cpp_db, include_graph, args, previous_bindings_run=None):
+    _, bindings_run = generate_bindings(
+        cpp_db,
+        flatten_inheritance=args.flatten_inheritance,
+        include_graph=include_graph,
+        previous_run=previous_bindings_run,
+    )
+    return bindings_run
+
+
+def serve_documentation(cpp_db, doxygen_index, include_graph, args):
+    pages, _ = prepare_documentation(cpp_db, doxygen_index, include_graph, args, False)
+    site = DocumentationSite(
+        cpp_db,
+        pages,
+        f"http://{args.host}:{args.port}",
+        args.html_output,
+        args.cache_size,
+    )
+    server = make_documentation_server(site, args.host, args.port, args.threads)
+    log.info(
+        f"Serving {len(pages)} documentation pages on "
+        f"http://{args.host}:{args.port}/{DOC_PATH}/index.html"
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def load_obengine_database(path_to_obengine, parse_cache=None):
     # Creating databases
     cpp_db = CppDatabase()
-    lua_db = LuaDatabase()
-
-    # Checking OBENGINE_GIT_DIRECTORY
-    path_to_obengine = check_git_directory()
 
     # Generating Doxygen documentation
     log.info("Building Doxygen XML documentation...")
     path_to_doc = build_doxygen_documentation(path_to_obengine)
 
     # Processing all files in Doxygen documentation
-    parse_doxygen_files(path_to_doc, cpp_db)
+    parse_doxygen_files(path_to_doc, cpp_db, parse_cache)
+    index_path = os.path.join(path_to_doc, "docbuild", "xml", "index.xml")
+    return cpp_db, parse_doxygen_index(index_path), parse_doxygen_includes(index_path)
+
+
+def build_versions(args):
+    """Builds the documentation of several ÖbEngine refs side by side in export/<version>
+    Files are deduplicated in a content-addressed store, parse results and
+    rendered pages are reused between versions whose sources or models did not change
+    """
+    versions = [parse_version_spec(version_spec) for version_spec in args.versions]
+    store = ContentStore("export")
+    salt = make_build_salt(args.html_output, "")
+    versions_file = make_versions_file(
+        [(ref, name, f"../{name}/") for ref, name in versions]
+    ).encode("utf-8")
+    parsed_sources = {}
+    parse_cache = {}
+    for ref, name in versions:
+        log.info(f"===== Building documentation of ÖbEngine {ref} as {name} =====")
+        path_to_obengine = set_obengine_git_directory(checkout_obengine_repo(ref))
+        commit, sources_revision = get_sources_revision(path_to_obengine)
+        if sources_revision in parsed_sources:
+            log.info("Sources did not change since a previous version, reusing them")
+        else:
+            parsed_sources[sources_revision] = load_obengine_database(
+                path_to_obengine, parse_cache
+            )
+        cpp_db, doxygen_index, include_graph = copy.deepcopy(
+            parsed_sources[sources_revision]
+        )
+        pages, _ = prepare_documentation(
+            cpp_db, doxygen_index, include_graph, args, False
+        )
+        files = {}
+        rendered_pages = 0
+        for page in pages:
+            page_path = os.path.relpath(get_page_path(page), "export").replace(
+                os.path.sep, "/"
+            )
+            fingerprint = fingerprint_item(page, salt)
+            object_id = store.find_rendered(fingerprint)
+            if object_id is None:
+                html_string = render_page(page, args.html_output, current_version="")
+                object_id = store.put_rendered(
+                    fingerprint,
+                    make_links_relative(html_string, page_path).encode("utf-8"),
+                )
+                rendered_pages += 1
+            files[page_path] = object_id
+        log.info(f"{rendered_pages} pages rendered out of {len(pages)}")
+        files[DB_FILENAME] = store.put(
+            make_links_versioned(generate_search_db(cpp_db), name).encode("utf-8")
+        )
+        shards, shards_manifest = make_database_shards(cpp_db)
+        shards[f"{DB_SHARDS_DIRECTORY}/{DB_MANIFEST_FILENAME}"] = shards_manifest
+        for shard_path, shard in shards.items():
+            files[shard_path] = store.put(
+                make_links_versioned("".join(iter_compact_json(shard)), name).encode(
+                    "utf-8"
+                )
+            )
+        for static_dir, _, static_files in os.walk(STATIC_PATH):
+            for static_file in static_files:
+                static_path = os.path.join(static_dir, static_file)
+                with open(static_path, "rb") as static_content:
+                    files[static_path.replace(os.path.sep, "/")] = store.put(
+                        static_content.read()
+                    )
+        files[VERSIONS_FILENAME] = store.put(versions_file)
+        manifest = {"ref": ref, "commit": commit, "files": files}
+        store.write_manifest(name, manifest)
+        store.link_version(name, manifest)
+    for stale_version in set(store.load_manifests()) - {name for _, name in versions}:
+        log.info(f"Removing version {stale_version} which is not built anymore")
+        store.remove_version(stale_version)
+    log.info(f"{store.collect_garbage()} unused files removed from the store")
+    store.save()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    # Starting Obidog
+    log.info("Obidog starting...")
 
     cwd = tempfile.mkdtemp()
     log.info(f"Working directory : {cwd}")
@@ -50,68 +293,100 @@ def main():
     parser.add_argument(
         "mode",
         help="Resource you want to generate",
-        choices=["documentation", "bindings"],
+        choices=["documentation", "bindings", "watch", "serve", "versions"],
+    )
+    parser.add_argument(
+        "--flatten-inheritance",
+        action="store_true",
+        help="Register inherited methods and attributes directly on derived classes",
+    )
+    parser.add_argument(
+        "--html-output",
+        choices=OUTPUT_MODES,
+        default=DOC_OUTPUT_MODE,
+        help="How documentation pages are written (whitespace and comments are stripped when minified)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count(),
+        help="Number of processes used to render documentation pages",
+    )
+    parser.add_argument(
+        "--full-rebuild",
+        action="store_true",
+        help="Render all documentation pages, even those that did not change since the last build",
+    )
+    parser.add_argument(
+        "--single-db",
+        action="store_true",
+        help="Export the full database as a single db.json instead of one file per namespace",
+    )
+    parser.add_argument(
+        "--db-compression",
+        nargs="*",
+        choices=COMPRESSIONS,
+        default=[],
+        help="Precompressed copies to generate next to each database shard",
+    )
+    parser.add_argument(
+        "--watch-interval",
+        type=float,
+        default=1.0,
+        help="Seconds between two checks of the headers in watch mode when inotify is not available",
+    )
+    parser.add_argument(
+        "--host", default="localhost", help="Address the documentation is served on"
+    )
+    parser.add_argument(
+        "--port", type=int, default=8000, help="Port the documentation is served on"
+    )
+    parser.add_argument(
+        "--threads",
+        type=int,
+        default=8,
+        help="Number of threads handling requests in serve mode",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=256,
+        help="Number of rendered pages kept in memory in serve mode",
+    )
+    parser.add_argument(
+        "--versions",
+        nargs="+",
+        default=[],
+        help="ÖbEngine refs to document in versions mode, as ref or ref:name",
     )
     args = parser.parse_args()
 
-    if args.mode == "documentation":
-        doxygen_index = parse_doxygen_index(
-            os.path.join(path_to_doc, "docbuild", "xml", "index.xml")
-        )
-        log.info("Preparing database")
-        bindings_results = generate_bindings(
-            cpp_db, True
-        )  # TODO: Don't forget to put this to false !
-
-        log.info("Converting all types")
-        convert_all_types(cpp_db)
-
-        all_elements = [
-            item
-            for item_type in cpp_db.__dict__.keys()
-            for item in getattr(cpp_db, item_type).values()
-            if not item.flags.nobind
-        ] + [
-            method
-            for class_value in cpp_db.classes.values()
-            for method in class_value.methods.values()
-            if not method.flags.nobind
-        ]
-        log.info("Retrieving urls for all elements")
-        for element in all_elements:
-            fill_element_urls(
-                element, doxygen_index=doxygen_index, bindings_results=bindings_results
-            )
-
-        log.info("Grouping namespace")
-        namespaces = group_bindings_by_namespace(cpp_db)
-        log.info("Generate namespaces documentation")
-        for namespace_value in namespaces.values():
-            if not namespace_value.flags.nobind:
-                document_item(namespace_value)
-
-        log.info("Generate classes documentation")
-        for class_value in cpp_db.classes.values():
-            if not class_value.flags.nobind:
-                document_item(class_value)
-
-        log.info("Generate full database")
-        with open(
-            os.path.join("export", "db.json"), "w", encoding="utf-8"
-        ) as db_export:
-            json.dump(
-                cpp_db.__dict__,
-                db_export,
-                indent=4,
-                ensure_ascii=False,
-                cls=DefaultEncoder,
-            )
-
-        log.info("Generate search database")
-        generate_search_db(cpp_db)
+    if args.mode == "versions":
+        build_versions(args)
+        return
 
+    # Checking OBENGINE_GIT_DIRECTORY
+    path_to_obengine = check_git_directory()
+    cpp_db, doxygen_index, include_graph = load_obengine_database(path_to_obengine)
+    if args.mode == "documentation":
+        build_documentation(cpp_db, doxygen_index, include_graph, args)
     elif args.mode == "bindings":
-        generate_bindings(cpp_db)
+        build_bindings(cpp_db, include_graph, args)
+    elif args.mode == "watch":
+        watch_obengine(
+            path_to_obengine,
+            WarmDatabase(cpp_db, doxygen_index, include_graph),
+            lambda warm_db, previous_run: build_documentation(
+                warm_db.cpp_db,
+                warm_db.doxygen_index,
+                warm_db.include_graph,
+                args,
+                previous_run,
+            ),
+            args.watch_interval,
+        )
+    elif args.mode == "serve":
+        serve_documentation(cpp_db, doxygen_index, include_graph, args)
 
 
 if __name__ == "__main__":
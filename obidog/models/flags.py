@@ -16,3 +16,5 @@ class ObidogFlagsModel(BaseModel):
     copy_parent_items: bool = False
     proxy: bool = False
     noconstructor: bool = False
+    noflatten: bool = False
+    fast: bool = False
@@ -1,7 +1,9 @@
 import os
 import re
 
-from obidog.config import BINDINGS_SOURCES_LOCATION, PATH_TO_OBENGINE
+from obidog import config
+from obidog.config import BINDINGS_SOURCES_LOCATION
+from obidog.logger import log
 
 
 def CLASS_BINDING_REG(identifier, class_name, namespace):
@@ -28,7 +30,17 @@ def ENUM_BINDING_REG(identifier, namespace):
 
 
 def find_binding_location(location: str, element):
-    full_path = os.path.join(PATH_TO_OBENGINE, BINDINGS_SOURCES_LOCATION, location)
+    if element._type == "typedef":
+        return 1  # Typedefs are not yet exposed to the Lua VM
+    elif element._type == "namespace":
+        return 1  # The whole file is the namespace, go to line 1
+    full_path = os.path.join(
+        config.PATH_TO_OBENGINE, BINDINGS_SOURCES_LOCATION, location
+    )
+    if not os.path.isfile(full_path):
+        # Bindings that were generated but not written (yet)
+        log.debug(f"Bindings source {full_path} not found for {element.name}")
+        return 1
     with open(full_path, encoding="utf-8") as bindings_source_file:
         bindings = bindings_source_file.read()
     identifier = re.escape(
@@ -42,10 +54,6 @@ def find_binding_location(location: str, element):
             bindings,
             re.DOTALL | re.MULTILINE,
         )
-    elif element._type == "typedef":
-        return 1  # Typedefs are not yet exposed to the Lua VM
-    elif element._type == "namespace":
-        return 1  # The whole file is the namespace, go to line 1
     elif element._type == "function":
         if hasattr(element, "from_class"):
             search_result = re.search(
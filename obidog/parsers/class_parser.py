@@ -1,6 +1,5 @@
 import os
 
-from obidog.config import PATH_TO_OBENGINE
 from obidog.exceptions import ParameterNameNotFoundInXMLException
 from obidog.models.classes import AttributeModel, ClassBaseModel, ClassModel
 from obidog.models.flags import ObidogFlagsModel
@@ -12,7 +11,7 @@ from obidog.models.functions import (
 from obidog.models.qualifiers import QualifiersModel
 from obidog.parsers.function_parser import parse_function_from_xml
 from obidog.parsers.location_parser import parse_doxygen_location
-from obidog.parsers.obidog_parser import CONFLICTS, parse_obidog_flags
+from obidog.parsers.obidog_parser import parse_obidog_flags
 from obidog.parsers.utils.doxygen_utils import doxygen_refid_to_cpp_name
 from obidog.parsers.utils.xml_utils import (
     extract_xml_value,
@@ -21,7 +20,7 @@ from obidog.parsers.utils.xml_utils import (
 )
 
 
-def parse_methods(class_name, class_value):
+def parse_methods(class_name, class_value, conflicts):
     methods = {}
     constructors = []
     destructor = None
@@ -34,7 +33,7 @@ def parse_methods(class_name, class_value):
     if not all_methods:
         return methods, constructors, destructor
     for xml_method in all_methods:
-        method = parse_function_from_xml(xml_method, method=True)
+        method = parse_function_from_xml(xml_method, conflicts, method=True)
         method.from_class = class_name
         # Method has class name => Constructor
         if method.name == class_name and isinstance(method, FunctionModel):
@@ -59,12 +58,15 @@ def parse_methods(class_name, class_value):
                     overload.overloads.append(method)
                     if method.flags.bind_to:
                         overload.flags.bind_to = method.bind_to
+                    if method.flags.fast:
+                        overload.flags.fast = True
                 else:
                     methods[method.name] = FunctionOverloadModel(
                         name=method.name,
                         overloads=[overload, method],
                         flags=ObidogFlagsModel(
-                            bind_to=overload.flags.bind_to or method.flags.bind_to
+                            bind_to=overload.flags.bind_to or method.flags.bind_to,
+                            fast=overload.flags.fast or method.flags.fast,
                         ),
                     )
 
@@ -103,7 +105,7 @@ def parse_attributes(class_value):
     return attributes
 
 
-def parse_class_from_xml(class_value):
+def parse_class_from_xml(class_value, conflicts):
     nobind = False
     class_name = extract_xml_value(class_value, "compoundname")
     namespace_name, class_name = (
@@ -133,13 +135,14 @@ def parse_class_from_xml(class_value):
     description = extract_xml_value(class_value, "briefdescription/para")
 
     methods, constructors, destructor = parse_methods(
-        class_name.split("::")[-1], class_value
+        class_name.split("::")[-1], class_value, conflicts
     )
     attributes = parse_attributes(class_value)
     flags = parse_obidog_flags(class_value)
     flags.nobind = flags.nobind or nobind
 
-    CONFLICTS.append(class_name, class_value)
+    location = parse_doxygen_location(class_value)
+    conflicts.append(class_name, "class", location)
     return ClassModel(
         name=class_name,
         namespace=namespace_name,
@@ -151,5 +154,5 @@ def parse_class_from_xml(class_value):
         methods=methods,
         flags=flags,
         description=description,
-        location=parse_doxygen_location(class_value),
+        location=location,
     )
@@ -1,3 +1,5 @@
+import copy
+import hashlib
 import os
 
 from lxml import etree
@@ -5,10 +7,34 @@ from obidog.config import SOURCE_DIRECTORIES
 from obidog.logger import log
 from obidog.parsers.class_parser import parse_class_from_xml
 from obidog.parsers.namespace_parser import parse_namespace_from_xml
+from obidog.parsers.obidog_parser import ConflictsManager
 from obidog.wrappers.onlinedoc_wrapper import class_name_to_doc_link
 
 
-def parse_doxygen_files(path_to_doc, cpp_db):
+def _parse_class_file(class_filepath, parse_cache, conflicts):
+    if parse_cache is None:
+        tree = etree.parse(class_filepath)
+        return parse_class_from_xml(tree.xpath("/doxygen/compounddef")[0], conflicts)
+    with open(class_filepath, "rb") as class_file:
+        class_xml = class_file.read()
+    xml_hash = hashlib.sha256(class_xml).hexdigest()
+    if xml_hash not in parse_cache:
+        tree = etree.fromstring(class_xml)
+        parse_cache[xml_hash] = parse_class_from_xml(
+            tree.xpath("/doxygen/compounddef")[0], conflicts
+        )
+        return copy.deepcopy(parse_cache[xml_hash])
+    class_model = copy.deepcopy(parse_cache[xml_hash])
+    conflicts.append(class_model.name, "class", class_model.location)
+    return class_model
+
+
+def parse_doxygen_files(path_to_doc, cpp_db, parse_cache=None):
+    """Parses all Doxygen XML files into the database
+    Classes whose XML is found in `parse_cache` (XML hash => class) are not parsed again
+    Returns the names declared during this run, conflicts are not shared between runs
+    """
+    conflicts = ConflictsManager()
     log.info("Loading classes info...")
     for currentDir, _, files in os.walk(os.path.join(path_to_doc, "docbuild/xml/")):
         for f in files:
@@ -21,10 +47,7 @@ def parse_doxygen_files(path_to_doc, cpp_db):
             ):
                 class_filepath = os.path.join(currentDir, f)
                 log.debug(f"  Parsing class {class_filepath}")
-                tree = etree.parse(class_filepath)
-                class_model = parse_class_from_xml(
-                    tree.xpath("/doxygen/compounddef")[0]
-                )
+                class_model = _parse_class_file(class_filepath, parse_cache, conflicts)
                 cpp_db.classes[
                     "::".join([class_model.namespace, class_model.name])
                 ] = class_model
@@ -41,6 +64,8 @@ def parse_doxygen_files(path_to_doc, cpp_db):
             ):
                 namespace_filepath = os.path.join(currentDir, f)
                 log.debug(f"  Parsing namespace {namespace_filepath}")
-                parse_namespace_from_xml(namespace_filepath, cpp_db)
+                parse_namespace_from_xml(namespace_filepath, cpp_db, conflicts)
             else:
                 log.warning(f"Ignoring file {f}")
+    conflicts.report()
+    return conflicts
@@ -1,11 +1,10 @@
 import os
 
-from obidog.config import PATH_TO_OBENGINE
 from obidog.models.functions import FunctionModel, PlaceholderFunctionModel
 from obidog.models.location import Location
 from obidog.models.qualifiers import QualifiersModel
 from obidog.parsers.location_parser import parse_doxygen_location
-from obidog.parsers.obidog_parser import CONFLICTS, parse_obidog_flags
+from obidog.parsers.obidog_parser import parse_obidog_flags
 from obidog.parsers.parameters_parser import parse_parameters_from_xml
 from obidog.parsers.utils.doxygen_utils import doxygen_refid_to_cpp_name
 from obidog.parsers.utils.xml_utils import get_content, get_content_if
@@ -28,7 +27,7 @@ def make_return_type(return_type):
     return full_return_type
 
 
-def parse_function_from_xml(xml_function, method=False):
+def parse_function_from_xml(xml_function, conflicts, method=False):
     name = get_content(xml_function.find("name"))
     templated = False
     if (
@@ -56,8 +55,9 @@ def parse_function_from_xml(xml_function, method=False):
     if xml_function.attrib["static"] == "yes":
         qualifiers.static = True
 
+    location = parse_doxygen_location(xml_function)
     if not method:
-        CONFLICTS.append(name, xml_function)
+        conflicts.append(name, "function", location)
 
     identifier = parse_definition(definition)[1]
     if method:
@@ -77,5 +77,5 @@ def parse_function_from_xml(xml_function, method=False):
         qualifiers=qualifiers,
         flags=flags,
         description=description,
-        location=parse_doxygen_location(xml_function),
+        location=location,
     )
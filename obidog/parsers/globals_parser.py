@@ -1,18 +1,18 @@
 import os
 
-from obidog.config import PATH_TO_OBENGINE
 from obidog.models.globals import GlobalModel
-from obidog.parsers.obidog_parser import CONFLICTS, parse_obidog_flags
+from obidog.parsers.obidog_parser import parse_obidog_flags
 from obidog.parsers.location_parser import parse_doxygen_location
 from obidog.parsers.utils.xml_utils import get_content, get_content_if
 
 
 # BUG: https://github.com/doxygen/doxygen/issues/6319
-def parse_global_from_xml(xml_global):
+def parse_global_from_xml(xml_global, conflicts):
     description = get_content(xml_global.find("detaileddescription"))
     if not description:
         description = get_content(xml_global.find("briefdescription"))
-    CONFLICTS.append(get_content(xml_global.find("name")), xml_global)
+    location = parse_doxygen_location(xml_global)
+    conflicts.append(get_content(xml_global.find("name")), "global", location)
     flags = parse_obidog_flags(xml_global)
     return GlobalModel(
         name=get_content(xml_global.find("name")),
@@ -20,6 +20,6 @@ def parse_global_from_xml(xml_global):
         type=get_content(xml_global.find("type")),
         initializer=get_content_if(xml_global.find("initializer")),
         flags=flags,
-        location=parse_doxygen_location(xml_global),
+        location=location,
         description=description,
     )
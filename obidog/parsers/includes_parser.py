@@ -0,0 +1,55 @@
+import os
+
+from lxml import etree
+
+from obidog.parsers.location_parser import make_obengine_relative_path
+
+
+def _parse_file_compound(xml_path):
+    tree = etree.parse(xml_path)
+    file_value = tree.xpath("/doxygen/compounddef")[0]
+    return {
+        "file": make_obengine_relative_path(
+            file_value.find("location").attrib["file"]
+        ),
+        "includes": [
+            include.attrib["refid"]
+            for include in file_value.xpath("includes[@refid]")
+        ],
+        "unresolved_includes": [
+            include.text for include in file_value.xpath("includes[not(@refid)]")
+        ],
+        "lines": len(file_value.xpath("programlisting/codeline")),
+    }
+
+
+def parse_doxygen_includes(xml_path, known_includes=None):
+    """Builds the include graph of all documented files from Doxygen's file compounds
+    Only includes that Doxygen resolved to a documented file are kept, or that are
+    found in `known_includes` (include path => file) when Doxygen ran on a few files
+    """
+    known_includes = known_includes or {}
+    index = etree.parse(xml_path).xpath("/doxygenindex")[0]
+    files = {}
+    for file_compound in index.xpath("compound[@kind='file']"):
+        refid = file_compound.attrib["refid"]
+        files[refid] = _parse_file_compound(
+            os.path.join(os.path.dirname(xml_path), f"{refid}.xml")
+        )
+
+    include_graph = {}
+    for file_value in files.values():
+        include_graph[file_value["file"]] = {
+            "includes": [
+                files[include]["file"]
+                for include in file_value["includes"]
+                if include in files
+            ]
+            + [
+                known_includes[include]
+                for include in file_value["unresolved_includes"]
+                if include in known_includes
+            ],
+            "lines": file_value["lines"],
+        }
+    return include_graph
@@ -1,9 +1,16 @@
 import os
 
-from obidog.config import PATH_TO_OBENGINE
+from obidog import config
 from obidog.models.location import Location
 
 
+def make_obengine_relative_path(file_location):
+    # Read at call time, the managed checkout is only known once it is updated
+    return os.path.relpath(
+        os.path.normpath(file_location), os.path.normpath(config.PATH_TO_OBENGINE)
+    ).replace(os.path.sep, "/")
+
+
 def parse_doxygen_location(element):
     location_node = element.find("location")
     has_body = "bodyfile" in location_node.attrib
@@ -11,9 +18,7 @@ def parse_doxygen_location(element):
         location_node.attrib["bodyfile"] if has_body else location_node.attrib["file"]
     )
 
-    file_location = os.path.relpath(
-        os.path.normpath(file_location), os.path.normpath(PATH_TO_OBENGINE)
-    ).replace(os.path.sep, "/")
+    file_location = make_obengine_relative_path(file_location)
     line = (
         int(location_node.attrib["bodystart"])
         if has_body
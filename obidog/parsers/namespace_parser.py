@@ -1,7 +1,6 @@
 import os
 
 from lxml import etree
-from obidog.config import PATH_TO_OBENGINE
 from obidog.parsers.utils.xml_utils import (
     get_content,
     get_content_if,
@@ -12,7 +11,7 @@ from obidog.parsers.parameters_parser import parse_parameters_from_xml
 from obidog.parsers.globals_parser import parse_global_from_xml
 from obidog.parsers.location_parser import parse_doxygen_location
 from obidog.parsers.utils.doxygen_utils import doxygen_refid_to_cpp_name
-from obidog.parsers.obidog_parser import parse_obidog_flags, CONFLICTS
+from obidog.parsers.obidog_parser import parse_obidog_flags
 from obidog.models.functions import (
     PlaceholderFunctionModel,
     FunctionOverloadModel,
@@ -23,11 +22,11 @@ from obidog.models.typedefs import TypedefModel
 from obidog.models.namespace import NamespaceModel
 
 
-def parse_functions_from_xml(namespace_name, namespace, cpp_db):
+def parse_functions_from_xml(namespace_name, namespace, cpp_db, conflicts):
     functions_path = "sectiondef[@kind='func']/memberdef[@kind='function']"
     xml_functions = namespace.xpath(functions_path)
     for xml_function in xml_functions:
-        function = parse_function_from_xml(xml_function)
+        function = parse_function_from_xml(xml_function, conflicts)
         real_name = "::".join((namespace_name, function.name))
         if isinstance(function, FunctionModel):
             if real_name in cpp_db.functions:
@@ -55,7 +54,7 @@ def parse_functions_from_xml(namespace_name, namespace, cpp_db):
                 cpp_db.functions[real_name] = function
 
 
-def parse_typedef_from_xml(xml_typedef):
+def parse_typedef_from_xml(xml_typedef, conflicts):
     typedef_name = get_content(xml_typedef.find("name"))
     if xml_typedef.find("type").find("ref") is not None:
         typedef_type = doxygen_refid_to_cpp_name(xml_typedef.find("type").find("ref"))
@@ -66,7 +65,8 @@ def parse_typedef_from_xml(xml_typedef):
         xml_typedef.find("briefdescription").find("para")
     )
     typedef_definition = get_content(xml_typedef.find("definition"))
-    CONFLICTS.append(typedef_name, xml_typedef)
+    typedef_location = parse_doxygen_location(xml_typedef)
+    conflicts.append(typedef_name, "typedef", typedef_location)
 
     return TypedefModel(
         name=typedef_name,
@@ -74,21 +74,21 @@ def parse_typedef_from_xml(xml_typedef):
         type=typedef_type,
         flags=parse_obidog_flags(xml_typedef),
         description=typedef_description,
-        location=parse_doxygen_location(xml_typedef),
+        location=typedef_location,
     )
 
 
-def parse_typedefs_from_xml(namespace_name, namespace, cpp_db):
+def parse_typedefs_from_xml(namespace_name, namespace, cpp_db, conflicts):
     typedefs_path = "sectiondef[@kind='typedef']/memberdef[@kind='typedef']"
     xml_typedefs = namespace.xpath(typedefs_path)
     for xml_typedef in xml_typedefs:
-        typedef = parse_typedef_from_xml(xml_typedef)
+        typedef = parse_typedef_from_xml(xml_typedef, conflicts)
         full_name = "::".join((namespace_name, typedef.name))
         cpp_db.typedefs[full_name] = typedef
         cpp_db.typedefs[full_name].namespace = namespace_name
 
 
-def parse_enum_from_xml(xml_enum):
+def parse_enum_from_xml(xml_enum, conflicts):
     enum_name = get_content(xml_enum.find("name"))
     enum_description = get_content(xml_enum.find("briefdescription"))
 
@@ -100,38 +100,39 @@ def parse_enum_from_xml(xml_enum):
                 description=get_content(enum_value.find("briefdescription")),
             )
         )
-    CONFLICTS.append(enum_name, xml_enum)
+    enum_location = parse_doxygen_location(xml_enum)
+    conflicts.append(enum_name, "enum", enum_location)
     return EnumModel(
         name=enum_name,
         values=enum_values,
         flags=parse_obidog_flags(xml_enum),
         description=enum_description,
-        location=parse_doxygen_location(xml_enum),
+        location=enum_location,
     )
 
 
-def parse_enums_from_xml(namespace_name, namespace, cpp_db):
+def parse_enums_from_xml(namespace_name, namespace, cpp_db, conflicts):
     enums_path = "sectiondef[@kind='enum']/memberdef[@kind='enum']"
     xml_enums = namespace.xpath(enums_path)
     for xml_enum in xml_enums:
-        enum = parse_enum_from_xml(xml_enum)
+        enum = parse_enum_from_xml(xml_enum, conflicts)
         full_name = "::".join((namespace_name, enum.name))
         cpp_db.enums[full_name] = enum
         cpp_db.enums[full_name].namespace = namespace_name
 
 
-def parse_globals_from_xml(namespace_name, namespace, cpp_db):
+def parse_globals_from_xml(namespace_name, namespace, cpp_db, conflicts):
     globals_path = "sectiondef[@kind='var']/memberdef[@kind='variable']"
     xml_globals = namespace.xpath(globals_path)
     for xml_global in xml_globals:
-        cpp_global = parse_global_from_xml(xml_global)
+        cpp_global = parse_global_from_xml(xml_global, conflicts)
         if cpp_global:
             full_name = "::".join((namespace_name, cpp_global.name))
             cpp_db.globals[full_name] = cpp_global
             cpp_db.globals[full_name].namespace = namespace_name
 
 
-def parse_namespace_from_xml(xml_path, cpp_db):
+def parse_namespace_from_xml(xml_path, cpp_db, conflicts):
     tree = etree.parse(xml_path)
 
     namespace = tree.xpath("/doxygen/compounddef")[0]
@@ -147,11 +148,14 @@ def parse_namespace_from_xml(xml_path, cpp_db):
         flags=parse_obidog_flags(namespace),
     )
 
-    parse_functions_from_xml(namespace_name, namespace, cpp_db)
-    parse_typedefs_from_xml(namespace_name, namespace, cpp_db)
-    parse_enums_from_xml(namespace_name, namespace, cpp_db)
-    parse_globals_from_xml(namespace_name, namespace, cpp_db)
+    parse_functions_from_xml(namespace_name, namespace, cpp_db, conflicts)
+    parse_typedefs_from_xml(namespace_name, namespace, cpp_db, conflicts)
+    parse_enums_from_xml(namespace_name, namespace, cpp_db, conflicts)
+    parse_globals_from_xml(namespace_name, namespace, cpp_db, conflicts)
+    index_namespace_members(namespace_name, cpp_db)
 
+
+def index_namespace_members(namespace_name, cpp_db):
     cpp_db.namespaces[namespace_name].functions = {
         function_name: function
         for function_name, function in cpp_db.functions.items()
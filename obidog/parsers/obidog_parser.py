@@ -1,6 +1,8 @@
-from itertools import product
+from dataclasses import dataclass
 
+from obidog.logger import log
 from obidog.models.flags import ObidogFlagsModel
+from obidog.models.location import Location
 
 TEMPLATE_HINTS_VARIABLES = {
     "lists": [
@@ -18,10 +20,12 @@ TEMPLATE_HINTS_VARIABLES = {
         "std::map<bool, int>",
         "std::map<bool, std::string>",
         "std::map<bool, double>",
-        "std::map<std::string, int>" "std::map<std::string, bool>",
+        "std::map<std::string, int>",
+        "std::map<std::string, bool>",
         "std::map<std::string, std::string>",
         "std::map<std::string, double>",
-        "std::map<double, int>" "std::map<double, bool>",
+        "std::map<double, int>",
+        "std::map<double, bool>",
         "std::map<double, std::string>",
         "std::map<double, double>",
     ],
@@ -35,36 +39,13 @@ TEMPLATE_HINTS_VARIABLES = {
 }
 
 
-def inject_template_variables(template_combination):
-    associations = {}
-    for template_association in template_combination:
-        template_name = template_association.split("=")[0].strip()
-        associate_type = template_association.split("=")[1].strip()
-        if associate_type.startswith("$"):
-            if associate_type[1::] in TEMPLATE_HINTS_VARIABLES:
-                associations[template_name] = TEMPLATE_HINTS_VARIABLES[
-                    associate_type[1::]
-                ]
-            else:
-                raise RuntimeError(f"Unknown template_hint variable {associate_type}")
-    if not associations:
-        return [template_combination]
-    else:
-        generated_combinations = []
-        variable_combinations = [x for x in product(*associations.values())]
-        for variable_combination in variable_combinations:
-            current_combination = []
-            for comb in template_combination:
-                template_name = comb.split("=")[0].strip()
-                variable_index = list(associations.keys()).index(template_name)
-                if template_name in associations:
-                    current_combination.append(
-                        f"{template_name}={variable_combination[variable_index]}"
-                    )
-                else:
-                    current_combination.append(comb)
-            generated_combinations.append(current_combination)
-        return generated_combinations
+def check_template_variables(template_hint):
+    for associate_type in template_hint.values():
+        if (
+            associate_type.startswith("$")
+            and associate_type[1::] not in TEMPLATE_HINTS_VARIABLES
+        ):
+            raise RuntimeError(f"Unknown template_hint variable {associate_type}")
 
 
 def find_obidog_flag(tree, flag_name, amount=None):
@@ -102,16 +83,16 @@ def parse_obidog_flags(tree):
             template_combination = template_combination.strip().split(";")
             if not bind_name in thints:
                 thints[bind_name] = []
-            template_combinations = inject_template_variables(template_combination)
-            for template_combination in template_combinations:
-                thints[bind_name].append(
-                    {
-                        template_association.split("=")[0]
-                        .strip(): template_association.split("=")[1]
-                        .strip()
-                        for template_association in template_combination
-                    }
-                )
+            # $variables are expanded when the bindings are generated
+            # (see obidog.bindings.template.iter_template_hints)
+            template_hint = {
+                template_association.split("=")[0]
+                .strip(): template_association.split("=")[1]
+                .strip()
+                for template_association in template_combination
+            }
+            check_template_variables(template_hint)
+            thints[bind_name].append(template_hint)
         flags.template_hints = thints
     force_abstract = find_obidog_flag(tree, "force_abstract", 1)
     if force_abstract:
@@ -137,19 +118,56 @@ def parse_obidog_flags(tree):
     noconstructor = find_obidog_flag(tree, "noconstructor", 1)
     if noconstructor:
         flags.noconstructor = True
+    noflatten = find_obidog_flag(tree, "noflatten", 1)
+    if noflatten:
+        flags.noflatten = True
+    fast = find_obidog_flag(tree, "fast", 1)
+    if fast:
+        flags.fast = True
     return flags
 
 
+@dataclass
+class ConflictRecord:
+    name: str
+    kind: str
+    file: str
+    line: int
+
+
 class ConflictsManager:
+    """Records where each name is declared during a parsing run
+    Only the name, kind and location are kept, not the XML element
+    """
+
     def __init__(self):
         self.conflicts = {}
 
-    def append(self, conflict, xml):
+    def append(self, conflict, kind, location: Location):
         if not conflict in self.conflicts:
             self.conflicts[conflict] = []
-        else:
-            print("Conflict detected")
-        self.conflicts[conflict].append(xml)
+        self.conflicts[conflict].append(
+            ConflictRecord(
+                name=conflict, kind=kind, file=location.file, line=location.line
+            )
+        )
 
+    def get_conflicts(self):
+        return {
+            conflict: records
+            for conflict, records in self.conflicts.items()
+            if len(records) > 1
+        }
 
-CONFLICTS = ConflictsManager()
\ No newline at end of file
+    def report(self):
+        conflicts = self.get_conflicts()
+        if not conflicts:
+            return
+        log.warning(f"{len(conflicts)} names are declared more than once")
+        for conflict, records in sorted(conflicts.items()):
+            log.info(
+                f"  {conflict} : "
+                + ", ".join(
+                    f"{record.kind} ({record.file}:{record.line})" for record in records
+                )
+            )
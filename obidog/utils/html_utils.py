@@ -0,0 +1,39 @@
+import re
+
+HTML_TOKEN_REG = re.compile(
+    r"<!--.*?-->|<(/?)([a-zA-Z][\w:-]*)[^>]*>|[^<]+|<", re.DOTALL
+)
+WHITESPACE_REG = re.compile(r"\s+")
+# Whitespace is significant in these elements
+PRESERVE_WHITESPACE_TAGS = ["pre", "code", "textarea"]
+# Content of these elements is not HTML and is copied verbatim
+RAW_TEXT_TAGS = ["script", "style"]
+
+
+def iter_minified_html(html_string):
+    """Collapses whitespace and drops comments, one token at a time
+    Content of <pre>, <code>, <textarea>, <script> and <style> is left untouched,
+    conditional comments are kept
+    """
+    preserved_depth = 0
+    raw_text_tag = None
+    for token in HTML_TOKEN_REG.finditer(html_string):
+        text = token.group(0)
+        closing, tag_name = token.group(1), (token.group(2) or "").lower()
+        if raw_text_tag:
+            if closing and tag_name == raw_text_tag:
+                raw_text_tag = None
+            yield text
+        elif text.startswith("<!--"):
+            if text.startswith("<!--[") or preserved_depth:
+                yield text
+        elif tag_name:
+            if tag_name in RAW_TEXT_TAGS and not closing:
+                raw_text_tag = tag_name
+            elif tag_name in PRESERVE_WHITESPACE_TAGS and not text.endswith("/>"):
+                preserved_depth = max(preserved_depth + (-1 if closing else 1), 0)
+            yield text
+        elif preserved_depth:
+            yield text
+        else:
+            yield WHITESPACE_REG.sub(" ", text)
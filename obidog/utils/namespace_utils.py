@@ -0,0 +1,62 @@
+from dataclasses import dataclass, field
+from typing import Dict
+
+from obidog.databases import CppDatabase
+
+NAMESPACE_ITEM_TYPES = [
+    "classes",
+    "enums",
+    "functions",
+    "globals",
+    "typedefs",
+]
+
+
+def get_parent_namespace(name: str):
+    """`obe::Graphics::Sprite` => `obe::Graphics`, names without namespace give an empty string"""
+    return name.rpartition("::")[0]
+
+
+@dataclass
+class NamespaceNode:
+    path: str
+    items: Dict[str, Dict] = field(
+        default_factory=lambda: {item_type: {} for item_type in NAMESPACE_ITEM_TYPES}
+    )
+    children: Dict[str, "NamespaceNode"] = field(default_factory=lambda: {})
+
+
+@dataclass
+class NamespaceTree:
+    # Namespaces in the order of their first item
+    nodes: Dict[str, NamespaceNode]
+    # Namespaces without a parent namespace
+    roots: Dict[str, NamespaceNode]
+
+
+def group_items_by_namespace(cpp_db: CppDatabase):
+    """Groups the items of the database by the namespace they are declared in
+
+    Only the namespaces of the database which contain items get a node.
+    Each node is linked to its parent namespace when it is created,
+    children are ordered like the nodes
+    """
+    nodes = {}
+    children = {}
+    for item_type in NAMESPACE_ITEM_TYPES:
+        for item_name, item_value in getattr(cpp_db, item_type).items():
+            namespace_name = get_parent_namespace(item_name.split("<")[0])
+            if namespace_name not in cpp_db.namespaces:
+                continue
+            node = nodes.get(namespace_name)
+            if node is None:
+                node = NamespaceNode(
+                    namespace_name,
+                    children=children.setdefault(namespace_name, {}),
+                )
+                nodes[namespace_name] = node
+                children.setdefault(get_parent_namespace(namespace_name), {})[
+                    namespace_name
+                ] = node
+            node.items[item_type][item_name] = item_value
+    return NamespaceTree(nodes, children.get("", {}))
@@ -0,0 +1,131 @@
+import os
+import time
+
+try:
+    import inotify_simple
+except ImportError:
+    inotify_simple = None
+
+from obidog.logger import log
+
+WATCHED_EXTENSIONS = (".h", ".hh", ".hpp", ".hxx", ".h++", ".inl", ".ipp")
+# Generated bindings are excluded from Doxygen (see EXCLUDE_PATTERNS in Doxyfile)
+# and must not trigger a new run when they are written
+IGNORED_DIRECTORIES = {"Bindings"}
+# Changes that happen within this delay are handled as a single batch
+WATCH_DEBOUNCE_DELAY = 0.3
+
+
+def _walk_watched_directories(root: str, directories):
+    for directory in directories:
+        for current_dir, subdirectories, _ in os.walk(os.path.join(root, directory)):
+            subdirectories[:] = [
+                subdirectory
+                for subdirectory in subdirectories
+                if subdirectory not in IGNORED_DIRECTORIES
+            ]
+            yield current_dir
+
+
+def is_watched_file(path: str):
+    return path.endswith(WATCHED_EXTENSIONS) and not (
+        IGNORED_DIRECTORIES & set(path.replace(os.path.sep, "/").split("/"))
+    )
+
+
+def list_watched_files(root: str, directories):
+    """Returns the modification time of every watched file, keyed by its path relative to `root`"""
+    watched_files = {}
+    for current_dir in _walk_watched_directories(root, directories):
+        for file_name in os.listdir(current_dir):
+            file_path = os.path.join(current_dir, file_name)
+            if is_watched_file(file_name) and os.path.isfile(file_path):
+                watched_files[
+                    os.path.relpath(file_path, root).replace(os.path.sep, "/")
+                ] = os.stat(file_path).st_mtime_ns
+    return watched_files
+
+
+class PollingWatcher:
+    """Detects changes by comparing the modification times of all watched files"""
+
+    def __init__(self, root: str, directories, interval: float = 1.0):
+        self.root = root
+        self.directories = directories
+        self.interval = interval
+        self.files = list_watched_files(root, directories)
+
+    def _poll(self):
+        files = list_watched_files(self.root, self.directories)
+        changed = {
+            path
+            for path in set(files) | set(self.files)
+            if files.get(path) != self.files.get(path)
+        }
+        self.files = files
+        return changed
+
+    def wait_for_changes(self):
+        """Blocks until at least one watched file is modified, created or removed"""
+        while True:
+            time.sleep(self.interval)
+            changed = self._poll()
+            if changed:
+                time.sleep(WATCH_DEBOUNCE_DELAY)
+                return changed | self._poll()
+
+
+class InotifyWatcher:
+    """Detects changes with inotify, every watched directory gets its own watch"""
+
+    def __init__(self, root: str, directories):
+        self.root = root
+        self.inotify = inotify_simple.INotify()
+        self.watch_flags = (
+            inotify_simple.flags.CLOSE_WRITE
+            | inotify_simple.flags.CREATE
+            | inotify_simple.flags.DELETE
+            | inotify_simple.flags.MOVED_FROM
+            | inotify_simple.flags.MOVED_TO
+        )
+        self.watches = {}
+        for current_dir in _walk_watched_directories(root, directories):
+            self._add_watch(current_dir)
+
+    def _add_watch(self, directory: str):
+        self.watches[self.inotify.add_watch(directory, self.watch_flags)] = directory
+
+    def _read_changes(self, timeout):
+        changed = set()
+        for event in self.inotify.read(timeout=timeout):
+            if event.wd not in self.watches:
+                continue
+            path = os.path.join(self.watches[event.wd], event.name)
+            if event.mask & inotify_simple.flags.ISDIR:
+                if (
+                    event.mask
+                    & (inotify_simple.flags.CREATE | inotify_simple.flags.MOVED_TO)
+                    and event.name not in IGNORED_DIRECTORIES
+                ):
+                    self._add_watch(path)
+            elif is_watched_file(event.name):
+                changed.add(os.path.relpath(path, self.root).replace(os.path.sep, "/"))
+        return changed
+
+    def wait_for_changes(self):
+        """Blocks until at least one watched file is modified, created or removed"""
+        while True:
+            changed = self._read_changes(None)
+            if changed:
+                while True:
+                    more_changes = self._read_changes(WATCH_DEBOUNCE_DELAY * 1000)
+                    if not more_changes:
+                        return changed
+                    changed |= more_changes
+
+
+def make_watcher(root: str, directories, polling_interval: float = 1.0):
+    if inotify_simple is None:
+        log.warning("inotify_simple is not installed, falling back to polling")
+        return PollingWatcher(root, directories, polling_interval)
+    return InotifyWatcher(root, directories)
@@ -0,0 +1,122 @@
+import copy
+import os
+import time
+from dataclasses import dataclass
+from typing import Dict
+
+from obidog.bindings.includes import get_included_path, make_include_directive
+from obidog.config import SOURCE_DIRECTORIES
+from obidog.databases import CppDatabase
+from obidog.logger import log
+from obidog.models.functions import FunctionOverloadModel
+from obidog.parsers.cpp_parser import parse_doxygen_files
+from obidog.parsers.doxygen_index_parser import parse_doxygen_index
+from obidog.parsers.includes_parser import parse_doxygen_includes
+from obidog.parsers.namespace_parser import index_namespace_members
+from obidog.utils.watch_utils import make_watcher
+from obidog.wrappers.doxygen_wrapper import build_doxygen_documentation
+
+
+@dataclass
+class WarmDatabase:
+    """Everything parsed from the Doxygen documentation, kept in memory between runs
+    It is never modified by a run, each run works on its own copy
+    """
+
+    cpp_db: CppDatabase
+    doxygen_index: Dict
+    include_graph: Dict
+
+
+def _get_item_files(item):
+    if isinstance(item, FunctionOverloadModel):
+        return {overload.location.file for overload in item.overloads}
+    location = getattr(item, "location", None)
+    return {location.file} if location else set()
+
+
+def _remove_function_overloads(function, files):
+    overloads = [
+        overload
+        for overload in function.overloads
+        if overload.location.file not in files
+    ]
+    if not overloads:
+        return None
+    if len(overloads) == 1:
+        return overloads[0]
+    function.overloads = overloads
+    return function
+
+
+def remove_items_from_files(cpp_db: CppDatabase, files):
+    """Removes every item declared in one of `files` from the database"""
+    files = set(files)
+    for item_type, items in cpp_db.__dict__.items():
+        if item_type == "namespaces":
+            continue
+        for item_name, item in list(items.items()):
+            if not _get_item_files(item) & files:
+                continue
+            if isinstance(item, FunctionOverloadModel):
+                item = _remove_function_overloads(item, files)
+            else:
+                item = None
+            if item is None:
+                del items[item_name]
+            else:
+                items[item_name] = item
+
+
+def update_warm_database(warm_db: WarmDatabase, path_to_obengine, changed_files):
+    """Runs Doxygen on the changed headers only and replaces their items in the database"""
+    # Includes of the changed headers to headers Doxygen does not run on are resolved with these
+    known_includes = {
+        get_included_path(make_include_directive(path)): path
+        for path in warm_db.include_graph
+    }
+    remove_items_from_files(warm_db.cpp_db, changed_files)
+    for changed_file in changed_files:
+        warm_db.include_graph.pop(changed_file, None)
+    existing_files = sorted(
+        changed_file
+        for changed_file in changed_files
+        if os.path.isfile(os.path.join(path_to_obengine, changed_file))
+    )
+    if existing_files:
+        path_to_doc = build_doxygen_documentation(path_to_obengine, existing_files)
+        index_path = os.path.join(path_to_doc, "docbuild", "xml", "index.xml")
+        previous_namespaces = dict(warm_db.cpp_db.namespaces)
+        parse_doxygen_files(path_to_doc, warm_db.cpp_db)
+        # Namespaces are documented once but declared in many headers
+        for namespace_name, namespace in previous_namespaces.items():
+            reparsed_namespace = warm_db.cpp_db.namespaces[namespace_name]
+            if not reparsed_namespace.description:
+                reparsed_namespace.description = namespace.description
+                reparsed_namespace.flags = namespace.flags
+        warm_db.doxygen_index.update(parse_doxygen_index(index_path))
+        warm_db.include_graph.update(parse_doxygen_includes(index_path, known_includes))
+    for namespace_name in warm_db.cpp_db.namespaces:
+        index_namespace_members(namespace_name, warm_db.cpp_db)
+
+
+def watch_obengine(path_to_obengine, warm_db: WarmDatabase, rebuild, polling_interval):
+    """Rebuilds everything each time an ÖbEngine header changes
+
+    `rebuild(warm_db, previous_run)` is called with a copy of the warm database
+    and the result of the previous call, which it returns for the next one
+    """
+    watcher = make_watcher(
+        path_to_obengine,
+        [item["path"] for item in SOURCE_DIRECTORIES],
+        polling_interval,
+    )
+    previous_run = rebuild(copy.deepcopy(warm_db), None)
+    while True:
+        log.info("Watching ÖbEngine headers for changes...")
+        changed_files = watcher.wait_for_changes()
+        log.info(f"{len(changed_files)} headers changed : {', '.join(changed_files)}")
+        start = time.perf_counter()
+        update_warm_database(warm_db, path_to_obengine, changed_files)
+        previous_run = rebuild(copy.deepcopy(warm_db), previous_run)
+        log.info(f"Rebuilt in {time.perf_counter() - start:.2f}s")
@@ -1,7 +1,7 @@
 import subprocess
 import os
 
-from obidog.config import PATH_TO_OBENGINE
+from obidog import config
 from obidog.logger import log
 
 CLANG_FORMAT_PATH = os.environ.get("CLANG_FORMAT_PATH", "clang-format")
@@ -29,7 +29,8 @@ def clang_format_files(file_list):
     if CLANG_FORMAT_PATH is not None:
         for path in file_list:
             p = subprocess.Popen(
-                [CLANG_FORMAT_PATH, "-i", "-style=file", path], cwd=PATH_TO_OBENGINE
+                [CLANG_FORMAT_PATH, "-i", "-style=file", path],
+                cwd=config.PATH_TO_OBENGINE,
             )
             p.wait()
         return True
@@ -26,11 +26,18 @@ def _check_doxygen():
     except FileNotFoundError as e:
         return False
 
-def build_doxygen_documentation(source_path):
+def build_doxygen_documentation(source_path, input_files=None):
+    """Runs Doxygen on all source directories or, if given, only on `input_files`
+    (paths relative to `source_path`)
+    """
     path = tempfile.mkdtemp()
     src_directories = [
         os.path.join(source_path, directory)
-        for directory in [item["path"] for item in SOURCE_DIRECTORIES]
+        for directory in (
+            input_files
+            if input_files is not None
+            else [item["path"] for item in SOURCE_DIRECTORIES]
+        )
     ]
     with open("Doxyfile", "r") as src_doxyfile:
         with open(os.path.join(path, "Doxyfile"), "w") as dst_doxyfile:
@@ -1,38 +1,91 @@
 import os
-import tempfile
 
 import git
 
+from obidog import config
 from obidog.config import (
-    PATH_TO_OBENGINE,
+    BINDINGS_HEADERS_LOCATION,
+    BINDINGS_SOURCES_LOCATION,
+    SOURCE_DIRECTORIES,
     set_obengine_git_directory,
+    OBENGINE_GIT_MIRROR,
+    OBENGINE_GIT_REF,
     OBENGINE_GIT_URL,
     OBENGINE_GIT_SSH,
+    OBIDOG_CACHE_DIRECTORY,
 )
 from obidog.exceptions import InvalidObEngineGitRepositoryException
 from obidog.logger import log
 
 
 def check_git_directory():
-    global PATH_TO_OBENGINE
-    if PATH_TO_OBENGINE is not None:
-        log.debug(f"Found existing ÖbEngine repository in {PATH_TO_OBENGINE}")
+    if config.PATH_TO_OBENGINE is not None:
+        log.debug(f"Found existing ÖbEngine repository in {config.PATH_TO_OBENGINE}")
     else:
-        log.debug("Cloning ÖbEngine repository...")
-        PATH_TO_OBENGINE = set_obengine_git_directory(clone_obengine_repo())
+        log.debug("Updating managed ÖbEngine checkout...")
+        set_obengine_git_directory(checkout_obengine_repo())
     log.debug("Checking ÖbEngine repository validity...")
-    if not check_obengine_repo(PATH_TO_OBENGINE):
-        raise InvalidObEngineGitRepositoryException(PATH_TO_OBENGINE)
-    log.info(f"Using ÖbEngine repository in {PATH_TO_OBENGINE}")
-    return PATH_TO_OBENGINE
+    if not check_obengine_repo(config.PATH_TO_OBENGINE):
+        raise InvalidObEngineGitRepositoryException(config.PATH_TO_OBENGINE)
+    log.info(f"Using ÖbEngine repository in {config.PATH_TO_OBENGINE}")
+    return config.PATH_TO_OBENGINE
 
 
-def clone_obengine_repo():
-    path = tempfile.mkdtemp()
-    git.Repo.clone_from(OBENGINE_GIT_URL, path, branch="master")
+def get_obengine_remote_url():
+    if OBENGINE_GIT_MIRROR is not None:
+        return f"file://{os.path.abspath(OBENGINE_GIT_MIRROR)}"
+    return OBENGINE_GIT_URL
+
+
+def get_sparse_checkout_paths():
+    return [source_directory["path"] for source_directory in SOURCE_DIRECTORIES] + [
+        f"{BINDINGS_HEADERS_LOCATION}/Bindings",
+        f"{BINDINGS_SOURCES_LOCATION}/Bindings",
+    ]
+
+
+def checkout_obengine_repo(ref: str = OBENGINE_GIT_REF):
+    """Keeps a shallow, sparse checkout of ÖbEngine in Obidog's cache directory
+
+    Only the source directories and the bindings directories are checked out.
+    The first run creates the checkout, later runs fetch `ref` (a branch, a tag
+    or a commit) and move the checkout to it in place.
+    """
+    path = os.path.join(OBIDOG_CACHE_DIRECTORY, "ObEngine")
+    remote_url = get_obengine_remote_url()
+    if os.path.isdir(os.path.join(path, ".git")):
+        repo = git.Repo(path)
+        repo.remote("origin").set_url(remote_url)
+    else:
+        log.info(f"Creating ÖbEngine checkout in {path}")
+        os.makedirs(path, exist_ok=True)
+        repo = git.Repo.init(path)
+        repo.create_remote("origin", remote_url)
+        repo.git.sparse_checkout("init", "--cone")
+    repo.git.sparse_checkout("set", *get_sparse_checkout_paths())
+    repo.git.fetch("origin", ref, depth=1, filter="blob:none")
+    fetched_commit = repo.rev_parse("FETCH_HEAD").hexsha
+    if repo.head.is_valid() and repo.head.commit.hexsha == fetched_commit:
+        log.debug(f"ÖbEngine checkout already at {ref} ({fetched_commit})")
+    else:
+        # The history is shallow so the checkout can not be merged, it is moved
+        # to the fetched commit instead, discarding previously generated bindings
+        repo.git.checkout("--force", "-B", "obidog", fetched_commit)
+        log.info(f"ÖbEngine checkout moved to {ref} ({fetched_commit})")
     return path
 
 
+def get_sources_revision(path):
+    """Returns the checked out commit and the ids of the trees of the source directories,
+    two commits with the same trees have the same sources
+    """
+    repo = git.Repo(path)
+    return repo.head.commit.hexsha, ",".join(
+        repo.git.rev_parse(f"HEAD:{source_directory['path']}")
+        for source_directory in SOURCE_DIRECTORIES
+    )
+
+
 def check_obengine_repo(git_dir):
     try:
         repo = git.Repo(git_dir)
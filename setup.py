@@ -30,6 +30,9 @@ setup(
     install_requires=["lxml", "GitPython", "requests", "mako", "inflection", "bs4"],
     extras_require={
         "lint": ["flake8"],
+        "test": ["pytest"],
+        "brotli": ["brotli"],
+        "watch": ["inotify_simple"],
     },
     entry_points={
         "console_scripts": [
@@ -0,0 +1,85 @@
+// Client for the search index generated by obidog.documentation.search.make_search_index
+// Must stay in sync with NAME_TOKEN_REG in obidog/documentation/search.py
+const NAME_TOKEN_REG = /[A-Z]+(?![a-z])|[A-Z]?[a-z]+|\d+/g;
+
+function tokenizeName(name) {
+    let tokens = (name.match(NAME_TOKEN_REG) || []).map((token) => token.toLowerCase());
+    tokens.push(name.toLowerCase());
+    return tokens;
+}
+
+class SearchIndex {
+    constructor(index) {
+        this.index = index;
+        this.tokens = new Map();
+        this.postings = new Map();
+    }
+
+    record(id) {
+        let record = this.index.records[id];
+        let element = {
+            name: record[0],
+            _type: this.index.types[record[1]],
+            namespace: this.index.namespaces[record[2]],
+            url: this.index.url_directories[record[3]] + "/" + record[4],
+        };
+        if (record.length > 5) {
+            element.from_class = record[5];
+        }
+        return element;
+    }
+
+    recordTokens(id) {
+        if (!this.tokens.has(id)) {
+            this.tokens.set(id, tokenizeName(this.index.records[id][0]));
+        }
+        return this.tokens.get(id);
+    }
+
+    candidates(prefix) {
+        if (!this.postings.has(prefix)) {
+            let ids = [];
+            let current = 0;
+            for (let delta of this.index.prefixes[prefix] || []) {
+                current += delta;
+                ids.push(current);
+            }
+            this.postings.set(prefix, ids);
+        }
+        return this.postings.get(prefix);
+    }
+
+    search(query, limit) {
+        let terms = query.toLowerCase().split(/[\s.:]+/).filter((term) => term.length > 0);
+        if (terms.length == 0) {
+            return [];
+        }
+        let matches = null;
+        for (let term of terms) {
+            let termMatches = this.candidates(term.slice(0, this.index.prefix_length)).filter(
+                (id) => this.recordTokens(id).some((token) => token.startsWith(term))
+            );
+            if (matches === null) {
+                matches = termMatches;
+            }
+            else {
+                let termMatchesSet = new Set(termMatches);
+                matches = matches.filter((id) => termMatchesSet.has(id));
+            }
+        }
+        let fullQuery = terms.join("");
+        let score = (id) => {
+            let name = this.index.records[id][0].toLowerCase();
+            if (name == fullQuery) {
+                return 0;
+            }
+            return name.startsWith(terms[0]) ? 1 : 2;
+        };
+        matches.sort((left, right) =>
+            score(left) - score(right)
+            || this.index.records[left][0].length - this.index.records[right][0].length
+            || this.index.records[left][1] - this.index.records[right][1]
+        );
+        return matches.slice(0, limit).map((id) => this.record(id));
+    }
+}
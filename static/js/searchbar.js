@@ -71,10 +71,12 @@ search_input.addEventListener('blur', (event) => {
     }
 });
 
-search_input.onkeypress = (event) => {
+search_input.oninput = (event) => {
     search_results.innerHTML = "";
-    let results = fuse.search(search_input.value, { "limit": 20 });
-    for (result of results) {
-        addSuggestion(result.item);
+    if (!search_index) {
+        return;
+    }
+    for (let result of search_index.search(search_input.value, 20)) {
+        addSuggestion(result);
     }
 };
@@ -4,4 +4,31 @@
         event.stopPropagation();
         dropdown.classList.toggle('is-active');
     });
-})();
\ No newline at end of file
+})();
+
+// Filled from the versions.json written next to the documentation,
+// the path of each version is relative to the directory of versions.json
+(function () {
+    let selector = document.getElementById("version-selector");
+    let versionsUrl = new URL(selector.dataset.versions, window.location.href);
+    fetch(versionsUrl).then(
+        (resp) => resp.json()
+    ).then(function (data) {
+        let versionRoot = new URL(".", versionsUrl).href;
+        let pagePath = window.location.href.startsWith(versionRoot)
+            ? window.location.href.slice(versionRoot.length)
+            : "index.html";
+        for (let version of data.versions) {
+            let versionUrl = new URL(version.path, versionRoot).href;
+            let a = document.createElement("a");
+            a.classList.add("dropdown-item");
+            a.href = new URL(pagePath, versionUrl).href;
+            a.textContent = version.name;
+            if (versionUrl == versionRoot) {
+                a.classList.add("is-active");
+                document.getElementById("current-version").textContent = version.name;
+            }
+            selector.appendChild(a);
+        }
+    }).catch(() => {});
+})();
@@ -1,4 +1,4 @@
-<%def name="header(WEBSITE_LOCATION, DOCUMENTATION_PATH, DB_LOCATION, version)">
+<%def name="header(WEBSITE_LOCATION, DOCUMENTATION_PATH, DB_LOCATION, VERSIONS_LOCATION, version)">
 <nav class="navbar" role="navigation" aria-label="main navigation">
     <div class="navbar-brand">
         <a class="navbar-item" href="https://${WEBSITE_LOCATION}/${DOCUMENTATION_PATH}/index.html">
@@ -18,29 +18,14 @@
             <div class="navbar-item dropdown">
                 <div class="dropdown-trigger">
                     <button class="button" aria-haspopup="true" aria-controls="dropdown-menu">
-                    <span>${version}</span>
+                    <span id="current-version">${version}</span>
                     <span class="icon is-small">
                         <i class="fas fa-angle-down" aria-hidden="true"></i>
                     </span>
                     </button>
                 </div>
                 <div class="dropdown-menu" id="dropdown-menu" role="menu">
-                    <div class="dropdown-content">
-                    <a href="#" class="dropdown-item">
-                        0.1
-                    </a>
-                    <a href="#" class="dropdown-item">
-                        0.2
-                    </a>
-                    <a href="#" class="dropdown-item">
-                        0.3
-                    </a>
-                    <a href="#" class="dropdown-item">
-                        0.4
-                    </a>
-                    <a href="#" class="dropdown-item">
-                        0.5
-                    </a>
+                    <div class="dropdown-content" id="version-selector" data-versions="https://${VERSIONS_LOCATION}">
                     </div>
                 </div>
             </div>
@@ -90,22 +75,13 @@
         </div>
     </div>
 </nav>
+<script src="https://${WEBSITE_LOCATION}/${DOCUMENTATION_PATH}/static/js/search_index.js"></script>
 <script>
-let search_db;
-var fuse;
+var search_index;
 fetch("https://${DB_LOCATION}").then(
     (resp) => resp.json()
 ).then(
-    function (data) { search_db = data; }
-).then(
-    function () {
-        fuse = new Fuse(search_db, {
-            keys: ['name'],
-            threshold: 0.3,
-            includeScore: true,
-            useExtendedSearch: true,
-        });
-    }
+    function (data) { search_index = new SearchIndex(data); }
 );
 </script>
 <script src="https://${WEBSITE_LOCATION}/${DOCUMENTATION_PATH}/static/js/version_selector.js"></script>
@@ -15,7 +15,6 @@
     <script src="https://cdnjs.cloudflare.com/ajax/libs/highlight.js/10.1.1/highlight.min.js"
         integrity="sha512-lnOllyZZlRk/gQIyjS3+h+LUy54uyM4aGq2zbGc82KTvBlp/fodSpdh/pywPztpU9zUqHcJr+jP+a1zLa9oCJw=="
         crossorigin="anonymous"></script>
-    <script src="https://cdn.jsdelivr.net/npm/fuse.js/dist/fuse.js"></script>
     <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/highlight.js/10.1.1/styles/vs2015.min.css"
         integrity="sha512-w8aclkBlN3Ha08SMwFKXFJqhSUx2qlvTBFLLelF8sm4xQnlg64qmGB/A6pBIKy0W8Bo51yDMDtQiPLNRq1WMcQ=="
         crossorigin="anonymous" />
@@ -31,7 +30,7 @@
 <%namespace name="function_template" file="lua_function.mako"/>
 <%namespace name="namespace_template" file="lua_namespace.mako"/>
 <body>
-    ${header_template.header(WEBSITE_LOCATION, DOCUMENTATION_PATH, DB_LOCATION, CURRENT_VERSION)}
+    ${header_template.header(WEBSITE_LOCATION, DOCUMENTATION_PATH, DB_LOCATION, VERSIONS_LOCATION, CURRENT_VERSION)}
     <section class="container">
         % if target._type == "class":
             ${class_template.lua_class(target)}
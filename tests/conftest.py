@@ -0,0 +1,64 @@
+import pytest
+
+from obidog import config
+from obidog.databases import CppDatabase
+
+from factories import add_classes, add_namespaces, make_class, make_function
+
+
+@pytest.fixture
+def cpp_db():
+    """obe::Transform::Movable <- obe::Graphics::Sprite <- obe::Graphics::Shapes::Rectangle"""
+    cpp_db = CppDatabase()
+    add_namespaces(cpp_db, "obe::Transform", "obe::Graphics", "obe::Graphics::Shapes")
+    add_classes(
+        cpp_db,
+        make_class(
+            "Movable",
+            "obe::Transform",
+            {
+                "move": make_function(
+                    "move", "obe::Transform", [("offset", "const UnitVector &")]
+                ),
+                "getPosition": make_function(
+                    "getPosition", "obe::Transform", return_type="UnitVector"
+                ),
+            },
+        ),
+        make_class(
+            "Sprite",
+            "obe::Graphics",
+            {
+                "draw": make_function(
+                    "draw", "obe::Graphics", [("target", "RenderTarget &")]
+                )
+            },
+            bases=["obe::Transform::Movable"],
+        ),
+        make_class(
+            "Rectangle",
+            "obe::Graphics::Shapes",
+            {
+                "setSize": make_function(
+                    "setSize",
+                    "obe::Graphics::Shapes",
+                    [("w", "double"), ("h", "double")],
+                )
+            },
+            bases=["obe::Graphics::Sprite"],
+        ),
+    )
+    cpp_db.functions["obe::Graphics::makeColor"] = make_function(
+        "makeColor", "obe::Graphics", [("r", "int"), ("g", "int")], "Color"
+    )
+    return cpp_db
+
+
+@pytest.fixture
+def obengine_directory(tmp_path, monkeypatch):
+    """An empty ÖbEngine repository set like the managed checkout does it"""
+    monkeypatch.delenv("OBENGINE_BINDINGS_OUTPUT", raising=False)
+    monkeypatch.setenv("OBENGINE_GIT_DIRECTORY", str(tmp_path))
+    monkeypatch.setattr(config, "PATH_TO_OBENGINE", None)
+    config.set_obengine_git_directory(str(tmp_path))
+    return tmp_path
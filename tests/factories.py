@@ -0,0 +1,51 @@
+from obidog.models.classes import ClassModel
+from obidog.models.flags import ObidogFlagsModel
+from obidog.models.functions import FunctionModel, ParameterModel
+from obidog.models.location import Location
+from obidog.models.namespace import NamespaceModel
+
+
+def make_function(name, namespace, parameters=(), return_type="void", **kwargs):
+    """`parameters` is a list of (name, type) pairs"""
+    return FunctionModel(
+        name=name,
+        namespace=namespace,
+        definition=f"{return_type} {namespace}::{name}",
+        parameters=[
+            ParameterModel(parameter_name, parameter_type)
+            for parameter_name, parameter_type in parameters
+        ],
+        return_type=return_type,
+        flags=kwargs.pop("flags", None) or ObidogFlagsModel(),
+        location=kwargs.pop("location", None)
+        or Location(f"include/Core/{namespace.split('::')[-1]}/{name}.hpp", 10, 0),
+        **kwargs,
+    )
+
+
+def make_class(name, namespace, methods=None, bases=None, **kwargs):
+    return ClassModel(
+        name=name,
+        namespace=namespace,
+        bases=bases or [],
+        attributes={},
+        constructors=[],
+        methods=methods or {},
+        flags=kwargs.pop("flags", None) or ObidogFlagsModel(),
+        location=Location(f"include/Core/{namespace.split('::')[-1]}/{name}.hpp", 5, 0),
+        **kwargs,
+    )
+
+
+def add_namespaces(cpp_db, *namespace_names):
+    for namespace_name in namespace_names:
+        cpp_db.namespaces[namespace_name] = NamespaceModel(
+            name=namespace_name.split("::")[-1],
+            path=namespace_name,
+            namespace="::".join(namespace_name.split("::")[:-1]),
+        )
+
+
+def add_classes(cpp_db, *classes):
+    for class_value in classes:
+        cpp_db.classes[f"{class_value.namespace}::{class_value.name}"] = class_value
@@ -0,0 +1,140 @@
+import copy
+import os
+
+import pytest
+
+from obidog.bindings.flavours import flavour, sol3_instrumented
+from obidog.bindings.generator import generate_bindings, get_output_directory
+from obidog.config import BINDINGS_SOURCES_LOCATION
+from obidog.models.flags import ObidogFlagsModel
+from obidog.parsers.bindings_parser import find_binding_location
+
+from factories import add_classes, make_class, make_function
+
+
+def test_output_directory_follows_managed_checkout(obengine_directory):
+    assert get_output_directory() == str(obengine_directory)
+
+
+def test_output_directory_override(obengine_directory, tmp_path_factory, monkeypatch):
+    output_directory = str(tmp_path_factory.mktemp("output"))
+    monkeypatch.setenv("OBENGINE_BINDINGS_OUTPUT", output_directory)
+    assert get_output_directory() == output_directory
+
+
+def test_bindings_are_written_in_managed_checkout(cpp_db, obengine_directory):
+    generate_bindings(cpp_db)
+    sources = os.path.join(obengine_directory, BINDINGS_SOURCES_LOCATION, "Bindings")
+    assert os.path.isfile(os.path.join(sources, "index.cpp"))
+    assert os.path.isfile(os.path.join(sources, "obe", "Graphics", "Graphics.cpp"))
+
+
+def test_find_binding_location_reads_managed_checkout(cpp_db, obengine_directory):
+    generate_bindings(cpp_db)
+    sprite = cpp_db.classes["obe::Graphics::Sprite"]
+    line = find_binding_location("Bindings/obe/Graphics/Graphics.cpp", sprite)
+    with open(
+        os.path.join(
+            obengine_directory,
+            BINDINGS_SOURCES_LOCATION,
+            "Bindings",
+            "obe",
+            "Graphics",
+            "Graphics.cpp",
+        )
+    ) as source:
+        assert "bindSprite" in source.read().split("\n")[line]
+
+
+def add_sprite_move_proxy(cpp_db, target="obe::Graphics::Sprite::move"):
+    add_classes(
+        cpp_db,
+        make_class(
+            "Text",
+            "obe::Graphics",
+            bases=["obe::Transform::Movable"],
+            flags=ObidogFlagsModel(copy_parent_items=True),
+        ),
+    )
+    cpp_db.classes["obe::Graphics::Sprite"].flags = ObidogFlagsModel(
+        copy_parent_items=True
+    )
+    cpp_db.functions["obe::Graphics::moveSprite"] = make_function(
+        "moveSprite",
+        "obe::Graphics",
+        [("self", "obe::Graphics::Sprite *"), ("x", "double")],
+        flags=ObidogFlagsModel(proxy=target),
+    )
+
+
+def test_proxy_of_inherited_method_does_not_patch_base(cpp_db):
+    add_sprite_move_proxy(cpp_db)
+    base_move = cpp_db.classes["obe::Transform::Movable"].methods["move"]
+    base_parameters = base_move.parameters
+    generate_bindings(cpp_db, write_files=False)
+    sprite_methods = cpp_db.classes["obe::Graphics::Sprite"].methods
+    assert sprite_methods["move"] is not base_move
+    assert sprite_methods["move"].replacement == "obe::Graphics::moveSprite"
+    assert [parameter.type for parameter in sprite_methods["move"].parameters] == [
+        "obe::Graphics::Sprite *",
+        "double",
+    ]
+    # The base class and the other derived class still share the original method
+    assert not hasattr(base_move, "replacement")
+    assert base_move.parameters is base_parameters
+    assert cpp_db.classes["obe::Graphics::Text"].methods["move"] is base_move
+    assert sprite_methods["getPosition"] is (
+        cpp_db.classes["obe::Transform::Movable"].methods["getPosition"]
+    )
+
+
+def test_proxy_of_own_method_is_patched_in_place(cpp_db):
+    add_sprite_move_proxy(cpp_db, "obe::Transform::Movable::move")
+    base_move = cpp_db.classes["obe::Transform::Movable"].methods["move"]
+    generate_bindings(cpp_db, write_files=False)
+    assert base_move.replacement == "obe::Graphics::moveSprite"
+    assert cpp_db.classes["obe::Graphics::Text"].methods["move"] is base_move
+
+
+def test_proxy_of_unknown_function(cpp_db):
+    add_sprite_move_proxy(cpp_db, "obe::Graphics::Sprite::teleport")
+    with pytest.raises(RuntimeError, match="obe::Graphics::Sprite::teleport"):
+        generate_bindings(cpp_db, write_files=False)
+
+
+def test_find_binding_location_of_bindings_not_written(cpp_db, obengine_directory):
+    sprite = cpp_db.classes["obe::Graphics::Sprite"]
+    assert find_binding_location("Bindings/obe/Graphics/Graphics.cpp", sprite) == 1
+    graphics = cpp_db.namespaces["obe::Graphics"]
+    assert find_binding_location("Bindings/obe/Graphics/Graphics.cpp", graphics) == 1
+
+
+@pytest.fixture
+def instrumented_flavour(monkeypatch):
+    for name, value in vars(sol3_instrumented).items():
+        if name.isupper():
+            monkeypatch.setattr(flavour, name, value, raising=False)
+
+
+def test_bindings_runs_do_not_share_state(cpp_db, instrumented_flavour):
+    second_db = copy.deepcopy(cpp_db)
+    _, first_run = generate_bindings(cpp_db, write_files=False)
+    _, second_run = generate_bindings(
+        second_db, write_files=False, previous_run=first_run
+    )
+    assert second_run is not first_run
+    assert "obe::Graphics::Sprite::draw" in first_run.bindings_ids
+    assert "obe::Graphics::makeColor" in first_run.bindings_ids
+    assert second_run.bindings_ids == first_run.bindings_ids
+    assert second_run.previous_files is first_run.files
+    index = second_run.files[f"{BINDINGS_SOURCES_LOCATION}/Bindings/index.cpp"]
+    assert f"std::array<const char*, {len(second_run.bindings_ids)}>" in index
+
+
+def test_profiling_templates_have_no_surrounding_newlines():
+    for template in (
+        sol3_instrumented.PROFILING_HEADER,
+        sol3_instrumented.PROFILING_INDEX,
+    ):
+        assert template == template.strip("\n")
+    assert sol3_instrumented.PROFILING_HEADER.startswith("#pragma once")
@@ -0,0 +1,123 @@
+import copy
+
+import pytest
+
+from obidog.bindings import generator
+from obidog.bindings.classes import InheritanceGraph
+from obidog.config import SOURCE_DIRECTORIES
+from obidog.models.flags import ObidogFlagsModel
+
+from factories import add_classes, make_class, make_function
+
+
+def previous_copy_parent_bases_for_one_class(cpp_db, class_value):
+    inheritance_set = []
+    for base in class_value.bases:
+        if any(base.startswith(f"{src['namespace']}::") for src in SOURCE_DIRECTORIES):
+            inheritance_set.append(base)
+        base_name = base.split("<")[0]
+        if base_name in cpp_db.classes:
+            inheritance_set += previous_copy_parent_bases_for_one_class(
+                cpp_db, cpp_db.classes[base_name]
+            )
+    return inheritance_set
+
+
+def previous_copy_parent_bases(cpp_db, classes):
+    """copy_parent_bases before the InheritanceGraph, walks the bases of every class"""
+    for class_value in classes.values():
+        class_value.bases = list(
+            dict.fromkeys(previous_copy_parent_bases_for_one_class(cpp_db, class_value))
+        )
+
+
+def previous_copy_parent_bindings(cpp_db, classes):
+    """copy_parent_bindings before the InheritanceGraph, deep-copies the methods of the bases"""
+    for class_value in classes.values():
+        if class_value.flags.copy_parent_items:
+            for base in class_value.bases:
+                base_methods = copy.deepcopy(cpp_db.classes[base.split("<")[0]].methods)
+                base_methods.update(class_value.methods)
+                class_value.methods = base_methods
+
+
+@pytest.fixture
+def hierarchy_db(cpp_db):
+    """Chained copy_parent_items classes, an override and a class with several bases
+
+    obe::Transform::Movable <- obe::Graphics::Sprite <- obe::Graphics::Shapes::Rectangle
+    obe::Graphics::Shapes::Rectangle, obe::Transform::Movable <- obe::Graphics::Shapes::Polygon
+    obe::Transform::Movable, sf::Drawable <- obe::Graphics::Text
+    """
+    copy_parent_items = ObidogFlagsModel(copy_parent_items=True)
+    cpp_db.classes["obe::Graphics::Sprite"].flags = copy_parent_items
+    rectangle = cpp_db.classes["obe::Graphics::Shapes::Rectangle"]
+    rectangle.flags = copy.copy(copy_parent_items)
+    rectangle.methods["draw"] = make_function(
+        "draw", "obe::Graphics::Shapes", [("target", "RenderTarget &")]
+    )
+    add_classes(
+        cpp_db,
+        make_class(
+            "Polygon",
+            "obe::Graphics::Shapes",
+            {
+                "addPoint": make_function(
+                    "addPoint", "obe::Graphics::Shapes", [("x", "double")]
+                ),
+            },
+            bases=["obe::Graphics::Shapes::Rectangle", "obe::Transform::Movable"],
+            flags=copy.copy(copy_parent_items),
+        ),
+        make_class(
+            "Text", "obe::Graphics", bases=["obe::Transform::Movable", "sf::Drawable"]
+        ),
+    )
+    return cpp_db
+
+
+def test_inheritance_graph_matches_previous_implementation(hierarchy_db):
+    previous_db = copy.deepcopy(hierarchy_db)
+    previous_copy_parent_bindings(previous_db, previous_db.classes)
+    previous_copy_parent_bases(previous_db, previous_db.classes)
+
+    inheritance_graph = InheritanceGraph(hierarchy_db)
+    for class_name, previous_class in previous_db.classes.items():
+        assert inheritance_graph.get_ancestors(class_name) == previous_class.bases
+        methods = inheritance_graph.get_methods(class_name)
+        assert list(methods) == list(previous_class.methods)
+        assert methods == previous_class.methods
+
+    polygon_methods = inheritance_graph.get_methods("obe::Graphics::Shapes::Polygon")
+    # The first base defining a method wins, methods are shared with the bases
+    assert (
+        polygon_methods["draw"]
+        is hierarchy_db.classes["obe::Graphics::Shapes::Rectangle"].methods["draw"]
+    )
+    assert (
+        polygon_methods["move"]
+        is hierarchy_db.classes["obe::Transform::Movable"].methods["move"]
+    )
+
+
+def test_bindings_match_previous_implementation(hierarchy_db, monkeypatch):
+    previous_db = copy.deepcopy(hierarchy_db)
+    _, bindings_run = generator.generate_bindings(hierarchy_db, write_files=False)
+
+    monkeypatch.setattr(
+        generator,
+        "copy_parent_bindings",
+        lambda _, classes: previous_copy_parent_bindings(previous_db, classes),
+    )
+    monkeypatch.setattr(
+        generator,
+        "copy_parent_bases",
+        lambda _, classes: previous_copy_parent_bases(previous_db, classes),
+    )
+    _, previous_bindings_run = generator.generate_bindings(
+        previous_db, write_files=False
+    )
+
+    assert bindings_run.files == previous_bindings_run.files
+    shapes = bindings_run.files["src/Core/Bindings/obe/Graphics/Shapes/Shapes.cpp"]
+    assert 'bindPolygon["setSize"]' in shapes
@@ -0,0 +1,147 @@
+from collections import defaultdict
+
+import pytest
+
+from obidog.bindings import generator
+from obidog.converters.lua import namespace
+from obidog.databases import CppDatabase
+from obidog.models.namespace import NamespaceModel
+from obidog.utils.namespace_utils import NAMESPACE_ITEM_TYPES, group_items_by_namespace
+
+from factories import add_namespaces
+
+
+def previous_group_items(cpp_db, group_by_namespace):
+    for item_type in NAMESPACE_ITEM_TYPES:
+        for item_name, item_value in getattr(cpp_db, item_type).items():
+            strip_template = item_name.split("<")[0]
+            last_namespace = "::".join(strip_template.split("::")[:-1:])
+            if last_namespace in cpp_db.namespaces:
+                getattr(group_by_namespace[last_namespace], item_type)[
+                    item_name
+                ] = item_value
+
+
+def previous_documentation_grouping(cpp_db):
+    """converters.lua.namespace.group_bindings_by_namespace before group_items_by_namespace"""
+    group_by_namespace = defaultdict(NamespaceModel)
+    previous_group_items(cpp_db, group_by_namespace)
+    for namespace_name, namespace_value in group_by_namespace.items():
+        namespace_value.name = namespace_name.split("::")[-1]
+        namespace_value.path = namespace_name
+        namespace_value.namespaces = {
+            sub_namespace_name: sub_namespace
+            for sub_namespace_name, sub_namespace in group_by_namespace.items()
+            if "::".join(sub_namespace_name.split("::")[:-1:]) == namespace_value.path
+        }
+    root_namespaces = {
+        sub_namespace_name: sub_namespace
+        for sub_namespace_name, sub_namespace in group_by_namespace.items()
+        if not "::" in sub_namespace_name
+    }
+    group_by_namespace[""] = NamespaceModel(
+        name="ÖbEngine",
+        path="",
+        description="ÖbEngine documentation",
+        namespaces=root_namespaces,
+    )
+    return group_by_namespace
+
+
+def previous_bindings_grouping(cpp_db):
+    """bindings.generator.group_bindings_by_namespace before group_items_by_namespace"""
+    group_by_namespace = defaultdict(CppDatabase)
+    previous_group_items(cpp_db, group_by_namespace)
+    for namespace_name, namespace_value in group_by_namespace.items():
+        namespace_value.namespaces = cpp_db.namespaces[namespace_name]
+    return group_by_namespace
+
+
+@pytest.fixture
+def namespaces_db():
+    """Nested, templated and orphan items, child namespaces come before their parents
+
+    obe::Audio has no item but obe::Audio::Sound has some,
+    sf and obe::Unknown are not namespaces of the database
+    """
+    cpp_db = CppDatabase()
+    add_namespaces(
+        cpp_db,
+        "obe",
+        "obe::Audio",
+        "obe::Audio::Sound",
+        "obe::Graphics",
+        "obe::Graphics::Shapes",
+        "obe::Transform",
+    )
+    items = {
+        "classes": [
+            "obe::Graphics::Shapes::Rectangle",
+            "obe::Graphics::Shapes::Shape<obe::Transform::UnitVector>",
+            "obe::Audio::Sound::Sample",
+            "obe::Graphics::Sprite",
+            "sf::Color",
+        ],
+        "functions": [
+            "obe::Transform::makeVector",
+            "obe::Unknown::run",
+            "obe::makeEngine",
+            "obe::Graphics::Shapes::makeRectangle",
+        ],
+        "enums": ["obe::Graphics::BlendMode"],
+        "globals": ["obe::Transform::Zero"],
+        "typedefs": ["obe::Graphics::Shapes::Points", "obe::Audio::Sound::Buffer"],
+    }
+    for item_type, item_names in items.items():
+        setattr(cpp_db, item_type, {item_name: object() for item_name in item_names})
+    return cpp_db
+
+
+def test_group_items_by_namespace(namespaces_db):
+    namespace_tree = group_items_by_namespace(namespaces_db)
+    assert list(namespace_tree.nodes) == [
+        "obe::Graphics::Shapes",
+        "obe::Audio::Sound",
+        "obe::Graphics",
+        "obe::Transform",
+        "obe",
+    ]
+    assert list(namespace_tree.roots) == ["obe"]
+    assert list(namespace_tree.nodes["obe"].children) == [
+        "obe::Graphics",
+        "obe::Transform",
+    ]
+    assert list(namespace_tree.nodes["obe::Graphics::Shapes"].items["classes"]) == [
+        "obe::Graphics::Shapes::Rectangle",
+        "obe::Graphics::Shapes::Shape<obe::Transform::UnitVector>",
+    ]
+
+
+def test_documentation_grouping_matches_previous_implementation(namespaces_db):
+    grouping = namespace.group_bindings_by_namespace(namespaces_db)
+    previous_grouping = previous_documentation_grouping(namespaces_db)
+    assert list(grouping) == list(previous_grouping)
+    for namespace_name, namespace_value in grouping.items():
+        previous_namespace = previous_grouping[namespace_name]
+        assert namespace_value.name == previous_namespace.name
+        assert namespace_value.path == previous_namespace.path
+        for item_type in NAMESPACE_ITEM_TYPES:
+            assert list(getattr(namespace_value, item_type).items()) == list(
+                getattr(previous_namespace, item_type).items()
+            )
+        assert list(namespace_value.namespaces) == list(previous_namespace.namespaces)
+        for sub_namespace_name, sub_namespace in namespace_value.namespaces.items():
+            assert sub_namespace is grouping[sub_namespace_name]
+
+
+def test_bindings_grouping_matches_previous_implementation(namespaces_db):
+    grouping = generator.group_bindings_by_namespace(namespaces_db)
+    previous_grouping = previous_bindings_grouping(namespaces_db)
+    assert list(grouping) == list(previous_grouping)
+    for namespace_name, namespace_value in grouping.items():
+        previous_namespace = previous_grouping[namespace_name]
+        for item_type in NAMESPACE_ITEM_TYPES:
+            assert list(getattr(namespace_value, item_type).items()) == list(
+                getattr(previous_namespace, item_type).items()
+            )
+        assert namespace_value.namespaces is previous_namespace.namespaces
@@ -0,0 +1,120 @@
+import gc
+
+import pytest
+from lxml import etree
+
+from obidog.databases import CppDatabase
+from obidog.parsers import cpp_parser
+from obidog.parsers.cpp_parser import parse_doxygen_files
+
+CLASS_XML = """<?xml version="1.0"?>
+<doxygen>
+  <compounddef id="classobe_1_1Graphics_1_1Color" kind="class">
+    <compoundname>obe::Graphics::Color</compoundname>
+    <sectiondef kind="public-func">
+      <memberdef kind="function" const="yes" static="no">
+        <type>double</type>
+        <definition>double obe::Graphics::Color::toHsv</definition>
+        <name>toHsv</name>
+        <briefdescription></briefdescription>
+        <location file="{root}/include/Core/Graphics/Color.hpp" line="12" column="16"/>
+      </memberdef>
+    </sectiondef>
+    <briefdescription><para>A color</para></briefdescription>
+    <location file="{root}/include/Core/Graphics/Color.hpp" line="8" column="5"/>
+  </compounddef>
+</doxygen>
+"""
+
+NAMESPACE_XML = """<?xml version="1.0"?>
+<doxygen>
+  <compounddef id="namespaceobe_1_1Graphics" kind="namespace">
+    <compoundname>obe::Graphics</compoundname>
+    <sectiondef kind="func">
+      <memberdef kind="function" const="no" static="no">
+        <type>Color</type>
+        <definition>Color obe::Graphics::makeColor</definition>
+        <name>makeColor</name>
+        <param><type>const std::string &amp;</type><declname>value</declname></param>
+        <briefdescription></briefdescription>
+        <location file="{root}/include/Core/Graphics/Color.hpp" line="40" column="11"/>
+      </memberdef>
+    </sectiondef>
+    <sectiondef kind="enum">
+      <memberdef kind="enum">
+        <name>Color</name>
+        <enumvalue><name>Red</name><briefdescription></briefdescription></enumvalue>
+        <briefdescription></briefdescription>
+        <location file="{root}/include/Core/Graphics/Palette.hpp" line="5" column="5"/>
+      </memberdef>
+    </sectiondef>
+    <briefdescription></briefdescription>
+  </compounddef>
+</doxygen>
+"""
+
+
+@pytest.fixture
+def path_to_doc(tmp_path, obengine_directory):
+    xml_directory = tmp_path / "docbuild" / "xml"
+    xml_directory.mkdir(parents=True)
+    (xml_directory / "classobe_1_1Graphics_1_1Color.xml").write_text(
+        CLASS_XML.format(root=obengine_directory)
+    )
+    (xml_directory / "namespaceobe_1_1Graphics.xml").write_text(
+        NAMESPACE_XML.format(root=obengine_directory)
+    )
+    return str(tmp_path)
+
+
+def count_xml_objects():
+    xml_types = (etree._Document, etree._Element, etree._ElementTree)
+    return sum(1 for obj in gc.get_objects() if isinstance(obj, xml_types))
+
+
+@pytest.mark.parametrize("parse_cache", [None, {}])
+def test_xml_trees_are_freed_after_each_file(monkeypatch, path_to_doc, parse_cache):
+    xml_objects_after_file = []
+
+    def track(parse_file):
+        def parse_and_count(*args, **kwargs):
+            result = parse_file(*args, **kwargs)
+            gc.collect()
+            xml_objects_after_file.append(count_xml_objects())
+            return result
+
+        return parse_and_count
+
+    monkeypatch.setattr(
+        cpp_parser, "_parse_class_file", track(cpp_parser._parse_class_file)
+    )
+    monkeypatch.setattr(
+        cpp_parser,
+        "parse_namespace_from_xml",
+        track(cpp_parser.parse_namespace_from_xml),
+    )
+    gc.collect()
+    assert count_xml_objects() == 0
+
+    cpp_db = CppDatabase()
+    conflicts = parse_doxygen_files(path_to_doc, cpp_db, parse_cache)
+
+    assert xml_objects_after_file == [0, 0]
+    assert "obe::Graphics::Color" in cpp_db.classes
+    assert "obe::Graphics::makeColor" in cpp_db.functions
+    assert list(conflicts.get_conflicts()) == ["Color"]
+
+
+def test_conflicts_are_collected_per_run(path_to_doc):
+    first_run = parse_doxygen_files(path_to_doc, CppDatabase())
+    second_run = parse_doxygen_files(path_to_doc, CppDatabase())
+
+    assert first_run is not second_run
+    for conflicts in (first_run, second_run):
+        records = conflicts.get_conflicts()["Color"]
+        assert sorted(
+            (record.kind, record.file, record.line) for record in records
+        ) == [
+            ("class", "include/Core/Graphics/Color.hpp", 8),
+            ("enum", "include/Core/Graphics/Palette.hpp", 5),
+        ]
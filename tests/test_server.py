@@ -0,0 +1,64 @@
+import json
+
+import pytest
+
+from obidog.converters.lua.namespace import group_bindings_by_namespace
+from obidog.converters.lua.urls import get_documentation_url
+from obidog.documentation import server
+from obidog.documentation.config import DOC_PATH
+from obidog.documentation.documentation import VERSIONS_FILENAME
+from obidog.documentation.server import PRODUCTION_URL, DocumentationSite
+
+
+@pytest.fixture
+def site(cpp_db, monkeypatch):
+    monkeypatch.setattr(
+        server,
+        "render_page",
+        lambda item, output_mode: f"<html>{item.name}</html>",
+    )
+    pages = list(group_bindings_by_namespace(cpp_db).values()) + list(
+        cpp_db.classes.values()
+    )
+    return DocumentationSite(cpp_db, pages, "http://localhost:8000", "raw", 8)
+
+
+def test_resolve_class_page(site):
+    content, _, content_type = site.resolve("obe/Graphics/Sprite.html")
+    assert content == b"<html>Sprite</html>"
+    assert content_type.startswith("text/html")
+
+
+@pytest.mark.parametrize("path", ["obe/Graphics", "obe/Graphics/"])
+def test_resolve_namespace_page(site, path):
+    content, _, _ = site.resolve(path)
+    assert content == b"<html>Graphics</html>"
+
+
+def test_resolve_namespace_documentation_url(site, cpp_db):
+    url = get_documentation_url(cpp_db.namespaces["obe::Graphics::Shapes"])
+    content, _, _ = site.resolve(url[len(f"{PRODUCTION_URL}/") :])
+    assert content == b"<html>Shapes</html>"
+
+
+def test_resolve_unknown_path(site):
+    assert site.resolve("obe/Audio") is None
+    assert site.resolve("obe/Graphics/Nothing.html") is None
+
+
+def test_resolve_root(site):
+    content, _, _ = site.resolve("")
+    assert content == "<html>ÖbEngine</html>".encode("utf-8")
+
+
+def test_links_are_localized(site):
+    assert (
+        site._localize(f"{PRODUCTION_URL}/obe")
+        == f"http://localhost:8000/{DOC_PATH}/obe"
+    )
+
+
+def test_resolve_versions_file(site):
+    content, _, content_type = site.resolve(VERSIONS_FILENAME)
+    assert content_type == "application/json"
+    assert [version["path"] for version in json.loads(content)["versions"]] == ["./"]
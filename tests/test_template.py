@@ -0,0 +1,133 @@
+import logging
+
+from obidog.bindings import template
+from obidog.bindings.classes import generate_templated_method_bindings
+from obidog.bindings.template import (
+    count_template_hints,
+    generate_template_specializations,
+    iter_template_hints,
+    normalize_type,
+)
+from obidog.bindings.utils import BindingsRun
+from obidog.models.flags import ObidogFlagsModel
+from obidog.parsers.obidog_parser import TEMPLATE_HINTS_VARIABLES
+
+from factories import make_function
+
+MAPS_HINTS = [{"K": "$maps"}]
+
+
+def make_template(parameters, return_type="void", template_hints=None, **kwargs):
+    return make_function(
+        "get",
+        "obe::Script",
+        parameters,
+        return_type,
+        template=True,
+        flags=ObidogFlagsModel(template_hints=template_hints or {}),
+        **kwargs,
+    )
+
+
+def test_iter_template_hints_expands_variables():
+    hints = [{"T": "int"}, {"K": "$numerics", "V": "$primitives"}]
+    expanded = list(iter_template_hints(hints))
+    assert expanded[0] == {"T": "int"}
+    assert expanded[1:] == [
+        {"K": key, "V": value}
+        for key in TEMPLATE_HINTS_VARIABLES["numerics"]
+        for value in TEMPLATE_HINTS_VARIABLES["primitives"]
+    ]
+    assert count_template_hints(hints) == len(expanded) == 9
+
+
+def test_iter_template_hints_is_lazy():
+    # 16 ** 6 combinations, only the first ones are generated
+    hints = [{name: "$maps" for name in "ABCDEF"}]
+    assert count_template_hints(hints) == len(TEMPLATE_HINTS_VARIABLES["maps"]) ** 6
+    combinations = iter_template_hints(hints)
+    assert next(combinations) == {name: "std::map<int, int>" for name in "ABCDEF"}
+    assert next(combinations) == {
+        **{name: "std::map<int, int>" for name in "ABCDE"},
+        "F": "std::map<int, bool>",
+    }
+
+
+def test_normalize_type():
+    assert normalize_type("std::map<int,int>") == normalize_type("std::map<int, int>")
+    assert normalize_type("const  std::vector< T > &") == "const std::vector<T>&"
+    assert normalize_type("std::map<int, int>") != normalize_type("std::map<int, bool>")
+
+
+def test_specializations_with_the_same_signature_are_bound_once():
+    function = make_template([("value", "T"), ("count", "int")])
+    hints = [
+        {"T": "std::map<int,int>", "U": "int"},
+        {"T": "std::map<int, int>", "U": "double"},
+        {"T": "std::string", "U": "int"},
+    ]
+    specializations = generate_template_specializations(
+        "obe::Script::get", function, "get", hints
+    )
+    assert [
+        [parameter.type for parameter in specialization.parameters]
+        for specialization in specializations
+    ] == [["std::map<int,int>", "int"], ["std::string", "int"]]
+    assert all(not specialization.template for specialization in specializations)
+    # Parameters that do not use a template parameter are shared with the template
+    assert specializations[0].parameters[1] is function.parameters[1]
+    assert function.parameters[0].type == "T"
+
+
+def test_specializations_are_truncated_to_the_limit(monkeypatch, caplog):
+    monkeypatch.setattr(template, "TEMPLATE_SPECIALIZATIONS_LIMIT", 3)
+    function = make_template([("key", "K")])
+    with caplog.at_level(logging.WARNING):
+        specializations = generate_template_specializations(
+            "obe::Script::get", function, "getMap", MAPS_HINTS
+        )
+    assert [
+        specialization.parameters[0].type for specialization in specializations
+    ] == TEMPLATE_HINTS_VARIABLES["maps"][:3]
+    assert len(caplog.records) == 1
+    assert "more than 3 specializations" in caplog.records[0].getMessage()
+    assert "(16 template hint combinations)" in caplog.records[0].getMessage()
+
+
+def test_specializations_under_the_limit_do_not_warn(caplog):
+    function = make_template([("key", "K")])
+    with caplog.at_level(logging.WARNING):
+        specializations = generate_template_specializations(
+            "obe::Script::get", function, "getMap", MAPS_HINTS
+        )
+    assert len(specializations) == len(TEMPLATE_HINTS_VARIABLES["maps"])
+    assert not caplog.records
+
+
+def test_templated_method_with_several_hints_is_bound_as_overloads():
+    method = make_template(
+        [("key", "const std::string &")],
+        "T",
+        {"get": [{"T": "int"}, {"T": "$numerics"}]},
+    )
+    body = []
+    generate_templated_method_bindings(
+        BindingsRun(), body, "obe::Script::Table", "Table", method
+    )
+    assert body[0] == 'bindTable["get"] = '
+    assert body[1].startswith("sol::overload(")
+    assert body[1].count("&obe::Script::Table::get") == 2
+    assert "static_cast<int (obe::Script::Table::*)" in body[1]
+    assert "static_cast<double (obe::Script::Table::*)" in body[1]
+
+
+def test_templated_method_with_one_hint_is_bound_directly():
+    method = make_template(
+        [("key", "const std::string &")], "T", {"get": [{"T": "int"}]}
+    )
+    body = []
+    generate_templated_method_bindings(
+        BindingsRun(), body, "obe::Script::Table", "Table", method
+    )
+    assert not body[1].startswith("sol::overload(")
+    assert "static_cast<int (obe::Script::Table::*)" in body[1]
@@ -0,0 +1,88 @@
+import json
+import os
+
+from obidog.documentation.search import SearchRecord, make_search_index
+from obidog.documentation.versions import (
+    ContentStore,
+    make_links_relative,
+    make_links_versioned,
+    make_versions_file,
+    parse_version_spec,
+)
+
+ROOT = "https://obengine.io/doc/lua"
+
+
+def test_parse_version_spec():
+    assert parse_version_spec("v0.5.0:0.5") == ("v0.5.0", "0.5")
+    assert parse_version_spec("master") == ("master", "master")
+
+
+def test_make_links_versioned():
+    content = (
+        f'<a href="{ROOT}/obe/Graphics/Sprite.html">'
+        f'<a href="{ROOT}/obe/Graphics">'
+        f'<a href="{ROOT}">'
+        f'<a href="{ROOT}luajit">'
+    )
+    assert make_links_versioned(content, "0.5") == (
+        f'<a href="{ROOT}/0.5/obe/Graphics/Sprite.html">'
+        f'<a href="{ROOT}/0.5/obe/Graphics">'
+        f'<a href="{ROOT}/0.5">'
+        f'<a href="{ROOT}luajit">'
+    )
+
+
+def test_search_index_url_directories_are_versioned():
+    search_index = make_search_index(
+        [
+            SearchRecord("obe", "namespace", "", f"{ROOT}/"),
+            SearchRecord("Graphics", "namespace", "obe", f"{ROOT}/obe/Graphics"),
+            SearchRecord("makeColor", "function", "obe", f"{ROOT}/obe#doc_makeColor"),
+        ]
+    )
+    assert f"{ROOT}" in search_index["url_directories"]
+    versioned = json.loads(make_links_versioned(json.dumps(search_index), "0.5"))
+    assert all(
+        url_directory == f"{ROOT}/0.5" or url_directory.startswith(f"{ROOT}/0.5/")
+        for url_directory in versioned["url_directories"]
+    )
+
+
+def test_make_links_relative():
+    content = f'<a href="{ROOT}/obe/index.html"><a href="{ROOT}">'
+    assert make_links_relative(content, "index.html") == (
+        '<a href="obe/index.html"><a href="./">'
+    )
+    assert make_links_relative(content, "obe/Graphics/Sprite.html") == (
+        '<a href="../../obe/index.html"><a href="../../">'
+    )
+
+
+def test_make_versions_file():
+    assert json.loads(make_versions_file([("v0.5.0", "0.5", "../0.5/")])) == {
+        "versions": [{"name": "0.5", "ref": "v0.5.0", "path": "../0.5/"}]
+    }
+
+
+def test_content_store(tmp_path):
+    store = ContentStore(str(tmp_path))
+    page = store.put(b"<html>page</html>")
+    assert store.put(b"<html>page</html>") == page
+    static = store.put(b"static")
+    for version in ["0.4", "0.5"]:
+        manifest = {"ref": version, "commit": "", "files": {"index.html": page}}
+        store.write_manifest(version, manifest)
+        store.link_version(version, manifest)
+    with open(tmp_path / "0.5" / "index.html", "rb") as index:
+        assert index.read() == b"<html>page</html>"
+    assert os.path.samefile(
+        tmp_path / "0.4" / "index.html", tmp_path / "0.5" / "index.html"
+    )
+    store.remove_version("0.4")
+    assert set(store.load_manifests()) == {"0.5"}
+    assert not os.path.exists(tmp_path / "0.4")
+    # Only the static object is not used by a manifest anymore
+    assert store.collect_garbage() == 1
+    assert not os.path.exists(store.get_object_path(static))
+    assert os.path.exists(store.get_object_path(page))